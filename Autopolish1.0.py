@@ -16,53 +16,305 @@ import json
 import numpy as np
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox, colorchooser
+import tkinter.font as tkfont
 import os
 import sys
 import threading
 import queue
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, asdict
 from typing import List, Dict, Tuple, Optional, Any, Union, Callable
 import traceback
 import math
 import warnings
 import webbrowser
 import hashlib
-import pickle
 from pathlib import Path
 from enum import Enum, auto
 from abc import ABC, abstractmethod
 import re
-import base64
-import zlib
+import bisect
+import itertools
+import string
+import functools
+import importlib
+import importlib.util
 import struct
+import logging
+import collections
 
 # 忽略特定警告
 warnings.filterwarnings('ignore', category=UserWarning)
 
-# ==================== 3D模型处理库 ====================
+# ==================== 3D模型处理库（按需加载） ====================
+# trimesh / scipy / matplotlib 导入耗时较长，推迟到首次使用时再加载
+_LAZY = {}
+
+
+def _lazy(name, required=True):
+    """按需导入模块并缓存，导入失败返回 None（必要依赖发出 warnings 警告，可选依赖静默）"""
+    if name not in _LAZY:
+        try:
+            _LAZY[name] = importlib.import_module(name)
+        except ImportError as e:
+            if required:
+                warnings.warn(
+                    "需要安装必要的库。请运行: pip install trimesh scipy matplotlib"
+                    f"（导入错误: {e}）",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            _LAZY[name] = None
+    return _LAZY[name]
+
+
+def is_trimesh_available():
+    """trimesh 与 scipy 是否可用"""
+    return _lazy('trimesh') is not None and _lazy('scipy.spatial') is not None
+
+
+def is_matplotlib_available():
+    """matplotlib Tk 后端及 3D 投影是否可用"""
+    return (_lazy('matplotlib.figure') is not None
+            and _lazy('matplotlib.backends.backend_tkagg') is not None
+            and _lazy('mpl_toolkits.mplot3d') is not None)
+
+
+# ==================== 数值计算内核（可选Numba加速） ====================
+# 未安装 numba 时内核以普通 Python/NumPy（或其批量实现）执行，prange 退化为 range
 try:
-    import trimesh
-    from trimesh import transformations
-    from sklearn.cluster import DBSCAN, KMeans
-    from scipy.spatial import cKDTree, ConvexHull, Delaunay
-    from scipy.interpolate import splprep, splev, interp1d
-    from scipy.optimize import minimize, least_squares
-    from scipy.spatial.distance import cdist, pdist, squareform
-    from scipy.linalg import norm, svd
-    import matplotlib.pyplot as plt
-    from mpl_toolkits.mplot3d import Axes3D
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-    from matplotlib.patches import Circle, Ellipse
-
-    TRIMESH_AVAILABLE = True
-    MATPLOTLIB_AVAILABLE = True
-except ImportError as e:
-    print(f"警告: 需要安装必要的库。请运行: pip install trimesh scikit-learn scipy matplotlib")
-    print(f"导入错误: {e}")
-    TRIMESH_AVAILABLE = False
-    MATPLOTLIB_AVAILABLE = False
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+_COMPILED_KERNELS = {}
+_log = logging.getLogger(__name__)
+
+
+def _kernel(func=None, *, fallback=None, fastmath=False):
+    """内核装饰器：首次调用时若安装了 numba 则以 njit(parallel, cache) 编译
+
+    fallback 为未安装 numba（或编译失败）时使用的等价实现，通常是批量 NumPy 版本；
+    未指定时直接以 Python 执行原函数。
+    fastmath 默认关闭：它假定数据中没有 inf/NaN，只有确认输入满足这一点的内核才应传 True。
+    """
+    if func is None:
+        return functools.partial(_kernel, fallback=fallback, fastmath=fastmath)
+
+    python_impl = fallback or func
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        compiled = _COMPILED_KERNELS.get(func.__name__)
+        if compiled is None:
+            if numba is not None:
+                compiled = numba.njit(parallel=True, cache=True, fastmath=fastmath)(func)
+            else:
+                compiled = python_impl
+            _COMPILED_KERNELS[func.__name__] = compiled
+
+        if compiled is python_impl:
+            return compiled(*args)
+        try:
+            return compiled(*args)
+        except numba.core.errors.NumbaError as e:
+            # 只有 numba 类型推断/编译失败才回退到Python实现，其他异常照常抛出
+            _log.warning("Numba内核 %s 编译失败，回退到Python实现: %s", func.__name__, e)
+            _COMPILED_KERNELS[func.__name__] = python_impl
+            return python_impl(*args)
+
+    return wrapper
+
+
+def _pca_curvature_numpy(vertices, neighbor_indices, block_size=65536):
+    """邻域PCA曲率的批量 NumPy 实现：每块顶点的 (n,3,3) 协方差一次 eigvalsh 求解"""
+    count, k = neighbor_indices.shape
+    curvatures = np.zeros(count)
+    if k < 4:
+        return curvatures
+
+    # 分块处理，限制 (n,k,3) 邻域张量的内存占用
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        neighbors = vertices[neighbor_indices[start:stop, 1:]]
+        centered = neighbors - neighbors.mean(axis=1, keepdims=True)
+        covariance = np.einsum('nki,nkj->nij', centered, centered)
+        eigenvalues = np.linalg.eigvalsh(covariance)  # 升序
+
+        largest = eigenvalues[:, 2]
+        np.divide(eigenvalues[:, 0], largest, out=curvatures[start:stop], where=largest > 0)
+
+    return curvatures
+
+
+@_kernel(fallback=_pca_curvature_numpy)
+def _pca_curvature_kernel(vertices, neighbor_indices):
+    """邻域PCA曲率：最小特征值 / 最大特征值（neighbor_indices 首列为点自身）"""
+    count, k = neighbor_indices.shape
+    curvatures = np.zeros(count)
+    if k < 4:
+        return curvatures
+
+    for i in prange(count):
+        neighbors = np.empty((k - 1, 3))
+        for j in range(1, k):
+            neighbors[j - 1] = vertices[neighbor_indices[i, j]]
+
+        centered = neighbors - neighbors.sum(axis=0) / (k - 1)
+        eigenvalues = np.linalg.eigvalsh(centered.T @ centered)  # 升序
+
+        if eigenvalues[2] > 0:
+            curvatures[i] = eigenvalues[0] / eigenvalues[2]
+
+    return curvatures
+
+
+def _bounding_box_numpy(vertices):
+    """包围盒的 NumPy 实现：结果直接写入 (2, 3) 数组，第0行最小值、第1行最大值（含NaN的轴结果为NaN）"""
+    bbox = np.empty((2, 3))
+    np.minimum.reduce(vertices, axis=0, out=bbox[0])
+    np.maximum.reduce(vertices, axis=0, out=bbox[1])
+    return bbox
+
+
+@_kernel(fallback=_bounding_box_numpy)
+def _bounding_box_kernel(vertices):
+    """包围盒：单次扫描 (N, 3) 顶点，六个标量归约同时求各轴最小值和最大值"""
+    x_min = y_min = z_min = np.inf
+    x_max = y_max = z_max = -np.inf
+    x_nan = y_nan = z_nan = 0
+    for i in prange(vertices.shape[0]):
+        x, y, z = vertices[i, 0], vertices[i, 1], vertices[i, 2]
+        x_min = min(x_min, x)
+        x_max = max(x_max, x)
+        y_min = min(y_min, y)
+        y_max = max(y_max, y)
+        z_min = min(z_min, z)
+        z_max = max(z_max, z)
+        # min/max 会跳过NaN，另行计数，与 NumPy 归约一样让含NaN的轴结果为NaN
+        x_nan += x != x
+        y_nan += y != y
+        z_nan += z != z
+
+    bbox = np.array([[x_min, y_min, z_min], [x_max, y_max, z_max]])
+    if x_nan:
+        bbox[:, 0] = np.nan
+    if y_nan:
+        bbox[:, 1] = np.nan
+    if z_nan:
+        bbox[:, 2] = np.nan
+    return bbox
+
+
+def _mesh_integrals_numpy(vertices, faces):
+    """网格积分的 NumPy 实现：三角形顶点按SoA布局取出，a/b/c 均为 (3, F)，每个坐标分量是一段连续数组"""
+    coords = vertices.T
+    a, b, c = (np.ascontiguousarray(coords[:, faces[:, k]]) for k in range(3))
+
+    # 面片叉积 (b - a) × (c - a)
+    e1, e2 = b - a, c - a
+    crosses = e1[[1, 2, 0]] * e2[[2, 0, 1]] - e1[[2, 0, 1]] * e2[[1, 2, 0]]
+    area = 0.5 * np.sqrt(np.einsum('if,if->f', crosses, crosses)).sum()
+
+    # 各坐标分量的一、二、三次子表达式 (3, F)
+    aa, ab = a * a, a * b
+    f1 = a + b + c
+    f2 = aa + b * b + ab + c * f1
+    f3 = aa * a + aa * b + ab * b + b * b * b + c * f2
+    g0 = f2 + (a + f1) * a
+    g1 = f2 + (b + f1) * b
+    g2 = f2 + (c + f1) * c
+
+    # 混合项 xy / yz / zx：第i个分量与第(i+1)%3个坐标相乘
+    shift = [1, 2, 0]
+    mixed = a[shift] * g0 + b[shift] * g1 + c[shift] * g2
+
+    integrals = np.empty(11)
+    integrals[0] = area
+    integrals[1] = crosses[0] @ f1[0] / 6
+    integrals[2:5] = np.einsum('if,if->i', crosses, f2) / 24
+    integrals[5:8] = np.einsum('if,if->i', crosses, f3) / 60
+    integrals[8:11] = np.einsum('if,if->i', crosses, mixed) / 120
+    return integrals
+
+
+@_kernel(fallback=_mesh_integrals_numpy)
+def _mesh_integrals_kernel(vertices, faces):
+    """逐面片流式累加网格积分，不产生中间数组
+
+    返回 [面积, 体积, ∫x, ∫y, ∫z, ∫x², ∫y², ∫z², ∫xy, ∫yz, ∫zx]
+    """
+    area = volume = 0.0
+    first = np.zeros(3)   # 各轴一次矩
+    second = np.zeros(3)  # 各轴二次矩
+    mixed = np.zeros(3)   # xy / yz / zx 混合矩
+
+    # 顺序循环：按轴下标累加到数组不是 numba 能识别的并行归约，不能用 prange
+    for f in range(faces.shape[0]):
+        a = vertices[faces[f, 0]]
+        b = vertices[faces[f, 1]]
+        c = vertices[faces[f, 2]]
+
+        # 面片叉积 (b - a) × (c - a)，用标量元组避免每个面片分配数组
+        e1x, e1y, e1z = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+        e2x, e2y, e2z = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+        cross = (e1y * e2z - e1z * e2y,
+                 e1z * e2x - e1x * e2z,
+                 e1x * e2y - e1y * e2x)
+
+        area += np.sqrt(cross[0] * cross[0] + cross[1] * cross[1] + cross[2] * cross[2])
+        volume += cross[0] * (a[0] + b[0] + c[0])
+
+        for i in range(3):
+            p, q, r = a[i], b[i], c[i]
+            f1 = p + q + r
+            f2 = p * p + q * q + p * q + r * f1
+            f3 = p * p * p + p * p * q + p * q * q + q * q * q + r * f2
+            j = (i + 1) % 3
+
+            first[i] += cross[i] * f2
+            second[i] += cross[i] * f3
+            mixed[i] += cross[i] * (a[j] * (f2 + (p + f1) * p)
+                                    + b[j] * (f2 + (q + f1) * q)
+                                    + c[j] * (f2 + (r + f1) * r))
+
+    integrals = np.empty(11)
+    integrals[0] = area / 2
+    integrals[1] = volume / 6
+    integrals[2:5] = first / 24
+    integrals[5:8] = second / 60
+    integrals[8:11] = mixed / 120
+    return integrals
+
+
+def _mesh_mass_properties(vertices, faces):
+    """一次算出网格表面积、体积、质心和质心处惯性张量（密度取1）
+
+    体积分按散度定理逐面累加（Eberly, Polyhedral Mass Properties），
+    各量共用同一组面片叉积，结果与 trimesh 的 area / mass_properties 一致。
+    """
+    integrals = _mesh_integrals_kernel(np.ascontiguousarray(vertices, dtype=np.float64),
+                                       np.ascontiguousarray(faces, dtype=np.int64))
+    area, volume = integrals[0], integrals[1]
+    first = integrals[2:5]      # ∫x, ∫y, ∫z
+    second = integrals[5:8]     # ∫x², ∫y², ∫z²
+    products = integrals[8:11]  # ∫xy, ∫yz, ∫zx
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        center = first / volume
+
+    # 平移到质心的惯性张量
+    inertia = np.diag([second[1] + second[2], second[0] + second[2], second[0] + second[1]])
+    inertia -= volume * np.diag([center[1] ** 2 + center[2] ** 2,
+                                 center[0] ** 2 + center[2] ** 2,
+                                 center[0] ** 2 + center[1] ** 2])
+    for i, j, k in ((0, 1, 0), (1, 2, 1), (0, 2, 2)):
+        inertia[i, j] = inertia[j, i] = -(products[k] - volume * center[i] * center[j])
+
+    return float(area), float(volume), center, inertia
 
 
 # ==================== 工业级配置类 ====================
@@ -85,6 +337,8 @@ class AppConfig:
     LOG_FILE = CONFIG_DIR / "app.log"
     CONFIG_FILE = CONFIG_DIR / "config.json"
     TEMPLATE_DIR = CONFIG_DIR / "templates"
+    CACHE_DIR = CONFIG_DIR / "cache"
+    MESH_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 网格缓存总大小上限，超出后按最近使用淘汰
 
     # 支持的模型格式
     SUPPORTED_FORMATS = [
@@ -96,6 +350,14 @@ class AppConfig:
         ("所有文件", "*.*")
     ]
 
+    # 支持的扩展名集合（由 SUPPORTED_FORMATS 派生，按后缀查表，无需正则）
+    SUPPORTED_EXTENSIONS = frozenset(
+        pattern[1:].lower()
+        for _, patterns in SUPPORTED_FORMATS
+        for pattern in patterns.split(';')
+        if pattern != "*.*"
+    )
+
     # 支持的机器人型号
     SUPPORTED_ROBOTS = [
         "IRB 2600-12/1.85",
@@ -119,11 +381,18 @@ class AppConfig:
         "自定义工具"
     ]
 
+    @classmethod
+    def detect_format(cls, file_path):
+        """返回受支持的小写扩展名，不支持时返回None"""
+        suffix = Path(file_path).suffix.lower()
+        return suffix if suffix in cls.SUPPORTED_EXTENSIONS else None
+
     @classmethod
     def ensure_dirs(cls):
         """确保配置目录存在"""
         cls.CONFIG_DIR.mkdir(exist_ok=True, parents=True)
         cls.TEMPLATE_DIR.mkdir(exist_ok=True, parents=True)
+        cls.CACHE_DIR.mkdir(exist_ok=True, parents=True)
 
 
 # ==================== 专业UI配色方案 ====================
@@ -210,13 +479,23 @@ class ProfessionalColors:
         "#3498DB", "#27AE60", "#F39C12", "#E74C3C", "#566573"
     ]
 
+    # 常用半透明色（预先计算，等价于 with_alpha 的结果）
+    WHITE_10 = "#FFFFFF19"  # with_alpha("#FFFFFF", 0.1)
+    WHITE_15 = "#FFFFFF26"  # with_alpha("#FFFFFF", 0.15)
+    WHITE_80 = "#FFFFFFcc"  # with_alpha("#FFFFFF", 0.8)
+
     # 透明度
     @staticmethod
     def with_alpha(color, alpha=0.1):
         """为颜色添加透明度"""
         if isinstance(alpha, float):
             alpha = int(alpha * 255)
+        return ProfessionalColors._with_alpha_cached(color, alpha)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _with_alpha_cached(color: str, alpha: int) -> str:
+        """with_alpha 的缓存实现"""
         # 如果是十六进制颜色
         if color.startswith('#'):
             if len(color) == 7:
@@ -230,31 +509,104 @@ class ProfessionalColors:
     @staticmethod
     def get_contrast_ratio(color1, color2):
         """计算两个颜色的对比度"""
+        return float(ProfessionalColors.get_contrast_ratios([color1], [color2])[0])
 
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) == 3:
-                hex_color = ''.join([c * 2 for c in hex_color])
-            return tuple(int(hex_color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    @staticmethod
+    def get_contrast_ratios(colors1, colors2):
+        """批量计算颜色对比度（NumPy 向量化，支持广播）"""
+
+        def parse(colors):
+            hex_colors = []
+            for color in np.atleast_1d(colors):
+                hex_color = str(color).lstrip('#')
+                if len(hex_color) == 3:
+                    hex_color = ''.join([c * 2 for c in hex_color])
+                hex_colors.append(hex_color[:6])
+            return np.frombuffer(bytes.fromhex(''.join(hex_colors)), dtype=np.uint8).reshape(-1, 3) / 255.0
 
         def luminance(rgb):
-            r, g, b = rgb
-            rs = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-            gs = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-            bs = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-            return 0.2126 * rs + 0.7152 * gs + 0.0722 * bs
+            linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+            return linear @ np.array([0.2126, 0.7152, 0.0722])
 
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
-        l1 = luminance(rgb1)
-        l2 = luminance(rgb2)
+        l1 = luminance(parse(colors1))
+        l2 = luminance(parse(colors2))
 
-        lighter = max(l1, l2)
-        darker = min(l1, l2)
+        lighter = np.maximum(l1, l2)
+        darker = np.minimum(l1, l2)
 
         return (lighter + 0.05) / (darker + 0.05)
 
 
+# ==================== ttk 全局样式 ====================
+def _init_professional_ttk_styles(master):
+    """配置 ttk 样式（样式属于各自的 Tk 根窗口，每个根窗口只配置一次）"""
+    root = master._root()
+    if getattr(root, '_professional_styles_initialized', False):
+        return
+
+    style = ttk.Style(root)
+    style.theme_use('clam')
+
+    # 配置下拉框样式
+    style.configure("TCombobox",
+                    fieldbackground=ProfessionalColors.SURFACE,
+                    background=ProfessionalColors.SURFACE,
+                    foreground=ProfessionalColors.TEXT_PRIMARY,
+                    bordercolor=ProfessionalColors.BORDER,
+                    lightcolor=ProfessionalColors.BORDER_LIGHT,
+                    darkcolor=ProfessionalColors.BORDER_DARK,
+                    arrowsize=12
+                    )
+
+    style.map("TCombobox",
+              fieldbackground=[('readonly', ProfessionalColors.SURFACE)],
+              selectbackground=[('readonly', ProfessionalColors.PRIMARY)],
+              selectforeground=[('readonly', 'white')]
+              )
+
+    # 配置选项卡样式
+    style.configure("TNotebook",
+                    background=ProfessionalColors.BACKGROUND,
+                    borderwidth=0
+                    )
+    style.configure("TNotebook.Tab",
+                    background=ProfessionalColors.BACKGROUND_LIGHT,
+                    foreground=ProfessionalColors.TEXT_SECONDARY,
+                    padding=[12, 8],
+                    font=("微软雅黑", 10)
+                    )
+    style.map("TNotebook.Tab",
+              background=[("selected", ProfessionalColors.SURFACE)],
+              foreground=[("selected", ProfessionalColors.TEXT_PRIMARY)]
+              )
+
+    root._professional_styles_initialized = True
+
+
+# ==================== 只读文本框 ====================
+# 只读文本框允许的按键：光标移动与翻页
+_READONLY_TEXT_NAV_KEYS = frozenset({
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next"
+})
+
+
+def _readonly_text_key(event):
+    """屏蔽编辑按键，保留浏览、全选与复制"""
+    if event.keysym in _READONLY_TEXT_NAV_KEYS:
+        return None
+    if event.state & 0x4 and event.keysym.lower() in ("a", "c"):
+        return None
+    return "break"
+
+
+def make_text_readonly(text_widget):
+    """让 Text 保持 normal 状态但拒绝用户编辑，刷新内容时无需来回切换 state"""
+    text_widget.bind("<Key>", _readonly_text_key)
+    for sequence in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>"):
+        text_widget.bind(sequence, lambda e: "break")
+    return text_widget
+
+
 # ==================== 专业UI组件 ====================
 class ProfessionalFrame(tk.Frame):
     """专业框架组件"""
@@ -283,24 +635,13 @@ class ProfessionalCard(tk.Frame):
                  elevation=1, corner_radius=0, **kwargs):
         super().__init__(parent, **kwargs)
 
-        # 配置卡片样式
+        # 配置卡片样式（有层级时用加深的边框模拟阴影，不再额外叠加阴影 Frame）
         self.configure(
             bg=ProfessionalColors.BACKGROUND,
-            highlightbackground=ProfessionalColors.BORDER_LIGHT,
-            highlightthickness=1 if show_border else 0
+            highlightbackground=ProfessionalColors.BORDER if elevation > 0 else ProfessionalColors.BORDER_LIGHT,
+            highlightthickness=max(elevation, 1 if show_border else 0)
         )
 
-        # 创建阴影效果
-        if elevation > 0:
-            shadow_color = ProfessionalColors.with_alpha("#000000", 0.1)
-            self.shadow = tk.Frame(
-                self,
-                bg=shadow_color,
-                relief="flat"
-            )
-            self.shadow.place(x=2, y=2, relwidth=1.0, relheight=1.0)
-            self.shadow.lower()
-
         # 卡片内容容器
         self.content_frame = tk.Frame(self, bg=bg)
         self.content_frame.pack(fill="both", expand=True, padx=1, pady=1)
@@ -350,6 +691,8 @@ class ProfessionalCard(tk.Frame):
 class ProfessionalButton(tk.Frame):
     """专业按钮组件"""
 
+    _EVENT_SEQUENCES = ("<Enter>", "<Leave>", "<Button-1>", "<ButtonRelease-1>")
+
     def __init__(self, parent, text="", command=None, icon=None,
                  variant="primary", size="medium", width=None,
                  tooltip="", disabled=False, **kwargs):
@@ -412,6 +755,15 @@ class ProfessionalButton(tk.Frame):
         )
         self.text_label.pack(side="left", fill="x", expand=True)
 
+        # 缓存需要随状态变色的组件，避免事件中反复遍历子组件
+        self._bg_widgets = [self.button_frame, content_frame]
+        self._fg_labels = [self.text_label] + ([self.icon_label] if self.icon else [])
+
+        # 内部组件共享同一绑定标签，鼠标事件由 Tk 分发，点击文字/图标同样生效
+        self._group_tag = f"ProfessionalButton{id(self)}"
+        for widget in [self] + self._bg_widgets + self._fg_labels:
+            widget.bindtags(widget.bindtags() + (self._group_tag,))
+
         # 如果是禁用状态
         if disabled:
             self._set_disabled_state()
@@ -496,72 +848,59 @@ class ProfessionalButton(tk.Frame):
 
     def _set_disabled_state(self):
         """设置为禁用状态"""
+        self._apply_colors()
+
+    def _apply_colors(self):
+        """按当前颜色配置重设边框、背景和文字颜色"""
         colors = self.colors
-        self.button_frame.configure(
-            bg=colors['bg'],
-            highlightbackground=colors['border']
-        )
-        for child in self.button_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                child.configure(bg=colors['bg'])
-                for grandchild in child.winfo_children():
-                    if isinstance(grandchild, tk.Label):
-                        grandchild.configure(bg=colors['bg'], fg=colors['fg'])
+        self.button_frame.configure(highlightbackground=colors['border'])
+        self._set_state('bg')
+        for label in self._fg_labels:
+            label.configure(fg=colors['fg'])
+
+    def set_variant(self, variant):
+        """切换按钮变体（只更新颜色，不重建组件）"""
+        if variant == self.variant:
+            return
+        self.variant = variant
+        self.colors = self._get_variant_colors()
+        self._apply_colors()
+
+    def _set_state(self, color_key):
+        """按状态键统一设置背景色"""
+        color = self.colors[color_key]
+        for widget in self._bg_widgets:
+            widget.configure(bg=color)
+        for label in self._fg_labels:
+            label.configure(bg=color)
 
     def _bind_events(self):
-        """绑定事件"""
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<Button-1>", self._on_press)
-        self.bind("<ButtonRelease-1>", self._on_release)
-        self.button_frame.bind("<Enter>", self._on_enter)
-        self.button_frame.bind("<Leave>", self._on_leave)
-        self.button_frame.bind("<Button-1>", self._on_press)
-        self.button_frame.bind("<ButtonRelease-1>", self._on_release)
+        """绑定事件（按标签组绑定一次）"""
+        handlers = (self._on_enter, self._on_leave, self._on_press, self._on_release)
+        for sequence, handler in zip(self._EVENT_SEQUENCES, handlers):
+            self.bind_class(self._group_tag, sequence, handler)
+
+    def destroy(self):
+        """销毁时清理标签组绑定"""
+        for sequence in self._EVENT_SEQUENCES:
+            self.unbind_class(self._group_tag, sequence)
+        super().destroy()
 
     def _on_enter(self, event):
         """鼠标进入"""
-        colors = self.colors
-        self.button_frame.configure(bg=colors['hover'])
-        for child in self.button_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                child.configure(bg=colors['hover'])
-                for grandchild in child.winfo_children():
-                    if isinstance(grandchild, tk.Label):
-                        grandchild.configure(bg=colors['hover'])
+        self._set_state('hover')
 
     def _on_leave(self, event):
         """鼠标离开"""
-        colors = self.colors
-        self.button_frame.configure(bg=colors['bg'])
-        for child in self.button_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                child.configure(bg=colors['bg'])
-                for grandchild in child.winfo_children():
-                    if isinstance(grandchild, tk.Label):
-                        grandchild.configure(bg=colors['bg'])
+        self._set_state('bg')
 
     def _on_press(self, event):
         """鼠标按下"""
-        colors = self.colors
-        self.button_frame.configure(bg=colors['active'])
-        for child in self.button_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                child.configure(bg=colors['active'])
-                for grandchild in child.winfo_children():
-                    if isinstance(grandchild, tk.Label):
-                        grandchild.configure(bg=colors['active'])
+        self._set_state('active')
 
     def _on_release(self, event):
         """鼠标释放"""
-        colors = self.colors
-        self.button_frame.configure(bg=colors['hover'])
-        for child in self.button_frame.winfo_children():
-            if isinstance(child, tk.Frame):
-                child.configure(bg=colors['hover'])
-                for grandchild in child.winfo_children():
-                    if isinstance(grandchild, tk.Label):
-                        grandchild.configure(bg=colors['hover'])
+        self._set_state('hover')
 
         # 执行命令
         if self.command:
@@ -670,6 +1009,9 @@ class ProfessionalComboBox(tk.Frame):
         combo_frame = tk.Frame(self, bg=ProfessionalColors.BACKGROUND_LIGHT)
         combo_frame.pack(fill="x")
 
+        # 配置样式（每个根窗口只执行一次）
+        _init_professional_ttk_styles(self)
+
         # 下拉框
         self.combo = ttk.Combobox(
             combo_frame,
@@ -681,32 +1023,132 @@ class ProfessionalComboBox(tk.Frame):
         )
         self.combo.pack(fill="x", padx=padding, pady=padding)
 
-        # 配置样式
-        style = ttk.Style()
-        style.theme_use('clam')
-
-        # 配置下拉框样式
-        style.configure("TCombobox",
-                        fieldbackground=ProfessionalColors.SURFACE,
-                        background=ProfessionalColors.SURFACE,
-                        foreground=ProfessionalColors.TEXT_PRIMARY,
-                        bordercolor=ProfessionalColors.BORDER,
-                        lightcolor=ProfessionalColors.BORDER_LIGHT,
-                        darkcolor=ProfessionalColors.BORDER_DARK,
-                        arrowsize=12
-                        )
 
-        style.map("TCombobox",
-                  fieldbackground=[('readonly', ProfessionalColors.SURFACE)],
-                  selectbackground=[('readonly', ProfessionalColors.PRIMARY)],
-                  selectforeground=[('readonly', 'white')]
-                  )
+# ==================== 滚动面板鼠标滚轮 ====================
+class WheelScrollMixin:
+    """左侧滚动面板的鼠标滚轮处理（两个主应用程序类共用，要求宿主提供 self.root）"""
+
+    def _bind_wheel_scroll(self, canvas):
+        """仅当指针位于面板内时接管滚轮，滚动增量合并后统一刷新"""
+        self._scroll_canvas = canvas
+        self._wheel_delta = 0
+        self._wheel_after_id = None
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", self._on_mousewheel))
+        canvas.bind("<Leave>", self._on_scroll_area_leave)
+
+    def _on_mousewheel(self, event):
+        """累积滚轮增量，10ms 内的滚动合并为一次"""
+        self._wheel_delta -= int(event.delta / 120)
+        if self._wheel_after_id is None:
+            self._wheel_after_id = self.root.after(10, self._flush_wheel)
+
+    def _flush_wheel(self):
+        """执行合并后的滚动"""
+        delta, self._wheel_delta = self._wheel_delta, 0
+        self._wheel_after_id = None
+        if delta:
+            self._scroll_canvas.yview_scroll(delta, "units")
+
+    def _on_scroll_area_leave(self, event):
+        """指针真正离开左侧面板（而非进入其子组件）时释放滚轮绑定"""
+        canvas = self._scroll_canvas
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        # 按路径前缀加 "." 判断子组件，避免 .!canvas2 之类的兄弟组件被误判为在面板内
+        if widget is None or not (widget == canvas or str(widget).startswith(str(canvas) + ".")):
+            canvas.unbind_all("<MouseWheel>")
+
+
+# ==================== 参数输入行 ====================
+class SpinRowMixin:
+    """"标签 + 数值框 + 单位" 参数输入行（两个主应用程序类共用）"""
+
+    def _create_spin_row(self, parent, row, label, variable, low, high, step, unit, font,
+                         label_fg=ProfessionalColors.TEXT_SECONDARY, unit_padx=(4, 0),
+                         unit_before_spin=False, pady=0, **spin_options):
+        """在 parent 的第 row 行创建一行参数输入；unit_before_spin 时单位紧贴在数值框左侧"""
+        spin_column, unit_column = (2, 1) if unit_before_spin else (1, 2)
+
+        tk.Label(
+            parent,
+            text=label,
+            font=font,
+            bg=ProfessionalColors.SURFACE,
+            fg=label_fg
+        ).grid(row=row, column=0, sticky="w", pady=pady)
+
+        spin = tk.Spinbox(
+            parent,
+            from_=low,
+            to=high,
+            increment=step,
+            textvariable=variable,
+            width=8,
+            font=font,
+            **spin_options
+        )
+        spin.grid(row=row, column=spin_column, sticky="e", pady=pady)
+
+        tk.Label(
+            parent,
+            text=unit,
+            font=font,
+            bg=ProfessionalColors.SURFACE,
+            fg=ProfessionalColors.TEXT_TERTIARY
+        ).grid(row=row, column=unit_column, sticky="e" if unit_before_spin else "w",
+               padx=unit_padx, pady=pady)
+        return spin
+
+    def _create_spin_rows(self, parent, fields, row_pady=0, **row_options):
+        """按参数表 (标签, 变量属性名, 默认值, 最小值, 最大值, 步长, 单位) 逐行创建，并把变量挂到对应属性上"""
+        last_row = len(fields) - 1
+        for row, (label, var_name, value, low, high, step, unit) in enumerate(fields):
+            variable = tk.DoubleVar(value=value)
+            setattr(self, var_name, variable)
+            self._create_spin_row(parent, row, label, variable, low, high, step, unit,
+                                  pady=row_pady if row < last_row else 0, **row_options)
 
 
 # ==================== 主应用程序类（优化UI版） ====================
-class ABBPolishingStudioProfessional:
+class ABBPolishingStudioProfessional(WheelScrollMixin, SpinRowMixin):
     """ABB Polishing Studio - 专业版主应用程序"""
 
+    # 机器人型号参数表
+    ROBOT_INFO = {
+        "IRB 2600-12/1.85": "负载: 12kg | 范围: 1850mm\n精度: ±0.05mm\n应用: 中小型工件",
+        "IRB 4600-40/2.55": "负载: 40kg | 范围: 2550mm\n精度: ±0.05mm\n应用: 中型工件",
+        "IRB 6700-300/2.70": "负载: 300kg | 范围: 2700mm\n精度: ±0.06mm\n应用: 大型工件",
+        "IRB 14000-0.5/0.9": "负载: 0.5kg | 范围: 900mm\n精度: ±0.02mm\n应用: 精密抛光",
+        "IRB 1100-4/0.58": "负载: 4kg | 范围: 580mm\n精度: ±0.02mm\n应用: 紧凑空间",
+        "IRB 6700F-200/2.70": "负载: 200kg | 范围: 2700mm\n精度: ±0.06mm\n应用: 重型抛光",
+        "IRB 8700-550/3.20": "负载: 550kg | 范围: 3200mm\n精度: ±0.08mm\n应用: 超大型工件",
+        "自定义机器人": "请配置自定义参数"
+    }
+
+    # 工具参数表: (标签, 变量属性名, 默认值, 最小值, 最大值, 步长, 单位)
+    _TOOL_FIELDS = (
+        ("工具直径", "tool_diameter_var", 8.0, 2.0, 20.0, 0.5, "mm"),
+        ("工具长度", "tool_length_var", 200.0, 50.0, 500.0, 10.0, "mm"),
+    )
+
+    # RAPID 关键词
+    RAPID_KEYWORDS = frozenset([
+        'MODULE', 'PROC', 'CONST', 'VAR', 'IF', 'THEN', 'ELSE',
+        'ENDIF', 'FOR', 'TO', 'DO', 'ENDFOR', 'WHILE', 'ENDWHILE',
+        'RETURN', 'ENDPROC', 'ENDMODULE', 'MoveL', 'MoveJ', 'MoveC',
+        'TPWrite', 'WaitTime', 'SetDO', 'WaitDI', 'Stop'
+    ])
+
+    # 语法高亮: 注释/字符串/数字/关键词合并为一个正则，单遍扫描
+    _SYNTAX_RE = re.compile(
+        r'(?P<comment>!.*)'
+        r'|(?P<string>"[^"\n]*")'
+        r'|(?P<number>\b\d+(?:\.\d+)?\b)'
+        r'|(?P<keyword>\b(?:' + '|'.join(sorted(RAPID_KEYWORDS)) + r')\b)',
+        re.IGNORECASE
+    )
+    _SYNTAX_TAGS = ("comment", "string", "number", "keyword")
+    _SYNTAX_CHUNK_LINES = 200  # 视口高亮时每块扫描的行数
+
     def __init__(self):
         # 初始化配置
         AppConfig.ensure_dirs()
@@ -716,21 +1158,38 @@ class ABBPolishingStudioProfessional:
         self.config = self._load_config()
 
         # 初始化组件
-        self.colors = ProfessionalColors()  # 修复这里
-        self.math_model = PolishingMathematicalModel()
+        self.colors = ProfessionalColors  # 纯命名空间，直接引用类
+        self.math_model = PolishingMathematicalModel  # 全部为静态方法，无需实例化
         self.path_planner = None
 
         # 创建主窗口
         self.root = tk.Tk()
+        # 在创建任何组件前为本根窗口配置一次 ttk 样式
+        _init_professional_ttk_styles(self.root)
         self._setup_main_window()
 
+        # 共享字体对象，各控件复用同一 Tk 字体而不是每次解析字体元组
+        self._font_label = tkfont.Font(family="微软雅黑", size=10)
+        self._font_small = tkfont.Font(family="微软雅黑", size=9)
+        self._font_code = tkfont.Font(family="Consolas", size=11)
+        self._font_code_bold = tkfont.Font(family="Consolas", size=11, weight="bold")
+
         # 初始化处理器
         self.nx_processor = NXSTLProcessor()
         self.rapid_generator = IndustrialRAPIDGenerator(self.logger)
 
+        # 后台任务（模型加载、路径生成），结果经 root.after 回到 UI 线程
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._busy = False
+
+        # 生成代码只高亮滚动到过的区域：已处理的行块与待执行的刷新任务
+        self._highlighted_chunks = None
+        self._highlight_job = None
+        self._displayed_code = None  # 最近一次由程序写入代码框的文本，用于跳过无变化的刷新
+
         # 数据存储
         self.current_model = None
-        self.model_metadata = {}
+        self.model_metadata = ModelMetadata()
         self.features = []
         self.paths = {}
         self.generated_code = ""
@@ -859,7 +1318,7 @@ class ABBPolishingStudioProfessional:
             text=f"{AppConfig.VERSION} | 工业级机器人抛光解决方案",
             font=("微软雅黑", 10),
             bg=self.colors.PRIMARY,
-            fg=ProfessionalColors.with_alpha("#FFFFFF", 0.8)  # 半透明白色
+            fg=ProfessionalColors.WHITE_80  # 半透明白色
         )
         brand_subtitle.pack(anchor="w")
 
@@ -870,7 +1329,7 @@ class ABBPolishingStudioProfessional:
         # 模型状态指示器
         status_card = tk.Frame(
             right_frame,
-            bg=ProfessionalColors.with_alpha("#FFFFFF", 0.15),  # 半透明背景
+            bg=ProfessionalColors.WHITE_15,  # 半透明背景
             relief="flat"
         )
         status_card.pack(side="right", padx=(12, 0))
@@ -879,7 +1338,7 @@ class ABBPolishingStudioProfessional:
             status_card,
             text="○",
             font=("Segoe UI", 12),
-            bg=ProfessionalColors.with_alpha("#FFFFFF", 0.15),
+            bg=ProfessionalColors.WHITE_15,
             fg=self.colors.WARNING  # 初始为警告色（未加载）
         )
         self.model_status_icon.pack(side="left", padx=(8, 4), pady=4)
@@ -888,7 +1347,7 @@ class ABBPolishingStudioProfessional:
             status_card,
             text="未加载模型",
             font=("微软雅黑", 10),
-            bg=ProfessionalColors.with_alpha("#FFFFFF", 0.15),
+            bg=ProfessionalColors.WHITE_15,
             fg="white"
         )
         self.model_status_text.pack(side="left", padx=(0, 8), pady=4)
@@ -958,7 +1417,13 @@ class ABBPolishingStudioProfessional:
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=360)
+        # 内容框架作为画布中的单个窗口项，滚动时只移动这一项；
+        # 画布尺寸变化时只同步窗口宽度，内容尺寸变化时只更新滚动区域
+        self._scroll_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=360)
+        canvas.bind(
+            "<Configure>",
+            lambda e: canvas.itemconfigure(self._scroll_window, width=e.width)
+        )
         canvas.configure(yscrollcommand=scrollbar.set)
 
         # 布局
@@ -966,8 +1431,7 @@ class ABBPolishingStudioProfessional:
         scrollbar.pack(side="right", fill="y")
 
         # 绑定鼠标滚轮
-        canvas.bind_all("<MouseWheel>",
-                        lambda e: canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        self._bind_wheel_scroll(canvas)
 
         # 内容区域
         content_frame = ProfessionalFrame(
@@ -975,13 +1439,17 @@ class ABBPolishingStudioProfessional:
             padding=16,
             bg=self.colors.BACKGROUND_LIGHT
         )
-        content_frame.pack(fill="both", expand=True)
 
-        # 创建控制卡片
+        # 创建控制卡片：先在未布局的容器里建完整列，再一次性 pack，
+        # 几何管理器只需对整列计算一次
         self._create_control_cards(content_frame)
+        content_frame.pack(fill="both", expand=True)
 
     def _create_control_cards(self, parent):
-        """创建控制卡片"""
+        """创建控制卡片（每张卡片先填充内容再放入网格，避免逐个子组件触发重排）"""
+        # 卡片纵向排成单列网格
+        parent.columnconfigure(0, weight=1)
+
         # 1. 文件处理卡片
         file_card = ProfessionalCard(
             parent,
@@ -989,8 +1457,8 @@ class ABBPolishingStudioProfessional:
             subtitle="导入与分析",
             padding=12
         )
-        file_card.pack(fill="x", pady=(0, 16))
         self._create_file_card_content(file_card.body_frame)
+        file_card.grid(row=0, column=0, sticky="ew", pady=(0, 16))
 
         # 2. 机器人配置卡片
         robot_card = ProfessionalCard(
@@ -999,8 +1467,8 @@ class ABBPolishingStudioProfessional:
             subtitle="运动参数",
             padding=12
         )
-        robot_card.pack(fill="x", pady=(0, 16))
         self._create_robot_card_content(robot_card.body_frame)
+        robot_card.grid(row=1, column=0, sticky="ew", pady=(0, 16))
 
         # 3. 工具配置卡片
         tool_card = ProfessionalCard(
@@ -1009,8 +1477,8 @@ class ABBPolishingStudioProfessional:
             subtitle="抛光参数",
             padding=12
         )
-        tool_card.pack(fill="x", pady=(0, 16))
         self._create_tool_card_content(tool_card.body_frame)
+        tool_card.grid(row=2, column=0, sticky="ew", pady=(0, 16))
 
         # 4. 路径规划卡片
         path_card = ProfessionalCard(
@@ -1019,8 +1487,8 @@ class ABBPolishingStudioProfessional:
             subtitle="智能生成",
             padding=12
         )
-        path_card.pack(fill="x", pady=(0, 16))
         self._create_path_card_content(path_card.body_frame)
+        path_card.grid(row=3, column=0, sticky="ew", pady=(0, 16))
 
         # 5. 代码生成卡片
         code_card = ProfessionalCard(
@@ -1029,8 +1497,19 @@ class ABBPolishingStudioProfessional:
             subtitle="RAPID程序",
             padding=12
         )
-        code_card.pack(fill="x")
         self._create_code_card_content(code_card.body_frame)
+        code_card.grid(row=4, column=0, sticky="ew")
+
+    def _create_label(self, parent, text, fg=ProfessionalColors.TEXT_SECONDARY, **kwargs):
+        """创建卡片内的说明标签"""
+        return tk.Label(
+            parent,
+            text=text,
+            font=self._font_label,
+            bg=ProfessionalColors.SURFACE,
+            fg=fg,
+            **kwargs
+        )
 
     def _create_file_card_content(self, parent):
         """创建文件卡片内容"""
@@ -1069,7 +1548,7 @@ class ABBPolishingStudioProfessional:
             options_frame,
             text="启用NX特殊处理",
             variable=self.nx_processing_var,
-            font=("微软雅黑", 10),
+            font=self._font_label,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_PRIMARY,
             selectcolor=ProfessionalColors.SURFACE,
@@ -1092,19 +1571,19 @@ class ABBPolishingStudioProfessional:
         info_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE_DARK)
         info_frame.pack(fill="x")
 
-        self.model_info_text = tk.Text(
+        # 只读信息用 Label + StringVar，刷新只需一次 set
+        self.model_info_var = tk.StringVar(value="等待加载模型...")
+        self.model_info_label = tk.Label(
             info_frame,
-            height=8,
+            textvariable=self.model_info_var,
             font=("Consolas", 9),
             bg=ProfessionalColors.SURFACE_DARK,
             fg=ProfessionalColors.TEXT_SECONDARY,
-            relief="flat",
-            borderwidth=0,
-            wrap="word"
+            justify="left",
+            anchor="nw",
+            wraplength=260
         )
-        self.model_info_text.pack(fill="both", padx=1, pady=1)
-        self.model_info_text.insert("1.0", "等待加载模型...")
-        self.model_info_text.configure(state="disabled")
+        self.model_info_label.pack(fill="both", padx=1, pady=1)
 
     def _create_robot_card_content(self, parent):
         """创建机器人卡片内容"""
@@ -1112,13 +1591,7 @@ class ABBPolishingStudioProfessional:
         model_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         model_frame.pack(fill="x", pady=(0, 12))
 
-        tk.Label(
-            model_frame,
-            text="机器人型号",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).pack(side="left")
+        self._create_label(model_frame, "机器人型号").pack(side="left")
 
         self.robot_model_var = tk.StringVar(value=AppConfig.SUPPORTED_ROBOTS[0])
         robot_combo = ProfessionalComboBox(
@@ -1135,33 +1608,27 @@ class ABBPolishingStudioProfessional:
         info_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         info_frame.pack(fill="x")
 
-        self.robot_info_text = tk.Text(
+        self.robot_info_var = tk.StringVar(value=self._get_robot_info())
+        self.robot_info_label = tk.Label(
             info_frame,
-            height=6,
-            font=("微软雅黑", 9),
+            textvariable=self.robot_info_var,
+            font=self._font_small,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_TERTIARY,
-            relief="flat",
-            borderwidth=0,
-            wrap="word"
+            justify="left",
+            anchor="nw",
+            wraplength=260
+        )
+        self.robot_info_label.pack(fill="both")
+
+        # 切换型号时同步参数信息
+        self.robot_model_var.trace_add(
+            "write", lambda *_: self.robot_info_var.set(self._get_robot_info())
         )
-        self.robot_info_text.pack(fill="both")
-        self.robot_info_text.insert("1.0", self._get_robot_info())
-        self.robot_info_text.configure(state="disabled")
 
     def _get_robot_info(self):
         """获取机器人信息"""
-        robot_info = {
-            "IRB 2600-12/1.85": "负载: 12kg | 范围: 1850mm\n精度: ±0.05mm\n应用: 中小型工件",
-            "IRB 4600-40/2.55": "负载: 40kg | 范围: 2550mm\n精度: ±0.05mm\n应用: 中型工件",
-            "IRB 6700-300/2.70": "负载: 300kg | 范围: 2700mm\n精度: ±0.06mm\n应用: 大型工件",
-            "IRB 14000-0.5/0.9": "负载: 0.5kg | 范围: 900mm\n精度: ±0.02mm\n应用: 精密抛光",
-            "IRB 1100-4/0.58": "负载: 4kg | 范围: 580mm\n精度: ±0.02mm\n应用: 紧凑空间",
-            "IRB 6700F-200/2.70": "负载: 200kg | 范围: 2700mm\n精度: ±0.06mm\n应用: 重型抛光",
-            "IRB 8700-550/3.20": "负载: 550kg | 范围: 3200mm\n精度: ±0.08mm\n应用: 超大型工件",
-            "自定义机器人": "请配置自定义参数"
-        }
-        return robot_info.get(self.robot_model_var.get(), "选择机器人型号查看参数")
+        return self.ROBOT_INFO.get(self.robot_model_var.get(), "选择机器人型号查看参数")
 
     def _create_tool_card_content(self, parent):
         """创建工具卡片内容"""
@@ -1169,13 +1636,7 @@ class ABBPolishingStudioProfessional:
         type_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         type_frame.pack(fill="x", pady=(0, 12))
 
-        tk.Label(
-            type_frame,
-            text="工具类型",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).pack(side="left")
+        self._create_label(type_frame, "工具类型").pack(side="left")
 
         self.tool_type_var = tk.StringVar(value=AppConfig.SUPPORTED_TOOLS[0])
         tool_combo = ProfessionalComboBox(
@@ -1188,75 +1649,20 @@ class ABBPolishingStudioProfessional:
         )
         tool_combo.pack(side="right")
 
-        # 工具参数
+        # 工具参数（按 _TOOL_FIELDS 表逐行生成）
         params_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         params_frame.pack(fill="x", pady=(0, 8))
-
-        # 工具直径
-        tk.Label(
-            params_frame,
-            text="工具直径",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).grid(row=0, column=0, sticky="w", pady=(0, 8))
-
-        self.tool_diameter_var = tk.DoubleVar(value=8.0)
-        diameter_spin = tk.Spinbox(
-            params_frame,
-            from_=2.0,
-            to=20.0,
-            increment=0.5,
-            textvariable=self.tool_diameter_var,
-            width=8,
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_PRIMARY,
-            relief="solid",
-            borderwidth=1,
-            buttonbackground=ProfessionalColors.BACKGROUND_LIGHT
-        )
-        diameter_spin.grid(row=0, column=1, sticky="e", pady=(0, 8))
-        tk.Label(
-            params_frame,
-            text="mm",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_TERTIARY
-        ).grid(row=0, column=2, sticky="w", padx=(4, 0), pady=(0, 8))
-
-        # 工具长度
-        tk.Label(
+        self._create_spin_rows(
             params_frame,
-            text="工具长度",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).grid(row=1, column=0, sticky="w")
-
-        self.tool_length_var = tk.DoubleVar(value=200.0)
-        length_spin = tk.Spinbox(
-            params_frame,
-            from_=50.0,
-            to=500.0,
-            increment=10.0,
-            textvariable=self.tool_length_var,
-            width=8,
-            font=("微软雅黑", 10),
+            self._TOOL_FIELDS,
+            row_pady=(0, 8),
+            font=self._font_label,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_PRIMARY,
             relief="solid",
             borderwidth=1,
             buttonbackground=ProfessionalColors.BACKGROUND_LIGHT
         )
-        length_spin.grid(row=1, column=1, sticky="e")
-        tk.Label(
-            params_frame,
-            text="mm",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_TERTIARY
-        ).grid(row=1, column=2, sticky="w", padx=(4, 0))
 
     def _create_path_card_content(self, parent):
         """创建路径卡片内容"""
@@ -1269,8 +1675,8 @@ class ABBPolishingStudioProfessional:
         adaptive_btn = ProfessionalButton(
             type_frame,
             text="自适应",
-            command=lambda: self.path_type_var.set("adaptive"),
-            variant="ghost" if self.path_type_var.get() != "adaptive" else "secondary",
+            command=lambda: self._set_path_type("adaptive"),
+            variant="ghost",
             size="small"
         )
         adaptive_btn.pack(side="left", padx=(0, 8))
@@ -1278,23 +1684,21 @@ class ABBPolishingStudioProfessional:
         parallel_btn = ProfessionalButton(
             type_frame,
             text="平行线",
-            command=lambda: self.path_type_var.set("parallel"),
-            variant="ghost" if self.path_type_var.get() != "parallel" else "secondary",
+            command=lambda: self._set_path_type("parallel"),
+            variant="ghost",
             size="small"
         )
         parallel_btn.pack(side="left")
 
+        # 两个按钮常驻，切换类型时只改变选中按钮的配色
+        self._path_type_buttons = {"adaptive": adaptive_btn, "parallel": parallel_btn}
+        self._set_path_type(self.path_type_var.get())
+
         # 路径参数
         param_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         param_frame.pack(fill="x", pady=(0, 12))
 
-        tk.Label(
-            param_frame,
-            text="步距比例",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).pack(side="left")
+        self._create_label(param_frame, "步距比例").pack(side="left")
 
         self.stepover_var = tk.DoubleVar(value=0.5)
         stepover_scale = tk.Scale(
@@ -1302,7 +1706,6 @@ class ABBPolishingStudioProfessional:
             from_=0.1,
             to=0.8,
             resolution=0.05,
-            variable=self.stepover_var,
             orient="horizontal",
             length=180,
             bg=ProfessionalColors.SURFACE,
@@ -1312,8 +1715,29 @@ class ABBPolishingStudioProfessional:
             sliderrelief="flat",
             sliderlength=20
         )
+        stepover_scale.set(self.stepover_var.get())
         stepover_scale.pack(side="right")
 
+        # 拖动过程中不写变量，松开鼠标或按键后才同步，避免连续触发变量更新
+        syncing = False
+
+        def sync_stepover(event):
+            nonlocal syncing
+            syncing = True
+            try:
+                self.stepover_var.set(stepover_scale.get())
+            finally:
+                syncing = False
+
+        # 代码中修改变量时反向更新滑块；由滑块同步触发的写入不再回写
+        def on_stepover_var_write(*args):
+            if not syncing:
+                stepover_scale.set(self.stepover_var.get())
+
+        stepover_scale.bind("<ButtonRelease-1>", sync_stepover)
+        stepover_scale.bind("<KeyRelease>", sync_stepover)
+        self.stepover_var.trace_add("write", on_stepover_var_write)
+
         # 生成按钮
         generate_btn = ProfessionalButton(
             parent,
@@ -1328,19 +1752,24 @@ class ABBPolishingStudioProfessional:
         info_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         info_frame.pack(fill="x")
 
-        self.path_info_text = tk.Text(
+        self.path_info_var = tk.StringVar(value="等待生成路径...")
+        self.path_info_label = tk.Label(
             info_frame,
-            height=6,
-            font=("微软雅黑", 9),
+            textvariable=self.path_info_var,
+            font=self._font_small,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_TERTIARY,
-            relief="flat",
-            borderwidth=0,
-            wrap="word"
+            justify="left",
+            anchor="nw",
+            wraplength=260
         )
-        self.path_info_text.pack(fill="both")
-        self.path_info_text.insert("1.0", "等待生成路径...")
-        self.path_info_text.configure(state="disabled")
+        self.path_info_label.pack(fill="both")
+
+    def _set_path_type(self, kind):
+        """设置路径类型并更新按钮选中状态"""
+        self.path_type_var.set(kind)
+        for name, btn in self._path_type_buttons.items():
+            btn.set_variant("secondary" if name == kind else "ghost")
 
     def _create_code_card_content(self, parent):
         """创建代码卡片内容"""
@@ -1348,13 +1777,7 @@ class ABBPolishingStudioProfessional:
         name_frame = tk.Frame(parent, bg=ProfessionalColors.SURFACE)
         name_frame.pack(fill="x", pady=(0, 12))
 
-        tk.Label(
-            name_frame,
-            text="程序名称",
-            font=("微软雅黑", 10),
-            bg=ProfessionalColors.SURFACE,
-            fg=ProfessionalColors.TEXT_SECONDARY
-        ).pack(side="left")
+        self._create_label(name_frame, "程序名称").pack(side="left")
 
         self.program_name_var = tk.StringVar(value="Polishing_Program")
         name_entry = ProfessionalEntry(
@@ -1375,7 +1798,7 @@ class ABBPolishingStudioProfessional:
             options_frame,
             text="IO控制",
             variable=self.include_io_var,
-            font=("微软雅黑", 10),
+            font=self._font_label,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_PRIMARY,
             selectcolor=ProfessionalColors.SURFACE,
@@ -1389,7 +1812,7 @@ class ABBPolishingStudioProfessional:
             options_frame,
             text="安全检查",
             variable=self.include_safety_var,
-            font=("微软雅黑", 10),
+            font=self._font_label,
             bg=ProfessionalColors.SURFACE,
             fg=ProfessionalColors.TEXT_PRIMARY,
             selectcolor=ProfessionalColors.SURFACE,
@@ -1440,37 +1863,42 @@ class ABBPolishingStudioProfessional:
         self.tab_control = ttk.Notebook(tab_container)
         self.tab_control.pack(fill="both", expand=True)
 
-        # 配置选项卡样式
-        style = ttk.Style()
-        style.theme_use('clam')
-
-        style.configure("TNotebook",
-                        background=ProfessionalColors.BACKGROUND,
-                        borderwidth=0
-                        )
-        style.configure("TNotebook.Tab",
-                        background=ProfessionalColors.BACKGROUND_LIGHT,
-                        foreground=ProfessionalColors.TEXT_SECONDARY,
-                        padding=[12, 8],
-                        font=("微软雅黑", 10)
-                        )
-        style.map("TNotebook.Tab",
-                  background=[("selected", ProfessionalColors.SURFACE)],
-                  foreground=[("selected", ProfessionalColors.TEXT_PRIMARY)]
-                  )
+        # 创建各个选项卡（先放空框架，内容在首次切换到该页时再构建）
+        self.tab_3d = tk.Frame(self.tab_control, bg=ProfessionalColors.CODE_BACKGROUND)
+        self.tab_code = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
+        self.tab_model = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
+        self.tab_path = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
 
-        # 创建各个选项卡
-        self._create_tab_3d_preview()
-        self._create_tab_code_preview()
-        self._create_tab_model_info()
-        self._create_tab_path_preview()
+        self._tab_builders = {}
+        self._tab_built = set()
+        for tab, text, builder in (
+            (self.tab_3d, "3D预览", self._create_tab_3d_preview),
+            (self.tab_code, "代码预览", self._create_tab_code_preview),
+            (self.tab_model, "模型信息", self._create_tab_model_info),
+            (self.tab_path, "路径预览", self._create_tab_path_preview),
+        ):
+            self.tab_control.add(tab, text=text)
+            self._tab_builders[str(tab)] = builder
+
+        self.tab_control.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # 默认页在窗口首次绘制后再构建，避免 matplotlib 初始化拖慢启动
+        self.root.after_idle(self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """选项卡切换时按需构建内容"""
+        self._ensure_tab_built(self.tab_control.select())
+
+    def _ensure_tab_built(self, tab):
+        """确保选项卡内容已构建"""
+        key = str(tab)
+        if key in self._tab_built or key not in self._tab_builders:
+            return
+        self._tab_built.add(key)
+        self._tab_builders[key]()
 
     def _create_tab_3d_preview(self):
         """创建3D预览选项卡"""
-        self.tab_3d = tk.Frame(self.tab_control, bg=ProfessionalColors.CODE_BACKGROUND)
-        self.tab_control.add(self.tab_3d, text="3D预览")
-
-        if not MATPLOTLIB_AVAILABLE:
+        if not is_matplotlib_available():
             no_lib_label = tk.Label(
                 self.tab_3d,
                 text="需要安装matplotlib库以显示3D预览",
@@ -1483,7 +1911,7 @@ class ABBPolishingStudioProfessional:
 
         try:
             # 创建3D图形
-            self.figure_3d = plt.Figure(figsize=(8, 6), dpi=100,
+            self.figure_3d = _lazy('matplotlib.figure').Figure(figsize=(8, 6), dpi=100,
                                         facecolor=ProfessionalColors.CODE_BACKGROUND)
             self.ax_3d = self.figure_3d.add_subplot(111, projection='3d')
 
@@ -1491,7 +1919,7 @@ class ABBPolishingStudioProfessional:
             self.ax_3d.set_facecolor(ProfessionalColors.CODE_BACKGROUND)
 
             # 创建画布
-            self.canvas_3d = FigureCanvasTkAgg(self.figure_3d, self.tab_3d)
+            self.canvas_3d = _lazy('matplotlib.backends.backend_tkagg').FigureCanvasTkAgg(self.figure_3d, self.tab_3d)
             self.canvas_3d.get_tk_widget().pack(fill="both", expand=True, padx=1, pady=1)
 
             # 初始设置
@@ -1506,7 +1934,7 @@ class ABBPolishingStudioProfessional:
             self.ax_3d.tick_params(axis='z', colors=ProfessionalColors.CODE_TEXT)
 
             # 设置网格
-            self.ax_3d.grid(True, color=ProfessionalColors.with_alpha("#FFFFFF", 0.1))
+            self.ax_3d.grid(True, color=ProfessionalColors.WHITE_10)
 
             # 绘制初始图形
             self.canvas_3d.draw()
@@ -1525,9 +1953,6 @@ class ABBPolishingStudioProfessional:
 
     def _create_tab_code_preview(self):
         """创建代码预览选项卡"""
-        self.tab_code = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
-        self.tab_control.add(self.tab_code, text="代码预览")
-
         # 工具栏
         toolbar = tk.Frame(self.tab_code, bg=ProfessionalColors.SURFACE, height=48)
         toolbar.pack(fill="x", padx=16, pady=(16, 0))
@@ -1570,7 +1995,7 @@ class ABBPolishingStudioProfessional:
         # 创建代码文本框
         self.code_text = scrolledtext.ScrolledText(
             code_frame,
-            font=("Consolas", 11),
+            font=self._font_code,
             bg=ProfessionalColors.CODE_BACKGROUND,
             fg=ProfessionalColors.CODE_TEXT,
             relief="flat",
@@ -1581,26 +2006,27 @@ class ABBPolishingStudioProfessional:
         )
         self.code_text.pack(fill="both", expand=True)
 
-        # 设置初始代码
-        sample_code = self._get_sample_rapid_code()
-        self.code_text.insert("1.0", sample_code)
+        # 任何滚动（滚轮、拖动滚动条、键盘、see）和尺寸变化后补做可见区域的高亮
+        scrollbar_set = self.code_text.vbar.set
+
+        def on_yscroll(first, last):
+            scrollbar_set(first, last)
+            self._schedule_visible_highlighting()
 
-        # 配置语法高亮（简化版）
+        self.code_text.configure(yscrollcommand=on_yscroll)
+        self.code_text.bind("<Configure>", lambda e: self._schedule_visible_highlighting(), add="+")
+
+        # 配置语法高亮，示例代码直接复用预先算好的标记区间
         self._configure_code_syntax()
+        self._show_code(self._get_sample_rapid_code(), self._sample_syntax_ranges())
 
     def _configure_code_syntax(self):
         """配置代码语法高亮"""
-        # 关键词列表
-        keywords = ['MODULE', 'PROC', 'CONST', 'VAR', 'IF', 'THEN', 'ELSE',
-                    'ENDIF', 'FOR', 'TO', 'DO', 'ENDFOR', 'WHILE', 'ENDWHILE',
-                    'RETURN', 'ENDPROC', 'ENDMODULE', 'MoveL', 'MoveJ', 'MoveC',
-                    'TPWrite', 'WaitTime', 'SetDO', 'WaitDI', 'Stop']
-
         # 注释颜色
         self.code_text.tag_config("comment", foreground=ProfessionalColors.CODE_COMMENT)
 
         # 关键词颜色
-        self.code_text.tag_config("keyword", foreground=ProfessionalColors.CODE_KEYWORD, font=("Consolas", 11, "bold"))
+        self.code_text.tag_config("keyword", foreground=ProfessionalColors.CODE_KEYWORD, font=self._font_code_bold)
 
         # 字符串颜色
         self.code_text.tag_config("string", foreground=ProfessionalColors.CODE_STRING)
@@ -1610,9 +2036,6 @@ class ABBPolishingStudioProfessional:
 
     def _create_tab_model_info(self):
         """创建模型信息选项卡"""
-        self.tab_model = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
-        self.tab_control.add(self.tab_model, text="模型信息")
-
         # 信息显示区域
         info_frame = tk.Frame(self.tab_model, bg=ProfessionalColors.BACKGROUND)
         info_frame.pack(fill="both", expand=True, padx=16, pady=16)
@@ -1639,13 +2062,10 @@ class ABBPolishingStudioProfessional:
                                       "• 数学建模参数\n"
                                       "• 处理状态和日志\n"
                                       )
-        self.model_detail_text.configure(state="disabled")
+        make_text_readonly(self.model_detail_text)
 
     def _create_tab_path_preview(self):
         """创建路径预览选项卡"""
-        self.tab_path = tk.Frame(self.tab_control, bg=ProfessionalColors.BACKGROUND)
-        self.tab_control.add(self.tab_path, text="路径预览")
-
         # 路径信息区域
         path_frame = tk.Frame(self.tab_path, bg=ProfessionalColors.BACKGROUND)
         path_frame.pack(fill="both", expand=True, padx=16, pady=16)
@@ -1672,7 +2092,7 @@ class ABBPolishingStudioProfessional:
                                      "• 碰撞检测结果\n"
                                      "• 优化建议\n"
                                      )
-        self.path_detail_text.configure(state="disabled")
+        make_text_readonly(self.path_detail_text)
 
     def _create_status_bar(self):
         """创建状态栏"""
@@ -1713,9 +2133,10 @@ class ABBPolishingStudioProfessional:
         info_frame.pack(side="right", padx=16)
 
         # 时间显示
+        self._time_var = tk.StringVar()
         self.time_label = tk.Label(
             info_frame,
-            text=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            textvariable=self._time_var,
             font=("微软雅黑", 8),
             bg=ProfessionalColors.SURFACE_DARK,
             fg=ProfessionalColors.TEXT_LIGHT
@@ -1726,10 +2147,13 @@ class ABBPolishingStudioProfessional:
         self._update_time()
 
     def _update_time(self):
-        """更新时间显示"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self._update_time)
+        """更新时间显示（分钟精度，对齐到下一整分钟再唤醒）"""
+        now = datetime.now()
+        current_time = now.strftime("%Y-%m-%d %H:%M")
+        if current_time != self._time_var.get():
+            self._time_var.set(current_time)
+        delay_ms = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.root.after(max(delay_ms, 1000), self._update_time)
 
     def _bind_events(self):
         """绑定事件"""
@@ -1741,7 +2165,8 @@ class ABBPolishingStudioProfessional:
         self.root.bind("<Control-g>", lambda e: self.generate_code())
         self.root.bind("<F1>", lambda e: self.show_help())
 
-    def _get_sample_rapid_code(self):
+    @staticmethod
+    def _get_sample_rapid_code():
         """获取示例RAPID代码"""
         return """MODULE Polishing_Program
 ! ========================================================
@@ -1803,39 +2228,74 @@ ENDMODULE"""
         if file_path:
             self.file_path_var.set(file_path)
 
-    def load_model(self):
+    def _run_in_background(self, func, on_success, on_error, *args, **kwargs):
+        """在后台线程执行耗时任务，完成后在 UI 线程回调"""
+        self._set_busy(True)
+        future = self._executor.submit(func, *args, **kwargs)
+        self._poll_future(future, on_success, on_error)
+
+    def _poll_future(self, future, on_success, on_error):
+        """轮询后台任务状态"""
+        if not future.done():
+            self.root.after(50, self._poll_future, future, on_success, on_error)
+            return
+
+        self._set_busy(False)
+        error = future.exception()
+        if error is not None:
+            on_error(error)
+        else:
+            on_success(future.result())
+
+    def _set_busy(self, busy):
+        """切换忙碌状态，期间进度条以不确定模式滚动"""
+        self._busy = busy
+        if busy:
+            self.progress_bar.configure(mode='indeterminate')
+            self.progress_bar.start(15)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode='determinate')
+
+    def load_model(self, on_done=None):
         """加载模型"""
         file_path = self.file_path_var.get()
         if not file_path:
             messagebox.showwarning("警告", "请先选择STL文件")
             return
+        if self._busy:
+            return
 
         # 更新状态
         self.status_label.config(text="正在加载模型...")
-        self.progress_var.set(30)
-        self.root.update()
 
-        try:
-            # 加载模型逻辑
-            # 这里调用之前定义的加载函数
-            self.current_model = self.nx_processor.load_stl_with_metadata(
-                file_path,
-                force_nx_processing=self.nx_processing_var.get()
-            )
+        # 在后台线程解析STL，避免界面卡顿
+        self._run_in_background(
+            self.nx_processor.load_stl_with_metadata,
+            lambda model: self._on_model_loaded(file_path, model, on_done),
+            self._on_model_load_failed,
+            file_path,
+            force_nx_processing=self.nx_processing_var.get()
+        )
 
+    def _on_model_loaded(self, file_path, model, on_done=None):
+        """模型加载完成回调"""
+        self.current_model = model
+        try:
             if self.current_model:
-                self.model_metadata = self.current_model.metadata
+                self.model_metadata = ModelMetadata.from_mapping(self.current_model.metadata)
 
                 # 更新UI
-                info_text = f"✅ 模型加载成功!\n\n"
-                info_text += f"文件: {os.path.basename(file_path)}\n"
-                info_text += f"顶点数: {len(self.current_model.vertices):,}\n"
-                info_text += f"面片数: {len(self.current_model.faces):,}\n"
+                vertex_count = len(self.current_model.vertices)
+                face_count = len(self.current_model.faces)
+                info_text = (
+                    f"✅ 模型加载成功!\n\n"
+                    f"文件: {os.path.basename(file_path)}\n"
+                    f"顶点数: {vertex_count:,}\n"
+                    f"面片数: {face_count:,}\n"
+                )
 
-                self.model_info_text.configure(state="normal")
-                self.model_info_text.delete("1.0", tk.END)
-                self.model_info_text.insert("1.0", info_text)
-                self.model_info_text.configure(state="disabled")
+                self.model_info_var.set(info_text)
 
                 # 更新模型状态
                 self.model_status_icon.config(text="●", fg=self.colors.SUCCESS)
@@ -1849,40 +2309,51 @@ ENDMODULE"""
                 raise Exception("模型加载失败")
 
         except Exception as e:
-            messagebox.showerror("错误", f"加载模型失败:\n{str(e)}")
-            self.status_label.config(text="加载失败")
-            self.progress_var.set(0)
+            self._on_model_load_failed(e)
+            return
 
-    def generate_paths(self):
+        if on_done:
+            on_done()
+
+    def _on_model_load_failed(self, error):
+        """模型加载失败回调"""
+        messagebox.showerror("错误", f"加载模型失败:\n{str(error)}")
+        self.status_label.config(text="加载失败")
+        self.progress_var.set(0)
+
+    def generate_paths(self, on_done=None):
         """生成抛光路径"""
         if not self.current_model:
             messagebox.showwarning("警告", "请先加载模型")
             return
+        if self._busy:
+            return
 
         # 更新状态
         self.status_label.config(text="正在生成路径...")
-        self.progress_var.set(30)
-        self.root.update()
 
-        try:
-            # 路径生成逻辑
-            # 这里调用之前定义的路径生成函数
+        # 路径生成在后台线程执行
+        self._run_in_background(
+            self._generate_simulated_paths,
+            lambda paths: self._on_paths_generated(paths, on_done),
+            self._on_path_generation_failed
+        )
 
-            # 模拟路径数据
-            simulated_paths = self._generate_simulated_paths()
+    def _on_paths_generated(self, simulated_paths, on_done=None):
+        """路径生成完成回调"""
+        try:
             self.paths = simulated_paths
 
             # 更新UI
-            info_text = f"✅ 路径生成完成!\n\n"
-            info_text += f"类型: {self.path_type_var.get()}\n"
-            info_text += f"粗抛路径: {len(simulated_paths.get('rough', []))} 条\n"
-            info_text += f"精抛路径: {len(simulated_paths.get('fine', []))} 条\n"
-            info_text += f"总点数: {self._count_total_points(simulated_paths)}\n"
+            info_text = (
+                f"✅ 路径生成完成!\n\n"
+                f"类型: {self.path_type_var.get()}\n"
+                f"粗抛路径: {len(simulated_paths.get('rough', []))} 条\n"
+                f"精抛路径: {len(simulated_paths.get('fine', []))} 条\n"
+                f"总点数: {self._count_total_points(simulated_paths)}\n"
+            )
 
-            self.path_info_text.configure(state="normal")
-            self.path_info_text.delete("1.0", tk.END)
-            self.path_info_text.insert("1.0", info_text)
-            self.path_info_text.configure(state="disabled")
+            self.path_info_var.set(info_text)
 
             self.status_label.config(text="路径生成完成")
             self.progress_var.set(100)
@@ -1890,54 +2361,41 @@ ENDMODULE"""
             messagebox.showinfo("成功", "抛光路径生成完成")
 
         except Exception as e:
-            messagebox.showerror("错误", f"生成路径失败:\n{str(e)}")
-            self.status_label.config(text="路径生成失败")
-            self.progress_var.set(0)
+            self._on_path_generation_failed(e)
+            return
+
+        if on_done:
+            on_done()
+
+    def _on_path_generation_failed(self, error):
+        """路径生成失败回调"""
+        messagebox.showerror("错误", f"生成路径失败:\n{str(error)}")
+        self.status_label.config(text="路径生成失败")
+        self.progress_var.set(0)
 
     def _generate_simulated_paths(self):
-        """生成模拟路径数据"""
-        # 模拟路径生成
-        rough_paths = []
-        fine_paths = []
+        """生成模拟路径数据（每个工艺阶段一个SoA路径缓冲）"""
+        orientation = (1.0, 0.0, 0.0, 0.0)
 
         # 粗抛路径
+        rough_paths = PathBuffer(capacity=3 * 10)
+        j = np.arange(10)
         for i in range(3):
-            points = []
-            for j in range(10):
-                points.append({
-                    'position': [i * 50 + j * 5, i * 30 + j * 3, 100 + j * 2],
-                    'orientation': [1.0, 0.0, 0.0, 0.0]
-                })
-            rough_paths.append({
-                'id': i,
-                'name': f'粗抛路径_{i + 1}',
-                'points': points
-            })
+            positions = np.column_stack([i * 50 + j * 5, i * 30 + j * 3, 100 + j * 2])
+            rough_paths.append_batch(positions, orientation, name=f'粗抛路径_{i + 1}')
 
         # 精抛路径
+        fine_paths = PathBuffer(capacity=2 * 15)
+        j = np.arange(15)
         for i in range(2):
-            points = []
-            for j in range(15):
-                points.append({
-                    'position': [i * 30 + j * 3, i * 20 + j * 2, 100 + j * 1],
-                    'orientation': [1.0, 0.0, 0.0, 0.0]
-                })
-            fine_paths.append({
-                'id': i,
-                'name': f'精抛路径_{i + 1}',
-                'points': points
-            })
+            positions = np.column_stack([i * 30 + j * 3, i * 20 + j * 2, 100 + j * 1])
+            fine_paths.append_batch(positions, orientation, name=f'精抛路径_{i + 1}')
 
         return {'rough': rough_paths, 'fine': fine_paths}
 
     def _count_total_points(self, paths):
         """计算总路径点数"""
-        total = 0
-        for stage in ['rough', 'fine']:
-            if stage in paths:
-                for path in paths[stage]:
-                    total += len(path.get('points', []))
-        return total
+        return sum(paths[stage].point_count for stage in ['rough', 'fine'] if stage in paths)
 
     def generate_code(self):
         """生成RAPID代码"""
@@ -1948,7 +2406,7 @@ ENDMODULE"""
         # 更新状态
         self.status_label.config(text="正在生成代码...")
         self.progress_var.set(30)
-        self.root.update()
+        self.root.update_idletasks()
 
         try:
             # 准备数据
@@ -1969,12 +2427,9 @@ ENDMODULE"""
             # 生成代码
             self.generated_code = self.rapid_generator.generate_complete_program(program_data)
 
-            # 显示代码
-            self.code_text.delete("1.0", tk.END)
-            self.code_text.insert("1.0", self.generated_code)
-
-            # 应用语法高亮
-            self._apply_syntax_highlighting()
+            # 显示代码并应用语法高亮
+            self._ensure_tab_built(self.tab_code)
+            self._show_code(self.generated_code)
 
             self.status_label.config(text="代码生成完成")
             self.progress_var.set(100)
@@ -1986,32 +2441,74 @@ ENDMODULE"""
             self.status_label.config(text="代码生成失败")
             self.progress_var.set(0)
 
-    def _apply_syntax_highlighting(self):
-        """应用语法高亮"""
+    def _apply_syntax_highlighting(self, ranges=None):
+        """应用语法高亮（ranges 为预先算好的标记区间时整体应用，否则只高亮可见区域）"""
         # 清除现有标记
-        for tag in self.code_text.tag_names():
-            if tag not in ["sel", "comment", "keyword", "string", "number"]:
-                self.code_text.tag_remove(tag, "1.0", tk.END)
-
-        # 高亮注释
-        self.code_text.tag_add("comment", "1.0", tk.END)
-
-        # 高亮关键词（简化实现）
-        keywords = ['MODULE', 'PROC', 'CONST', 'VAR', 'IF', 'THEN', 'ELSE',
-                    'ENDIF', 'FOR', 'TO', 'DO', 'ENDFOR', 'MoveL', 'MoveJ',
-                    'TPWrite', 'WaitTime', 'SetDO', 'WaitDI', 'Stop']
-
-        content = self.code_text.get("1.0", tk.END)
-        for keyword in keywords:
-            start = "1.0"
-            while True:
-                start = self.code_text.search(r'\b' + keyword + r'\b', start, tk.END,
-                                              regexp=True, nocase=True)
-                if not start:
-                    break
-                end = f"{start}+{len(keyword)}c"
-                self.code_text.tag_add("keyword", start, end)
-                start = end
+        for tag in self._SYNTAX_TAGS:
+            self.code_text.tag_remove(tag, "1.0", tk.END)
+
+        if ranges is None:
+            self._highlighted_chunks = set()
+            self._highlight_visible_lines()
+            return
+
+        self._highlighted_chunks = None
+        for tag, indices in ranges.items():
+            if indices:
+                self.code_text.tag_add(tag, *indices)
+
+    def _schedule_visible_highlighting(self):
+        """合并连续的滚动事件，停下50ms后再高亮新露出的区域"""
+        if self._highlighted_chunks is None:
+            return
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+        self._highlight_job = self.root.after(50, self._highlight_visible_lines)
+
+    def _highlight_visible_lines(self):
+        """按行块扫描当前视口内尚未高亮的代码（记号不跨行，可按行切分）"""
+        self._highlight_job = None
+        if self._highlighted_chunks is None:
+            return
+
+        first = int(self.code_text.index("@0,0").split(".")[0])
+        last = int(self.code_text.index(f"@0,{self.code_text.winfo_height()}").split(".")[0])
+        size = self._SYNTAX_CHUNK_LINES
+
+        for chunk in range((first - 1) // size, (last - 1) // size + 1):
+            if chunk in self._highlighted_chunks:
+                continue
+            self._highlighted_chunks.add(chunk)
+
+            start = chunk * size + 1
+            content = self.code_text.get(f"{start}.0", f"{start + size}.0")
+            for tag, indices in self._syntax_ranges(content, start).items():
+                if indices:
+                    self.code_text.tag_add(tag, *indices)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _sample_syntax_ranges(cls):
+        """示例代码的高亮区间（只计算一次）"""
+        return cls._syntax_ranges(cls._get_sample_rapid_code())
+
+    @classmethod
+    def _syntax_ranges(cls, content, first_line=1):
+        """扫描代码文本，返回 {标签: [起点, 终点, ...]} 形式的 Tk 索引区间（content 从 first_line 行开始）"""
+        # 行首偏移表，用于把字符偏移换算成 Tk 的 "行.列" 索引
+        line_starts = list(itertools.accumulate(
+            (len(line) + 1 for line in content.split("\n")), initial=0
+        ))
+
+        def to_index(offset):
+            line = bisect.bisect_right(line_starts, offset) - 1
+            return f"{line + first_line}.{offset - line_starts[line]}"
+
+        # 单遍扫描，按标签收集区间，应用时每个标签一次 tag_add
+        ranges = {tag: [] for tag in cls._SYNTAX_TAGS}
+        for match in cls._SYNTAX_RE.finditer(content):
+            ranges[match.lastgroup].extend((to_index(match.start()), to_index(match.end())))
+        return ranges
 
     def export_program(self):
         """导出程序"""
@@ -2038,7 +2535,7 @@ ENDMODULE"""
         # 更新状态
         self.status_label.config(text="正在导出程序...")
         self.progress_var.set(50)
-        self.root.update()
+        self.root.update_idletasks()
 
         try:
             # 导出程序
@@ -2074,18 +2571,39 @@ ENDMODULE"""
 
     def refresh_code_preview(self):
         """刷新代码预览"""
-        self.code_text.delete("1.0", tk.END)
         if self.generated_code:
-            self.code_text.insert("1.0", self.generated_code)
-            self._apply_syntax_highlighting()
+            self._show_code(self.generated_code)
         else:
-            self.code_text.insert("1.0", self._get_sample_rapid_code())
+            self._show_code(self._get_sample_rapid_code(), self._sample_syntax_ranges())
+
+    def _show_code(self, code, ranges=None):
+        """在代码框中显示代码并高亮；与上次写入的文本相同且用户未编辑过时无需重新插入和扫描"""
+        # 文本框的 modified 标志在用户编辑后置位，程序写入后清除，无需读回整个缓冲区比较
+        if code == self._displayed_code and not self.code_text.edit_modified():
+            return
+
+        # 内容整体替换，旧的行块高亮记录和待执行的高亮任务一并作废
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+            self._highlight_job = None
+        self._highlighted_chunks = None
+
+        self.code_text.delete("1.0", tk.END)
+        self.code_text.insert("1.0", code)
+        self.code_text.edit_modified(False)
+        self._displayed_code = code
+        self._apply_syntax_highlighting(ranges)
 
     def execute_full_process(self):
         """执行完整流程"""
+        # 加载模型和生成路径在后台执行，成功后经回调推进到后续步骤
+        self.load_model(
+            on_done=lambda: self.generate_paths(on_done=self._finish_full_process)
+        )
+
+    def _finish_full_process(self):
+        """完整流程的收尾步骤"""
         steps = [
-            ("加载模型", self.load_model),
-            ("生成路径", self.generate_paths),
             ("生成代码", self.generate_code),
             ("导出程序", self.export_program)
         ]
@@ -2094,14 +2612,11 @@ ENDMODULE"""
             try:
                 self.status_label.config(text=f"正在执行: {step_name}")
                 self.progress_var.set(0)
-                self.root.update()
+                self.root.update_idletasks()
 
                 # 执行步骤
                 step_func()
 
-                # 短暂暂停
-                time.sleep(0.5)
-
             except Exception as e:
                 messagebox.showerror("流程中断", f"{step_name}失败:\n{str(e)}")
                 return
@@ -2137,6 +2652,7 @@ F1 - 显示帮助
     def on_closing(self):
         """关闭应用程序"""
         if messagebox.askokcancel("退出", "确定要退出吗？"):
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.root.destroy()
 
     def run(self):
@@ -2156,39 +2672,48 @@ class PolishingMathematicalModel:
     """抛光数学建模类"""
 
     @staticmethod
-    def calculate_surface_curvature(mesh, k_neighbors=10):
-        """计算表面曲率"""
-        vertices = mesh.vertices
-        curvatures = []
-
-        # 构建KD树用于快速查找邻居
-        tree = cKDTree(vertices)
-
-        for i, point in enumerate(vertices):
-            # 查找最近邻点
-            distances, indices = tree.query(point, k=k_neighbors + 1)
-            neighbors = vertices[indices[1:]]  # 排除自身
-
-            # 计算PCA
-            if len(neighbors) >= 3:
-                centered = neighbors - neighbors.mean(axis=0)
-                cov_matrix = centered.T @ centered
-                eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
-
-                # 特征值排序（升序）
-                sorted_indices = np.argsort(eigenvalues)
-                eigenvalues = eigenvalues[sorted_indices]
-
-                # 计算曲率
-                if eigenvalues[2] > 0:
-                    curvature = eigenvalues[0] / eigenvalues[2]
-                    curvatures.append(curvature)
-                else:
-                    curvatures.append(0)
-            else:
-                curvatures.append(0)
+    def _mesh_version(mesh):
+        """网格版本键，只有 trimesh.Trimesh 可用（其 hash(mesh) 随顶点/面片修改而变）；其他网格对象返回None，不做缓存"""
+        trimesh = _lazy('trimesh', required=False)
+        if trimesh is not None and isinstance(mesh, trimesh.Trimesh):
+            return hash(mesh)
+        return None
+
+    @staticmethod
+    def calculate_surface_curvature(mesh, k_neighbors=10, method="pca"):
+        """计算表面曲率
 
-        return np.array(curvatures)
+        method="pca"   : 邻域PCA表面变化度（默认，取值0~1/3，自适应路径按此排序）
+        method="defect": trimesh顶点角亏（离散高斯曲率测度）的绝对值，需要面片信息
+
+        每次返回缓存结果的副本，调用方可原地修改
+        """
+        # 结果缓存在网格对象上，按算法、邻域大小和网格版本校验；
+        # trimesh 的 hash(mesh) 由 TrackedArray 维护，几何被修改后改变，未修改时直接复用，无需重新哈希顶点
+        version = PolishingMathematicalModel._mesh_version(mesh)
+        cache_key = (method, k_neighbors, version)
+        cached = getattr(mesh, '_curvature_cache', None) if version is not None else None
+        if cached is not None and cached[0] == cache_key:
+            return cached[1].copy()
+
+        vertices = np.ascontiguousarray(mesh.vertices, dtype=float)
+
+        if method == "defect" and hasattr(mesh, 'vertex_defects'):
+            # 角亏由trimesh按面片向量化计算，无需邻域查询
+            curvatures = np.abs(np.asarray(mesh.vertex_defects, dtype=float))
+        else:
+            # 构建KD树用于快速查找邻居，批量查询在内核之外完成
+            tree = _lazy('scipy.spatial').cKDTree(vertices)
+            # 顶点数不足 k+1 时 cKDTree 会以索引 n 填充缺失邻居，内核不做越界检查，故按顶点数截断
+            k = min(k_neighbors + 1, len(vertices))
+            _, neighbor_indices = tree.query(vertices, k=k, workers=-1)
+            neighbor_indices = neighbor_indices.reshape(len(vertices), k)
+
+            curvatures = _pca_curvature_kernel(vertices, neighbor_indices.astype(np.int32))
+        if version is not None:
+            mesh._curvature_cache = (cache_key, curvatures)
+
+        return curvatures.copy()
 
     @staticmethod
     def calculate_surface_normals(mesh):
@@ -2196,20 +2721,39 @@ class PolishingMathematicalModel:
         if hasattr(mesh, 'face_normals') and len(mesh.face_normals) > 0:
             return mesh.face_normals
         else:
-            # 手动计算法向量
-            vertices = mesh.vertices
-            faces = mesh.faces
+            # 手动计算法向量（与面积、质心共用一次面片遍历）
+            return PolishingMathematicalModel.calculate_face_attributes(mesh)[0]
+
+    @staticmethod
+    def calculate_face_attributes(mesh):
+        """一次遍历面片，同时计算单位法向量、面积和质心，返回 (normals, areas, centroids)
+
+        每次返回缓存结果的副本，调用方可原地修改
+        """
+        # 结果缓存在网格对象上，按网格版本校验（顶点或面片被修改后改变）
+        cache_key = PolishingMathematicalModel._mesh_version(mesh)
+        cached = getattr(mesh, '_face_attributes_cache', None) if cache_key is not None else None
+        if cached is not None and cached[0] == cache_key:
+            return tuple(array.copy() for array in cached[1])
+
+        vertices = np.ascontiguousarray(mesh.vertices, dtype=float)
+        faces = np.ascontiguousarray(mesh.faces)
+
+        triangles = vertices[faces]  # (F, 3, 3)，只展开一次
+        v0 = triangles[:, 0]
+        normals = np.cross(triangles[:, 1] - v0, triangles[:, 2] - v0)
+        double_areas = np.linalg.norm(normals, axis=1)
+        areas = 0.5 * double_areas
+        centroids = triangles.mean(axis=1)
 
-            normals = np.zeros((len(faces), 3))
-            for i, face in enumerate(faces):
-                v1 = vertices[face[1]] - vertices[face[0]]
-                v2 = vertices[face[2]] - vertices[face[0]]
-                normal = np.cross(v1, v2)
-                normal_length = np.linalg.norm(normal)
-                if normal_length > 0:
-                    normals[i] = normal / normal_length
+        # 退化面片（面积为0）的法向量保持为零向量
+        np.divide(normals, double_areas[:, None], out=normals, where=double_areas[:, None] > 0)
 
-            return normals
+        attributes = (normals, areas, centroids)
+        if cache_key is not None:
+            mesh._face_attributes_cache = (cache_key, attributes)
+
+        return tuple(array.copy() for array in attributes)
 
     @staticmethod
     def calculate_contact_pressure(tool_radius, force, curvature):
@@ -2233,76 +2777,90 @@ class PolishingMathematicalModel:
         return material_coeff * pressure * speed * contact_area
 
     @staticmethod
-    def optimize_path_length(points):
+    def optimize_path_length(points, k_neighbors=16):
         """优化路径长度（旅行商问题简化版）"""
         if len(points) <= 2:
             return points
 
-        # 使用最近邻算法优化路径
+        points = np.asarray(points)
+        count = len(points)
+        spatial = _lazy('scipy.spatial', required=False)
+        tree = spatial.cKDTree(points) if spatial is not None else None
+        k = min(k_neighbors, count)
+
+        # 使用最近邻算法优化路径：先在KD树的 k 个近邻中找未访问点，
+        # 无法确定最近点时再对剩余未访问点整行计算距离
         current_idx = 0
-        visited = [False] * len(points)
+        visited = np.zeros(count, dtype=bool)
         visited[current_idx] = True
-        optimized_path = [points[current_idx]]
+        order = np.empty(count, dtype=np.intp)
+        order[0] = current_idx
 
-        for _ in range(len(points) - 1):
-            min_dist = float('inf')
+        for step in range(1, count):
             next_idx = -1
-
-            for i, point in enumerate(points):
-                if not visited[i]:
-                    dist = np.linalg.norm(points[current_idx] - point)
-                    if dist < min_dist:
-                        min_dist = dist
-                        next_idx = i
-
-            if next_idx != -1:
-                visited[next_idx] = True
-                optimized_path.append(points[next_idx])
-                current_idx = next_idx
-
-        return np.array(optimized_path)
+            if tree is not None:
+                bounds, candidates = tree.query(points[current_idx], k=k)
+                # 候选按下标排序，距离并列时与逐点扫描一样取下标最小的点
+                unvisited = np.sort(candidates[~visited[candidates]])
+                if len(unvisited):
+                    distances = np.linalg.norm(points[unvisited] - points[current_idx], axis=1)
+                    best = int(np.argmin(distances))
+                    # 最近距离严格小于第 k 近邻距离时，候选集之外不可能有同样近的点
+                    if k == count or distances[best] < bounds[-1] * (1 - 1e-9):
+                        next_idx = int(unvisited[best])
+
+            if next_idx < 0:
+                remaining = np.flatnonzero(~visited)
+                distances = np.linalg.norm(points[remaining] - points[current_idx], axis=1)
+                next_idx = int(remaining[np.argmin(distances)])
+
+            visited[next_idx] = True
+            order[step] = next_idx
+            current_idx = next_idx
+
+        return points[order]
 
     @staticmethod
     def calculate_tool_orientation(normal, approach_angle=45):
         """计算工具姿态（四元数）"""
-        # 将法向量转换为四元数
-        normal = normal / np.linalg.norm(normal)
-
-        # 计算旋转轴和角度
-        up_vector = np.array([0, 0, 1])
-        if np.allclose(normal, up_vector) or np.allclose(normal, -up_vector):
-            axis = np.array([1, 0, 0])
-        else:
-            axis = np.cross(up_vector, normal)
-            axis = axis / np.linalg.norm(axis)
+        return PolishingMathematicalModel.calculate_tool_orientations(normal)[0].tolist()
 
-        # 计算旋转角度
-        angle = np.arccos(np.clip(np.dot(up_vector, normal), -1.0, 1.0))
+    @staticmethod
+    def calculate_tool_orientations(normals):
+        """批量计算工具姿态（四元数，形状 (N, 4)）"""
+        normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+        # 计算旋转轴；法向量与Z轴平行时取X轴
+        up_vector = np.array([0.0, 0.0, 1.0])
+        parallel = (np.isclose(normals, up_vector).all(axis=1) |
+                    np.isclose(normals, -up_vector).all(axis=1))
+        axes = np.cross(up_vector, normals)
+        axis_norms = np.linalg.norm(axes, axis=1, keepdims=True)
+        axis_norms[parallel] = 1.0
+        axes = axes / axis_norms
+        axes[parallel] = [1.0, 0.0, 0.0]
+
+        # 旋转角度的一半
+        half_angles = np.arccos(np.clip(normals[:, 2], -1.0, 1.0)) / 2
 
         # 转换为四元数
-        qw = np.cos(angle / 2)
-        qx = axis[0] * np.sin(angle / 2)
-        qy = axis[1] * np.sin(angle / 2)
-        qz = axis[2] * np.sin(angle / 2)
-
-        return [qw, qx, qy, qz]
+        return np.column_stack([np.cos(half_angles), axes * np.sin(half_angles)[:, None]])
 
     @staticmethod
     def generate_spiral_path(center, radius, start_height, end_height, points_per_revolution=20, revolutions=5):
-        """生成螺旋路径"""
-        points = []
-
-        for i in range(revolutions * points_per_revolution):
-            angle = 2 * np.pi * i / points_per_revolution
-            r = radius * (revolutions * points_per_revolution - i) / (revolutions * points_per_revolution)
+        """生成螺旋路径（全部采样点一次向量化计算）"""
+        total = revolutions * points_per_revolution
+        i = np.arange(total)
 
-            x = center[0] + r * np.cos(angle)
-            y = center[1] + r * np.sin(angle)
-            z = start_height + (end_height - start_height) * i / (revolutions * points_per_revolution)
+        angle = 2 * np.pi * i / points_per_revolution
+        r = radius * (total - i) / total
 
-            points.append([x, y, z])
+        x = center[0] + r * np.cos(angle)
+        y = center[1] + r * np.sin(angle)
+        z = start_height + (end_height - start_height) * i / total
 
-        return np.array(points)
+        return np.column_stack([x, y, z])
 
     @staticmethod
     def calculate_force_distribution(tool_path, surface_normals, desired_force=30.0):
@@ -2324,17 +2882,118 @@ class PolishingMathematicalModel:
         if len(points) < 3:
             return points
 
+        # [1, 2, 1] / 4 滑动平均，首尾点保持不变
+        points = np.asarray(points)
         smoothed = np.copy(points)
-        for i in range(1, len(points) - 1):
-            smoothed[i] = (points[i - 1] + points[i] * 2 + points[i + 1]) / 4
+        smoothed[1:-1] = (points[:-2] + points[1:-1] * 2 + points[2:]) / 4
 
         return smoothed
 
-    @staticmethod
-    def calculate_energy_consumption(path_length, force, speed, efficiency=0.8):
-        """计算能量消耗"""
-        # E = F * d / η
-        return force * path_length / efficiency
+    @staticmethod
+    def calculate_energy_consumption(path_length, force, speed, efficiency=0.8):
+        """计算能量消耗"""
+        # E = F * d / η
+        return force * path_length / efficiency
+
+
+# ==================== 路径点SoA缓冲 ====================
+class PathBuffer:
+    """路径点SoA缓冲：按列存储一个工艺阶段内全部路径点"""
+
+    __slots__ = ('positions', 'orientations', 'feeds', 'zones', 'offsets', 'names', 'sources', 'size')
+
+    # 区域数据名称，zones 列保存其下标
+    ZONE_NAMES = ('zFine', 'zMedium', 'zLarge')
+
+    # 坐标和四元数直接按 %.3f / %.6f 写入 RAPID，保持 float64，
+    # float32 只有约7位有效数字，会改变舍入边界附近的末位输出
+    DTYPE = np.float64
+
+    def __init__(self, capacity=256):
+        self.positions = np.empty((capacity, 3), dtype=self.DTYPE)
+        self.orientations = np.empty((capacity, 4), dtype=self.DTYPE)
+        self.feeds = np.empty(capacity, dtype=self.DTYPE)
+        self.zones = np.empty(capacity, dtype=np.uint8)
+        self.offsets = [0]  # 第i条路径的点位于 offsets[i]:offsets[i + 1]
+        self.names = []
+        self.sources = []  # 第i条路径在原路径列表中的下标（空路径不入缓冲，下标可能不连续）
+        self.size = 0
+
+    def __len__(self):
+        """路径条数"""
+        return len(self.names)
+
+    @property
+    def point_count(self):
+        return self.size
+
+    def _reserve(self, count):
+        """容量不足时成倍扩容"""
+        capacity = len(self.feeds)
+        if self.size + count <= capacity:
+            return
+
+        new_capacity = max(capacity * 2, self.size + count)
+        for attr in ('positions', 'orientations', 'feeds', 'zones'):
+            old = getattr(self, attr)
+            new = np.empty((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, attr, new)
+
+    def append_batch(self, positions, orientations, feed=0.0, zone='zMedium', name=None, source=None):
+        """追加一条路径，姿态/速度可为单值（自动广播到所有点）；source 为原路径下标，默认按追加顺序编号"""
+        positions = np.asarray(positions, dtype=self.DTYPE).reshape(-1, 3)
+        count = len(positions)
+        if count == 0:
+            return
+
+        self._reserve(count)
+        start, end = self.size, self.size + count
+        self.positions[start:end] = positions
+        self.orientations[start:end] = orientations
+        self.feeds[start:end] = feed
+        self.zones[start:end] = self.ZONE_NAMES.index(zone)
+
+        self.size = end
+        self.offsets.append(end)
+        self.sources.append(source if source is not None else len(self.names))
+        self.names.append(name if name is not None else f'路径_{len(self.names) + 1}')
+
+    def path_slice(self, index):
+        """第index条路径在各列中的切片"""
+        return slice(self.offsets[index], self.offsets[index + 1])
+
+    def path_length(self, index):
+        """第index条路径的折线长度"""
+        positions = self.positions[self.path_slice(index)]
+        return float(np.linalg.norm(np.diff(positions, axis=0), axis=1).sum())
+
+    @classmethod
+    def from_paths(cls, paths):
+        """由路径字典列表构建，点可为 {'position', 'orientation'} 字典或 [x, y, z]"""
+        if isinstance(paths, cls):
+            return paths
+
+        # 按总点数一次分配，避免追加过程中扩容复制
+        buffer = cls(capacity=sum(len(path.get('points', [])) for path in paths))
+        for index, path in enumerate(paths):
+            points = path.get('points', [])
+            if not points:
+                continue
+
+            if isinstance(points[0], dict):
+                positions = [point.get('position', [0, 0, 0]) for point in points]
+                orientations = [point.get('orientation', [1, 0, 0, 0]) for point in points]
+                feed = points[0].get('velocity', 0.0)
+                zone = points[0].get('zone', 'zMedium')
+            else:
+                positions = points
+                orientations = (1.0, 0.0, 0.0, 0.0)
+                feed, zone = 0.0, 'zMedium'
+
+            buffer.append_batch(positions, orientations, feed, zone, path.get('name'), source=index)
+
+        return buffer
 
 
 # ==================== 高级路径规划算法 ====================
@@ -2344,8 +3003,10 @@ class AdvancedPathPlanner:
     def __init__(self, mesh, tool_radius=8.0):
         self.mesh = mesh
         self.tool_radius = tool_radius
-        self.vertices = mesh.vertices
-        self.faces = mesh.faces
+        # 规划计算（arange 网格、距离阈值比较）保持 float64，
+        # 否则扫描线位置和 "< spacing" 判定会在边界处翻转
+        self.vertices = np.asarray(mesh.vertices, dtype=float)
+        self.faces = np.asarray(mesh.faces)
 
     def generate_adaptive_path(self, stepover_ratio=0.5):
         """生成自适应路径"""
@@ -2360,15 +3021,21 @@ class AdvancedPathPlanner:
         paths = []
         step_size = self.tool_radius * stepover_ratio
 
+        # 顶点按Z排序一次，各层用二分查找切片
+        order = np.argsort(self.vertices[:, 2])
+        z_values = self.vertices[order, 2]
+
         # 根据曲率调整步距
         for z in np.arange(min_coords[2], max_coords[2], step_size):
             layer_points = []
 
             # 找到当前Z层的点
-            mask = (self.vertices[:, 2] >= z) & (self.vertices[:, 2] < z + step_size)
-            if np.any(mask):
-                layer_vertices = self.vertices[mask]
-                layer_curvatures = curvatures[mask]
+            lo, hi = np.searchsorted(z_values, (z, z + step_size))
+            if hi > lo:
+                # 层内恢复原顶点顺序，保证曲率相同时的排序结果不变
+                layer_indices = np.sort(order[lo:hi])
+                layer_vertices = self.vertices[layer_indices]
+                layer_curvatures = curvatures[layer_indices]
 
                 # 根据曲率排序
                 sorted_indices = np.argsort(layer_curvatures)
@@ -2398,36 +3065,67 @@ class AdvancedPathPlanner:
 
         paths = []
 
-        # 生成平行线
+        # 生成平行线：行方向为扫描线，列方向为线上采样点
         if angle == 0:  # X方向
-            for y in np.arange(min_coords[1], max_coords[1], spacing):
-                line_points = []
-                for x in np.arange(min_coords[0], max_coords[0], spacing):
-                    # 找到最近的表面点
-                    distances = np.sqrt((self.vertices[:, 0] - x) ** 2 + (self.vertices[:, 1] - y) ** 2)
-                    closest_idx = np.argmin(distances)
-                    if distances[closest_idx] < spacing:
-                        point = self.vertices[closest_idx].tolist()
-                        line_points.append(point)
-
-                if line_points:
-                    paths.append({'points': line_points, 'direction': 'x'})
-
+            row_axis, col_axis, direction = 1, 0, 'x'
         elif angle == 90:  # Y方向
-            for x in np.arange(min_coords[0], max_coords[0], spacing):
-                line_points = []
-                for y in np.arange(min_coords[1], max_coords[1], spacing):
-                    distances = np.sqrt((self.vertices[:, 0] - x) ** 2 + (self.vertices[:, 1] - y) ** 2)
-                    closest_idx = np.argmin(distances)
-                    if distances[closest_idx] < spacing:
-                        point = self.vertices[closest_idx].tolist()
-                        line_points.append(point)
-
-                if line_points:
-                    paths.append({'points': line_points, 'direction': 'y'})
+            row_axis, col_axis, direction = 0, 1, 'y'
+        else:
+            return paths
+
+        rows = np.arange(min_coords[row_axis], max_coords[row_axis], spacing)
+        cols = np.arange(min_coords[col_axis], max_coords[col_axis], spacing)
+        if len(rows) == 0 or len(cols) == 0:
+            return paths
+
+        # 在 XY 平面上一次性查询整个网格的最近表面点
+        grid = np.empty((len(rows), len(cols), 2))
+        grid[:, :, row_axis] = rows[:, None]
+        grid[:, :, col_axis] = cols[None, :]
+        distances, indices = self._nearest_xy_vertices(grid.reshape(-1, 2), spacing)
+        hits = (distances < spacing).reshape(len(rows), len(cols))
+        indices = indices.reshape(len(rows), len(cols))
+
+        for row_hits, row_indices in zip(hits, indices):
+            if row_hits.any():
+                line_points = self.vertices[row_indices[row_hits]].tolist()
+                paths.append({'points': line_points, 'direction': direction})
 
         return paths
 
+    # XY 最近点查询的候选数：上下表面等 XY 重合的顶点需一并取出再按顶点序号决胜
+    _XY_CANDIDATES = 8
+
+    def _nearest_xy_vertices(self, points, max_distance):
+        """每个查询点在 XY 平面上的最近顶点 (距离, 下标)
+
+        与逐点 argmin 相同：距离相等时取下标最小的顶点（如上下表面 XY 重合的点取先出现者）。
+        """
+        xy = self.vertices[:, :2]
+        k = min(self._XY_CANDIDATES, len(xy))
+        tree2d = _lazy('scipy.spatial').cKDTree(xy)
+        _, candidates = tree2d.query(points, k=k, distance_upper_bound=max_distance, workers=-1)
+        candidates = np.sort(candidates.reshape(len(points), k), axis=1)  # 按顶点序号排列，缺失邻居(=n)排最后
+
+        # 候选距离按逐点公式重算，argmin 在并列时自然取最小下标
+        padded = np.vstack([xy, np.full((1, 2), np.inf)])
+        offsets = padded[candidates] - points[:, None, :]
+        candidate_distances = np.sqrt(offsets[..., 0] ** 2 + offsets[..., 1] ** 2)
+        best = np.argmin(candidate_distances, axis=1)
+        rows = np.arange(len(points))
+        distances = candidate_distances[rows, best]
+        indices = candidates[rows, best]
+
+        # 候选全部并列时可能还有更多并列顶点未取出，这些点退回逐点全量比较
+        saturated = np.flatnonzero((candidates[:, -1] < len(xy)) &
+                                   (candidate_distances.max(axis=1) == distances))
+        for i in saturated:
+            point_distances = np.sqrt((xy[:, 0] - points[i, 0]) ** 2 + (xy[:, 1] - points[i, 1]) ** 2)
+            indices[i] = np.argmin(point_distances)
+            distances[i] = point_distances[indices[i]]
+
+        return distances, indices
+
     def generate_spiral_path(self, center=None, max_radius=None):
         """生成螺旋路径"""
         if center is None:
@@ -2444,19 +3142,16 @@ class AdvancedPathPlanner:
             np.max(self.vertices[:, 2])
         )
 
-        # 投影到表面
-        surface_points = []
-        tree = cKDTree(self.vertices)
+        # 投影到表面：一次批量查询所有螺旋点的3个最近邻
+        tree = _lazy('scipy.spatial').cKDTree(self.vertices)
+        distances, indices = tree.query(spiral_points, k=3, workers=-1)
 
-        for point in spiral_points:
-            distances, indices = tree.query(point, k=3)
-            # 加权平均
-            weights = 1 / (distances + 1e-6)
-            weights = weights / np.sum(weights)
-            surface_point = np.sum(self.vertices[indices] * weights.reshape(-1, 1), axis=0)
-            surface_points.append(surface_point.tolist())
+        # 加权平均
+        weights = 1 / (distances + 1e-6)
+        weights = weights / np.sum(weights, axis=1, keepdims=True)
+        surface_points = np.einsum('nk,nkd->nd', weights, self.vertices[indices])
 
-        return [{'points': surface_points, 'type': 'spiral'}]
+        return [{'points': surface_points.tolist(), 'type': 'spiral'}]
 
     def calculate_path_coverage(self, paths):
         """计算路径覆盖率"""
@@ -2464,25 +3159,16 @@ class AdvancedPathPlanner:
             return 0.0
 
         # 简化计算：检查有多少顶点在工具半径范围内
-        covered_count = 0
         tool_influence_radius = self.tool_radius * 1.5
+        path_points = [point for path in paths for point in path.get('points', [])]
+        if not path_points or len(self.vertices) == 0:
+            return 0.0
 
-        for vertex in self.vertices:
-            covered = False
-
-            for path in paths:
-                for point in path.get('points', []):
-                    distance = np.linalg.norm(vertex - np.array(point))
-                    if distance < tool_influence_radius:
-                        covered = True
-                        break
-                if covered:
-                    break
-
-            if covered:
-                covered_count += 1
+        # 对全部路径点建树，每个顶点只需一次最近邻查询
+        tree = _lazy('scipy.spatial').cKDTree(np.asarray(path_points, dtype=float))
+        distances, _ = tree.query(self.vertices, k=1, distance_upper_bound=tool_influence_radius, workers=-1)
 
-        return covered_count / len(self.vertices) if len(self.vertices) > 0 else 0.0
+        return float(np.mean(distances < tool_influence_radius))
 
     def optimize_path_sequence(self, paths, start_point=None):
         """优化路径序列"""
@@ -2492,37 +3178,54 @@ class AdvancedPathPlanner:
         if start_point is None:
             start_point = np.mean(self.vertices, axis=0)
 
-        # 计算每条路径的起点
-        path_starts = []
-        for i, path in enumerate(paths):
-            if path.get('points'):
-                path_starts.append((i, path['points'][0]))
+        # 计算每条路径的起点，堆叠为 (M, 3) 数组
+        path_indices = [i for i, path in enumerate(paths) if path.get('points')]
+        if not path_indices:
+            return []
+        starts = np.array([paths[i]['points'][0] for i in path_indices], dtype=float)
 
-        # 使用最近邻算法优化顺序
+        # 使用最近邻算法优化顺序，每步一次批量求全部起点的距离
         optimized_order = []
-        visited = [False] * len(path_starts)
+        visited = np.zeros(len(starts), dtype=bool)
         current_pos = start_point
 
-        for _ in range(len(path_starts)):
-            min_dist = float('inf')
-            next_idx = -1
-
-            for i, (path_idx, start_pos) in enumerate(path_starts):
-                if not visited[i]:
-                    distance = np.linalg.norm(current_pos - np.array(start_pos))
-                    if distance < min_dist:
-                        min_dist = distance
-                        next_idx = i
+        for _ in range(len(starts)):
+            distances = np.linalg.norm(starts - current_pos, axis=1)
+            distances[visited] = np.inf
+            next_idx = int(np.argmin(distances))
 
-            if next_idx != -1:
-                visited[next_idx] = True
-                optimized_order.append(path_starts[next_idx][0])
-                current_pos = np.array(path_starts[next_idx][1])
+            visited[next_idx] = True
+            optimized_order.append(path_indices[next_idx])
+            current_pos = starts[next_idx]
 
         # 重新排序路径
         return [paths[i] for i in optimized_order]
 
 
+# ==================== 模型元数据记录 ====================
+@dataclass(slots=True, frozen=True)
+class ModelMetadata:
+    """STL模型元数据记录"""
+    is_nx: bool = False
+    units: str = '毫米'
+    version: str = '未知'
+    creation_date: Optional[str] = None
+    author: Optional[str] = None
+    part_name: Optional[str] = None
+    original_format: str = 'STL'
+    format: Optional[str] = None
+    face_count: Optional[int] = None
+    cad_system: Optional[str] = None
+    file_size: int = 0
+    nx_specific: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """由元数据字典构建，忽略未知键"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in mapping.items() if key in names})
+
+
 # ==================== NX STL专业处理库 ====================
 class NXSTLProcessor:
     """NX STL文件专业处理器"""
@@ -2538,49 +3241,108 @@ class NXSTLProcessor:
         }
     }
 
+    # 二进制STL面片记录: 12字节法向量 + 36字节顶点 + 2字节属性
+    _STL_DTYPE = np.dtype([('normal', '<f4', (3,)),
+                           ('vertices', '<f4', (3, 3)),
+                           ('attr', '<u2')])
+
+    # 头信息检测用的标志与预编译正则（每次读取元数据时复用）
+    _NX_INDICATORS = ('NX', 'Siemens', 'UG', 'Unigraphics')
+    _NX_METADATA_RE = re.compile(r'UNITS\s*=\s*[A-Z]+|CREATED\s*=\s*[0-9\-]+|PART\s*=\s*.+', re.IGNORECASE)
+    _DATE_RE = re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}')
+    _PART_RE = re.compile(r'[Pp]art[:=]\s*(.+)')
+    _AUTHOR_RE = re.compile(r'[Aa]uthor[:=]\s*(.+)')
+    _VERSION_RE = re.compile(r'[Vv]ersion[:=]\s*(.+)')
+    _TOLERANCE_RE = re.compile(r'[Tt]olerance[:=]\s*([0-9.]+)')
+    _OTHER_CAD_INDICATORS = {
+        'SolidWorks': ('SolidWorks', 'SW'),
+        'CATIA': ('CATIA', 'V5'),
+        'Pro/ENGINEER': ('Pro/ENGINEER', 'CREO', 'PTC'),
+        'AutoCAD': ('AutoCAD', 'ACAD'),
+        'Inventor': ('Inventor',),
+        'Fusion 360': ('Fusion',)
+    }
+
+    @staticmethod
+    def parse_binary_stl(buf):
+        """按结构化dtype一次性解析二进制STL数据，非二进制STL返回None"""
+        if len(buf) < 84:
+            return None
+
+        # 以文件大小校验二进制格式（部分二进制STL头部也以"solid"开头）
+        face_count = struct.unpack('<I', buf[80:84])[0]
+        if len(buf) != 84 + face_count * NXSTLProcessor._STL_DTYPE.itemsize:
+            return None
+
+        return np.frombuffer(buf, dtype=NXSTLProcessor._STL_DTYPE,
+                             count=face_count, offset=84)
+
+    @staticmethod
+    def to_indexed(vertices):
+        """三角形汤（每个面片独立3个顶点，(3F, 3)）合并为 顶点表 + 面片索引表
+
+        按顶点坐标的字节做 np.unique，顶点表按首次出现的顺序排列，与面片顺序保持局部性。
+        """
+        vertices = np.ascontiguousarray(vertices) + 0.0  # -0.0 归一为 0.0，避免按字节比较时拆开同一点
+        rows = vertices.view(np.dtype((np.void, vertices.dtype.itemsize * 3))).ravel()
+        _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return vertices[first[order]], rank[inverse.ravel()].reshape(-1, 3)
+
+    @staticmethod
+    def _read_header(file_path):
+        """一次stat加一次read读取STL头（80字节头 + 4字节面片数）和文件大小，按修改时间和大小缓存"""
+        st = os.stat(file_path)
+        return NXSTLProcessor._read_header_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _read_header_cached(file_path, mtime_ns, file_size):
+        with open(file_path, 'rb', buffering=1 << 17) as f:
+            return f.read(84), file_size
+
     @staticmethod
     def is_nx_stl(file_path):
         """检查是否为NX生成的STL文件"""
         try:
-            with open(file_path, 'rb') as f:
-                header = f.read(80)
-                # NX STL通常有特殊标识，但不同版本可能有不同
-                header_str = header.decode('ascii', errors='ignore')
-
-                # 更宽松的检查：NX标识可能在不同位置
-                # 1. 直接检查NX/Siemens/UG
-                if any(keyword in header_str for keyword in ['NX', 'Siemens', 'UG', 'Unigraphics']):
+            full_header, actual_file_size = NXSTLProcessor._read_header(file_path)
+            # NX STL通常有特殊标识，但不同版本可能有不同
+            header_str = full_header[:80].decode('ascii', errors='ignore')
+
+            # 更宽松的检查：NX标识可能在不同位置
+            # 1. 直接检查NX/Siemens/UG
+            if any(keyword in header_str for keyword in NXSTLProcessor._NX_INDICATORS):
+                return True
+
+            # 2. 检查常见的NX格式特征
+            # NX生成的STL通常有特定的格式模式
+            lines = header_str.strip().split('\n')
+            for line in lines:
+                if any(marker in line for marker in ['UNITS=', 'Units=', 'CREATED=', 'Created=']):
                     return True
 
-                # 2. 检查常见的NX格式特征
-                # NX生成的STL通常有特定的格式模式
-                lines = header_str.strip().split('\n')
-                for line in lines:
-                    if any(marker in line for marker in ['UNITS=', 'Units=', 'CREATED=', 'Created=']):
-                        return True
-
-                # 3. 如果是二进制STL，检查面片数
-                # 二进制STL: 80字节头 + 4字节面片数
-                f.seek(0)
-                full_header = f.read(84)
-                if len(full_header) == 84:
-                    # 检查是否有合理的面片数（小端存储）
-                    face_count = struct.unpack('<I', full_header[80:84])[0]
-                    # 如果面片数为0，可能不是有效的STL
-                    if face_count == 0:
-                        return False
-                    # 尝试读取一些面片来验证
-                    # 每个面片: 12字节法向量 + 36字节顶点 + 2字节属性
-                    face_size = 50
-                    expected_file_size = 84 + face_count * face_size
-                    actual_file_size = os.path.getsize(file_path)
-
-                    # 允许一定的误差（属性字节可能不同）
-                    if abs(expected_file_size - actual_file_size) <= 2:
-                        # 可能是有效的STL，但不是NX特定的
-                        return False
-
-                return False
+            # 3. 如果是二进制STL，检查面片数
+            # 二进制STL: 80字节头 + 4字节面片数
+            if len(full_header) == 84:
+                # 检查是否有合理的面片数（小端存储）
+                face_count = struct.unpack('<I', full_header[80:84])[0]
+                # 如果面片数为0，可能不是有效的STL
+                if face_count == 0:
+                    return False
+                # 尝试读取一些面片来验证
+                # 每个面片: 12字节法向量 + 36字节顶点 + 2字节属性
+                face_size = 50
+                expected_file_size = 84 + face_count * face_size
+
+                # 允许一定的误差（属性字节可能不同）
+                if abs(expected_file_size - actual_file_size) <= 2:
+                    # 可能是有效的STL，但不是NX特定的
+                    return False
+
+            return False
         except Exception as e:
             print(f"检查NX STL时出错: {e}")
             return False
@@ -2597,123 +3359,97 @@ class NXSTLProcessor:
             'part_name': None,
             'original_format': 'STL',
             'nx_specific': {},
-            'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            'file_size': 0
         }
 
         try:
-            with open(file_path, 'rb') as f:
-                # 读取头信息
-                header = f.read(84)  # 80字节头 + 4字节面片数
+            # 读取头信息（80字节头 + 4字节面片数）与文件大小
+            header, metadata['file_size'] = NXSTLProcessor._read_header(file_path)
 
-                # 解析头信息
-                header_str = header[:80].decode('ascii', errors='ignore')
+            # 解析头信息
+            header_str = header[:80].decode('ascii', errors='ignore')
 
-                # 检查是否是二进制STL
-                is_binary = False
-                if len(header) == 84:
-                    try:
-                        face_count = struct.unpack('<I', header[80:84])[0]
-                        # 如果是二进制STL，重置文件指针
-                        f.seek(84)  # 移动到数据开始处
-                        is_binary = True
-                        metadata['format'] = 'Binary STL'
-                        metadata['face_count'] = face_count
-                    except:
-                        metadata['format'] = 'ASCII STL'
-
-                # 更智能地检测NX文件
-                nx_indicators = ['NX', 'Siemens', 'UG', 'Unigraphics']
-                has_nx_indicator = any(indicator in header_str for indicator in nx_indicators)
-
-                # 检查特定的NX元数据格式
-                has_nx_metadata = False
-                nx_metadata_patterns = [
-                    r'UNITS\s*=\s*[A-Z]+',
-                    r'CREATED\s*=\s*[0-9\-]+',
-                    r'PART\s*=\s*.+',
-                    r'Part\s*=\s*.+'
-                ]
-
-                for pattern in nx_metadata_patterns:
-                    if re.search(pattern, header_str, re.IGNORECASE):
-                        has_nx_metadata = True
-                        break
+            # 检查是否是二进制STL
+            if len(header) == 84:
+                try:
+                    face_count = struct.unpack('<I', header[80:84])[0]
+                    metadata['format'] = 'Binary STL'
+                    metadata['face_count'] = face_count
+                except:
+                    metadata['format'] = 'ASCII STL'
 
-                # 如果是NX文件或具有NX特征
-                if has_nx_indicator or has_nx_metadata:
-                    metadata['is_nx'] = True
-                    metadata['original_format'] = 'NX STL'
-
-                    # 提取可能的NX信息
-                    lines = header_str.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # 单位信息
-                        if 'UNITS=' in line.upper() or 'Units=' in line:
-                            if 'MM' in line.upper():
-                                metadata['units'] = '毫米'
-                            elif 'IN' in line.upper():
-                                metadata['units'] = '英寸'
-                            elif 'M' in line.upper():
-                                metadata['units'] = '米'
-                            elif 'CM' in line.upper():
-                                metadata['units'] = '厘米'
-
-                        # 创建日期
-                        elif 'CREATED=' in line.upper() or 'Created=' in line:
-                            date_match = re.search(r'\d{4}[-/]\d{2}[-/]\d{2}', line)
-                            if date_match:
-                                metadata['creation_date'] = date_match.group()
-
-                        # 零件名称
-                        elif 'PART=' in line.upper() or 'Part=' in line:
-                            part_match = re.search(r'[Pp]art[:=]\s*(.+)', line)
-                            if part_match:
-                                metadata['part_name'] = part_match.group(1).strip()
-                            else:
-                                # 尝试直接提取等号后的内容
-                                parts = line.split('=')
-                                if len(parts) > 1:
-                                    metadata['part_name'] = parts[1].strip()
-
-                        # 作者信息
-                        elif 'AUTHOR=' in line.upper() or 'Author=' in line:
-                            author_match = re.search(r'[Aa]uthor[:=]\s*(.+)', line)
-                            if author_match:
-                                metadata['author'] = author_match.group(1).strip()
-
-                        # 版本信息
-                        elif 'VERSION=' in line.upper() or 'Version=' in line:
-                            version_match = re.search(r'[Vv]ersion[:=]\s*(.+)', line)
-                            if version_match:
-                                metadata['version'] = version_match.group(1).strip()
-
-                        # 公差信息
-                        elif 'TOLERANCE=' in line.upper() or 'Tolerance=' in line:
-                            tol_match = re.search(r'[Tt]olerance[:=]\s*([0-9.]+)', line)
-                            if tol_match:
-                                metadata['nx_specific']['tolerance'] = float(tol_match.group(1))
-
-                # 如果没有检测到NX特征，尝试其他CAD格式
-                else:
-                    # 检查其他CAD系统的特征
-                    other_cad_indicators = {
-                        'SolidWorks': ['SolidWorks', 'SW'],
-                        'CATIA': ['CATIA', 'V5'],
-                        'Pro/ENGINEER': ['Pro/ENGINEER', 'CREO', 'PTC'],
-                        'AutoCAD': ['AutoCAD', 'ACAD'],
-                        'Inventor': ['Inventor'],
-                        'Fusion 360': ['Fusion']
-                    }
-
-                    for cad_name, indicators in other_cad_indicators.items():
-                        if any(indicator in header_str for indicator in indicators):
-                            metadata['original_format'] = f'{cad_name} STL'
-                            metadata['cad_system'] = cad_name
-                            break
+            # 更智能地检测NX文件
+            has_nx_indicator = any(indicator in header_str for indicator in NXSTLProcessor._NX_INDICATORS)
+
+            # 检查特定的NX元数据格式
+            has_nx_metadata = NXSTLProcessor._NX_METADATA_RE.search(header_str) is not None
+
+            # 如果是NX文件或具有NX特征
+            if has_nx_indicator or has_nx_metadata:
+                metadata['is_nx'] = True
+                metadata['original_format'] = 'NX STL'
+
+                # 提取可能的NX信息
+                lines = header_str.split('\n')
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    # 单位信息
+                    if 'UNITS=' in line.upper() or 'Units=' in line:
+                        if 'MM' in line.upper():
+                            metadata['units'] = '毫米'
+                        elif 'IN' in line.upper():
+                            metadata['units'] = '英寸'
+                        elif 'M' in line.upper():
+                            metadata['units'] = '米'
+                        elif 'CM' in line.upper():
+                            metadata['units'] = '厘米'
+
+                    # 创建日期
+                    elif 'CREATED=' in line.upper() or 'Created=' in line:
+                        date_match = NXSTLProcessor._DATE_RE.search(line)
+                        if date_match:
+                            metadata['creation_date'] = date_match.group()
+
+                    # 零件名称
+                    elif 'PART=' in line.upper() or 'Part=' in line:
+                        part_match = NXSTLProcessor._PART_RE.search(line)
+                        if part_match:
+                            metadata['part_name'] = part_match.group(1).strip()
+                        else:
+                            # 尝试直接提取等号后的内容
+                            parts = line.split('=')
+                            if len(parts) > 1:
+                                metadata['part_name'] = parts[1].strip()
+
+                    # 作者信息
+                    elif 'AUTHOR=' in line.upper() or 'Author=' in line:
+                        author_match = NXSTLProcessor._AUTHOR_RE.search(line)
+                        if author_match:
+                            metadata['author'] = author_match.group(1).strip()
+
+                    # 版本信息
+                    elif 'VERSION=' in line.upper() or 'Version=' in line:
+                        version_match = NXSTLProcessor._VERSION_RE.search(line)
+                        if version_match:
+                            metadata['version'] = version_match.group(1).strip()
+
+                    # 公差信息
+                    elif 'TOLERANCE=' in line.upper() or 'Tolerance=' in line:
+                        tol_match = NXSTLProcessor._TOLERANCE_RE.search(line)
+                        if tol_match:
+                            metadata['nx_specific']['tolerance'] = float(tol_match.group(1))
+
+            # 如果没有检测到NX特征，尝试其他CAD格式
+            else:
+                # 检查其他CAD系统的特征
+                for cad_name, indicators in NXSTLProcessor._OTHER_CAD_INDICATORS.items():
+                    if any(indicator in header_str for indicator in indicators):
+                        metadata['original_format'] = f'{cad_name} STL'
+                        metadata['cad_system'] = cad_name
+                        break
 
             return metadata
         except Exception as e:
@@ -2726,14 +3462,37 @@ class NXSTLProcessor:
     def load_stl_with_metadata(file_path, force_nx_processing=False):
         """加载STL文件并尝试提取元数据"""
         try:
-            if not TRIMESH_AVAILABLE:
+            if not is_trimesh_available():
                 raise ImportError("需要安装trimesh库")
 
             # 读取元数据
             metadata = NXSTLProcessor.read_nx_stl_metadata(file_path)
 
-            # 使用trimesh加载模型
-            mesh = trimesh.load(file_path)
+            # 按 (路径, 大小, 修改时间) 查找网格缓存，命中时不读取文件内容
+            trimesh = _lazy('trimesh')
+            cache_key = NXSTLProcessor._mesh_cache_key(file_path)
+
+            mesh = NXSTLProcessor._load_cached_mesh(cache_key)
+            if mesh is None:
+                with open(file_path, 'rb') as f:
+                    buf = f.read()
+
+                # 二进制STL直接由面片数组构建网格，ASCII等其他格式交给trimesh解析
+                records = NXSTLProcessor.parse_binary_stl(buf)
+                if records is not None and np.isfinite(records['vertices']).all():
+                    # 面片记录是三角形汤，先去重为索引形式，trimesh 无需再合并顶点
+                    vertices, faces = NXSTLProcessor.to_indexed(records['vertices'].reshape(-1, 3))
+                    mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+                elif records is not None:
+                    vertices = records['vertices'].reshape(-1, 3)
+                    faces = np.arange(len(vertices)).reshape(-1, 3)
+                    mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+                else:
+                    mesh = trimesh.load(file_path)
+                NXSTLProcessor._save_cached_mesh(cache_key, mesh)
+
+                # 与缓存命中时同样由处理后的顶点/面片数组构建，两条路径得到的网格一致
+                mesh = NXSTLProcessor._mesh_from_arrays(mesh.vertices, mesh.faces)
 
             # 添加元数据到网格属性
             if hasattr(mesh, 'metadata'):
@@ -2762,7 +3521,7 @@ class NXSTLProcessor:
             print(f"加载STL文件失败: {e}")
             # 尝试基本的加载方式
             try:
-                mesh = trimesh.load(file_path)
+                mesh = _lazy('trimesh').load(file_path)
                 mesh.metadata = {
                     'is_nx': False,
                     'units': '毫米',
@@ -2775,17 +3534,97 @@ class NXSTLProcessor:
                 return None
 
     @staticmethod
-    def analyze_mesh_features(mesh):
-        """分析网格特征"""
+    def _mesh_cache_key(file_path):
+        """网格缓存键：由绝对路径、文件大小和修改时间得到，无需读取和哈希整个文件"""
+        stat = os.stat(file_path)
+        identity = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _mesh_from_arrays(vertices, faces):
+        """由已处理的顶点/面片数组构建网格（缓存命中与未命中共用）"""
+        return _lazy('trimesh').Trimesh(vertices=vertices, faces=faces, process=False)
+
+    @staticmethod
+    def _load_cached_mesh(cache_key):
+        """从网格缓存读取顶点和面片，未命中返回None"""
+        cache_file = AppConfig.CACHE_DIR / f"{cache_key}.npz"
+        if not cache_file.exists():
+            return None
+
+        try:
+            with np.load(cache_file) as data:
+                mesh = NXSTLProcessor._mesh_from_arrays(data['vertices'], data['faces'])
+            # 更新修改时间作为最近使用时间，供淘汰时排序
+            os.utime(cache_file)
+            return mesh
+        except (OSError, ValueError, KeyError) as e:
+            print(f"读取网格缓存失败: {e}")
+            return None
+
+    @staticmethod
+    def _save_cached_mesh(cache_key, mesh):
+        """以npz格式缓存处理后的顶点和面片（单位转换前），并把缓存总大小控制在上限内"""
+        try:
+            AppConfig.CACHE_DIR.mkdir(exist_ok=True, parents=True)
+            np.savez_compressed(AppConfig.CACHE_DIR / f"{cache_key}.npz",
+                                vertices=mesh.vertices, faces=mesh.faces)
+        except (OSError, AttributeError) as e:
+            print(f"写入网格缓存失败: {e}")
+            return
+        NXSTLProcessor._evict_mesh_cache()
+
+    @staticmethod
+    def _evict_mesh_cache(max_bytes=None):
+        """缓存总大小超过上限时，按最近使用时间从旧到新删除（保留最新的一个）"""
+        if max_bytes is None:
+            max_bytes = AppConfig.MESH_CACHE_MAX_BYTES
+        entries = []
+        for cache_file in AppConfig.CACHE_DIR.glob('*.npz'):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, cache_file))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, cache_file in sorted(entries)[:-1]:
+            if total <= max_bytes:
+                break
+            try:
+                cache_file.unlink()
+                total -= size
+            except OSError as e:
+                print(f"清理网格缓存失败: {e}")
+
+    # 质量属性由一次积分同时得到，请求其中任一项即整体计算
+    _MASS_PROPERTY_FEATURES = ('volume', 'surface_area', 'center_mass', 'inertia')
+
+    @staticmethod
+    def analyze_mesh_features(mesh, needs=None):
+        """分析网格特征
+
+        needs 为需要计算的字段名集合（如 ('bounding_box', 'surface_area')），None 表示全部；
+        顶点数、面片数总是返回，未请求的字段为 None。trimesh 的 is_convex 等属性
+        首次访问时才计算，按需跳过可避免无用的凸性/水密性检查。
+        """
         if mesh is None:
             return {}
 
+        def wanted(name):
+            return needs is None or name in needs
+
+        def flag(name):
+            if not wanted(name):
+                return None
+            return getattr(mesh, name) if hasattr(mesh, name) else False
+
         features = {
             'triangle_count': len(mesh.faces) if hasattr(mesh, 'faces') else 0,
             'vertex_count': len(mesh.vertices) if hasattr(mesh, 'vertices') else 0,
-            'is_watertight': mesh.is_watertight if hasattr(mesh, 'is_watertight') else False,
-            'is_closed': mesh.is_closed if hasattr(mesh, 'is_closed') else False,
-            'is_convex': mesh.is_convex if hasattr(mesh, 'is_convex') else False,
+            'is_watertight': flag('is_watertight'),
+            'is_closed': flag('is_closed'),
+            'is_convex': flag('is_convex'),
             'bounding_box': None,
             'volume': None,
             'surface_area': None,
@@ -2793,10 +3632,9 @@ class NXSTLProcessor:
             'inertia': None
         }
 
-        # 计算边界框
-        if hasattr(mesh, 'vertices') and len(mesh.vertices) > 0:
-            min_coords = np.min(mesh.vertices, axis=0)
-            max_coords = np.max(mesh.vertices, axis=0)
+        # 计算边界框（一次扫描同时得到最小值和最大值）
+        if wanted('bounding_box') and hasattr(mesh, 'vertices') and len(mesh.vertices) > 0:
+            min_coords, max_coords = _bounding_box_kernel(np.ascontiguousarray(mesh.vertices, dtype=float))
             features['bounding_box'] = {
                 'min': min_coords.tolist(),
                 'max': max_coords.tolist(),
@@ -2804,16 +3642,15 @@ class NXSTLProcessor:
                 'center': ((min_coords + max_coords) / 2).tolist()
             }
 
-        # 计算体积和表面积
+        # 计算体积和表面积（表面积、体积、质心、惯性张量共用一次面片叉积）
         try:
-            if hasattr(mesh, 'volume'):
-                features['volume'] = mesh.volume
-            if hasattr(mesh, 'area'):
-                features['surface_area'] = mesh.area
-            if hasattr(mesh, 'center_mass'):
-                features['center_mass'] = mesh.center_mass.tolist()
-            if hasattr(mesh, 'moment_inertia'):
-                features['inertia'] = mesh.moment_inertia.tolist()
+            mass_properties = any(wanted(name) for name in NXSTLProcessor._MASS_PROPERTY_FEATURES)
+            if mass_properties and features['triangle_count'] > 0 and features['vertex_count'] > 0:
+                area, volume, center, inertia = _mesh_mass_properties(mesh.vertices, mesh.faces)
+                features['volume'] = volume
+                features['surface_area'] = area
+                features['center_mass'] = center.tolist()
+                features['inertia'] = inertia.tolist()
         except Exception as e:
             print(f"计算网格特征时出错: {e}")
 
@@ -2922,8 +3759,8 @@ ENDPROC"""
 
     @staticmethod
     def generate_advanced_polishing_cycle(stage, path_data, force_control=False, synchronization=False):
-        """生成高级抛光循环"""
-        code = f"""PROC AdvancedPolishing_{stage.capitalize()}()
+        """生成高级抛光循环（各段之间空一行，收集后一次拼接）"""
+        parts = [f"""PROC AdvancedPolishing_{stage.capitalize()}()
     ! 高级{stage}抛光循环
 
     VAR num nPathIndex := 1;
@@ -2934,18 +3771,14 @@ ENDPROC"""
     IF bForceControlActive THEN
         ForceDef fPolishing_{stage}, [[0, 0, nForceSetpoint]], tPolishingTool;
         ForceAct fPolishing_{stage};
-    ENDIF"""
+    ENDIF"""]
 
         if synchronization:
-            code += """
-
-    ! 同步运动初始化
+            parts.append("""    ! 同步运动初始化
     VAR syncident syncExternal;
-    SyncMoveOn syncExternal, \\Tool:=tPolishingTool;"""
-
-        code += f"""
+    SyncMoveOn syncExternal, \\Tool:=tPolishingTool;""")
 
-    ! 主抛光循环
+        parts.append(f"""    ! 主抛光循环
     FOR nPathIndex FROM 1 TO {len(path_data.get('points', []))} DO
         ! 移动到目标点
         MoveL IndPos(pPathStart, nPathIndex-1), v{stage.capitalize()}, zMedium, tPolishingTool \\WObj:=wWorkpiece;
@@ -2957,26 +3790,20 @@ ENDPROC"""
 
         ! 等待抛光时间
         WaitTime 0.1;
-    ENDFOR"""
+    ENDFOR""")
 
         if synchronization:
-            code += """
-
-    ! 结束同步运动
-    SyncMoveOff syncExternal;"""
+            parts.append("""    ! 结束同步运动
+    SyncMoveOff syncExternal;""")
 
         if force_control:
-            code += """
-
-    ! 禁用力控制
-    StopForce;"""
-
-        code += """
+            parts.append("""    ! 禁用力控制
+    StopForce;""")
 
-    TPWrite "高级抛光循环完成";
-ENDPROC"""
+        parts.append("""    TPWrite "高级抛光循环完成";
+ENDPROC""")
 
-        return code
+        return "\n\n".join(parts)
 
 
 # ==================== 工业级RAPID代码生成器 ====================
@@ -3046,6 +3873,18 @@ ENDPROC""",
         'wait_instruction': """    WaitTime {wait_time:.1f};"""
     }
 
+    # 模板的已绑定 format 方法，按属性取用：_FORMATTERS.tool_data(**params)
+    _FORMATTERS = collections.namedtuple('RAPIDFormatters', RAPID_TEMPLATES)(
+        *(template.format for template in RAPID_TEMPLATES.values()))
+
+    # robtarget模板预解析结果 (字面文本, 字段名, 格式说明, 转换)
+    _ROBTARGET_FIELDS = tuple(string.Formatter().parse(RAPID_TEMPLATES['robtarget']))
+
+    # 运动指令模板预转换为 % 格式串，字段按模板顺序：目标点, 速度, 区域, 工具, 工件坐标系
+    _MOVE_FIELDS = dict.fromkeys(('target_name', 'speed_data', 'zone_data', 'tool_name', 'wobj_name'), '%s')
+    _MOVEL_FORMAT = RAPID_TEMPLATES['move_instruction'].format(**_MOVE_FIELDS)
+    _MOVEJ_FORMAT = RAPID_TEMPLATES['movej_instruction'].format(**_MOVE_FIELDS)
+
     # 机器人安全位置配置
     SAFE_POSITIONS = {
         'home': {'x': 0, 'y': 0, 'z': 1000, 'q': [1, 0, 0, 0]},
@@ -3053,10 +3892,44 @@ ENDPROC""",
         'load': {'x': 300, 'y': 300, 'z': 600, 'q': [0.707, 0, 0.707, 0]}
     }
 
+    # 数据声明段只依赖这些参数（不含时间戳和路径），按取值缓存
+    _DECLARATION_KEYS = (
+        'tool_name', 'tool_length', 'tool_mass', 'inertia_ix', 'inertia_iy', 'inertia_iz',
+        'wobj_name', 'wobj_uframe', 'wobj_offset_x', 'wobj_offset_y', 'wobj_offset_z',
+        'rough_speed', 'fine_speed'
+    )
+
+    # 含这些关键指令、且不是注释的行之后添加空行（_format_program 使用）
+    _BLANK_AFTER_RE = re.compile(
+        r'^(?![^\S\n]*!).*(?:PROC |ENDPROC|MoveJ |MoveL |TPWrite|IF |WHILE|FOR |ENDFOR).*$', re.MULTILINE)
+
+    # 程序签名的固定部分，生成时间戳夹在中间
+    _SIGNATURE_HEAD = f"""
+! ========================================================
+! 程序签名
+! 生成工具: ABB Polishing Studio {AppConfig.VERSION}
+! 数学建模: PolishingMathematicalModel
+! 高级功能: AdvancedRAPIDFeatures
+! 版权所有: {AppConfig.AUTHOR}
+! 生成时间: """
+    _SIGNATURE_TAIL = """
+! ========================================================"""
+
+    # 特征点去重容差（mm），与robtarget位置输出精度 %.3f 一致
+    _FEATURE_POINT_EPSILON = 1e-3
+    _FEATURE_POINT_LIMIT = 20
+
     def __init__(self, logger=None):
         self.logger = logger
-        self.math_model = PolishingMathematicalModel()
-        self.advanced_features = AdvancedRAPIDFeatures()
+        self.math_model = PolishingMathematicalModel
+        self.advanced_features = AdvancedRAPIDFeatures
+        self._declarations_cache = (None, "")
+        self.refresh_timestamp()
+
+    def refresh_timestamp(self, timestamp=None):
+        """更新本次生成使用的时间戳（头部与签名共用，批量生成时可传入统一值）"""
+        self._run_timestamp = timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._run_timestamp
 
     def generate_complete_program(self, program_data):
         """生成完整的RAPID程序"""
@@ -3064,46 +3937,39 @@ ENDPROC""",
             if self.logger:
                 self.logger.info(f"开始生成工业级RAPID程序: {program_data.get('program_name')}")
 
-            # 1. 生成模块头部
-            module_header = self._generate_module_header(program_data)
+            # 每次生成只取一次时间，program_data 可指定 'timestamp'
+            self.refresh_timestamp(program_data.get('timestamp'))
 
-            # 2. 生成数据声明
-            data_declarations = self._generate_data_declarations(program_data)
+            advanced = program_data.get('enable_advanced_features', False)
 
-            # 3. 生成目标点定义
-            target_points = self._generate_target_points(program_data)
+            # 1-2. 模块头部与数据声明（头部自带结尾换行）
+            sections = [
+                self._generate_module_header(program_data) + "\n" +
+                self._generate_data_declarations(program_data)
+            ]
+
+            # 3. 生成高级功能定义（如果启用）
+            if advanced:
+                sections.append(self._generate_advanced_declarations(program_data))
 
-            # 4. 生成高级功能定义（如果启用）
-            advanced_declarations = ""
-            if program_data.get('enable_advanced_features', False):
-                advanced_declarations = self._generate_advanced_declarations(program_data)
+            # 4. 生成目标点定义
+            sections.append(self._generate_target_points(program_data))
 
             # 5. 生成子程序
-            subprograms = self._generate_subprograms(program_data)
+            sections.append(self._generate_subprograms(program_data))
 
             # 6. 生成高级子程序（如果启用）
-            advanced_subprograms = ""
-            if program_data.get('enable_advanced_features', False):
-                advanced_subprograms = self._generate_advanced_subprograms(program_data)
+            if advanced:
+                sections.append(self._generate_advanced_subprograms(program_data))
 
             # 7. 生成主程序
-            main_program = self._generate_main_program(program_data)
+            sections.append(self._generate_main_program(program_data))
 
             # 8. 生成工具函数
-            utility_functions = self._generate_utility_functions(program_data)
-
-            # 9. 组合所有部分
-            complete_program = (
-                    module_header + "\n" +
-                    data_declarations + "\n\n" +
-                    advanced_declarations + "\n\n" +
-                    target_points + "\n\n" +
-                    subprograms + "\n\n" +
-                    advanced_subprograms + "\n\n" +
-                    main_program + "\n\n" +
-                    utility_functions + "\n"
-                                        "ENDMODULE"
-            )
+            sections.append(self._generate_utility_functions(program_data) + "\nENDMODULE")
+
+            # 9. 只拼接非空段，段间空一行
+            complete_program = "\n\n".join(section for section in sections if section)
 
             # 10. 格式化和验证
             complete_program = self._format_program(complete_program)
@@ -3126,7 +3992,7 @@ ENDPROC""",
         """生成模块头部"""
         params = {
             'module_name': data.get('program_name', 'Polishing_Program'),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': self._run_timestamp,
             'robot_model': data.get('robot_model', 'IRB 2600-12/1.85'),
             'tool_name': data.get('tool_name', 'tPolishingTool'),
             'tool_diameter': data.get('tool_diameter', 8.0),
@@ -3134,10 +4000,21 @@ ENDPROC""",
             'feature_count': data.get('feature_count', 0),
             'optimization_level': data.get('optimization_level', '高级数学建模')
         }
-        return self.RAPID_TEMPLATES['module_header'].format(**params)
+        return self._FORMATTERS.module_header(**params)
 
     def _generate_data_declarations(self, data):
-        """生成数据声明"""
+        """生成数据声明（参数未变时直接复用上次的结果）"""
+        key = tuple((name, data[name]) for name in self._DECLARATION_KEYS if name in data)
+        cached_key, cached_text = self._declarations_cache
+        if key == cached_key:
+            return cached_text
+
+        text = self._build_data_declarations(data)
+        self._declarations_cache = (key, text)
+        return text
+
+    def _build_data_declarations(self, data):
+        """拼接工具、工件、速度、区域、安全位置和IO声明"""
         declarations = []
 
         # 工具数据
@@ -3150,7 +4027,7 @@ ENDPROC""",
             'inertia_iy': data.get('inertia_iy', 0.001),
             'inertia_iz': data.get('inertia_iz', 0.001)
         }
-        declarations.append(self.RAPID_TEMPLATES['tool_data'].format(**tool_params))
+        declarations.append(self._FORMATTERS.tool_data(**tool_params))
 
         # 工件坐标系
         wobj_params = {
@@ -3161,14 +4038,14 @@ ENDPROC""",
             'wobj_offset_z': data.get('wobj_offset_z', 0.0),
             'wobj_q1': 1.0, 'wobj_q2': 0.0, 'wobj_q3': 0.0, 'wobj_q4': 0.0
         }
-        declarations.append(self.RAPID_TEMPLATES['wobj_data'].format(**wobj_params))
+        declarations.append(self._FORMATTERS.wobj_data(**wobj_params))
 
         # 速度数据
         speed_params = {
             'rough_speed': data.get('rough_speed', 300),
             'fine_speed': data.get('fine_speed', 200)
         }
-        declarations.append(self.RAPID_TEMPLATES['speed_data'].format(**speed_params))
+        declarations.append(self._FORMATTERS.speed_data(**speed_params))
 
         # 区域数据
         declarations.append(self.RAPID_TEMPLATES['zone_data'])
@@ -3238,20 +4115,10 @@ PERS num nToolWearFactor := 0.001;""")
 
     def _generate_safe_positions(self):
         """生成安全位置"""
-        safe_positions = []
-
-        for name, pos in self.SAFE_POSITIONS.items():
-            target_params = {
-                'point_name': f'p{name.capitalize()}',
-                'x': pos['x'],
-                'y': pos['y'],
-                'z': pos['z'],
-                'q1': pos['q'][0],
-                'q2': pos['q'][1],
-                'q3': pos['q'][2],
-                'q4': pos['q'][3]
-            }
-            safe_positions.append(self.RAPID_TEMPLATES['robtarget'].format(**target_params))
+        names = [f'p{name.capitalize()}' for name in self.SAFE_POSITIONS]
+        positions = np.array([[pos['x'], pos['y'], pos['z']] for pos in self.SAFE_POSITIONS.values()], dtype=float)
+        orientations = np.array([pos['q'] for pos in self.SAFE_POSITIONS.values()], dtype=float)
+        safe_positions = self._format_robtargets(names, positions, orientations)
 
         return "! 安全位置定义\n" + "\n".join(safe_positions)
 
@@ -3286,44 +4153,81 @@ PERS forcedata fFinePolishing := [1, [[0, 0, 0.3], [1, 0, 0, 0]], 30, 9E9];"""
         # 特征点定义
         if feature_points:
             targets.append("! 特征点定义")
-            for i, point in enumerate(feature_points[:20]):  # 限制数量
-                position = point.get('position', [0, 0, 0])
-                orientation = point.get('orientation', [1, 0, 0, 0])
-                target_params = {
-                    'point_name': f'P_Feature_{i:03d}',
-                    'x': position[0],
-                    'y': position[1],
-                    'z': position[2],
-                    'q1': orientation[0],
-                    'q2': orientation[1],
-                    'q3': orientation[2],
-                    'q4': orientation[3]
-                }
-                targets.append(self.RAPID_TEMPLATES['robtarget'].format(**target_params))
+            feature_points = self._unique_feature_points(feature_points, self._FEATURE_POINT_LIMIT)  # 去重并限制数量
+            positions = np.array([point.get('position', [0, 0, 0]) for point in feature_points], dtype=float)
+            orientations = np.array([point.get('orientation', [1, 0, 0, 0]) for point in feature_points], dtype=float)
+            names = np.char.mod('P_Feature_%03d', np.arange(len(feature_points)))
+            targets.extend(self._format_robtargets(names, positions, orientations))
 
         # 路径点定义
         for stage in ['rough', 'fine']:
             if stage in paths and paths[stage]:
+                buffer = PathBuffer.from_paths(paths[stage])
                 targets.append(f"\n! {stage.capitalize()}抛光目标点")
-                for path_idx, path in enumerate(paths[stage][:5]):  # 限制数量
-                    points = path.get('points', [])
-                    for point_idx, point in enumerate(points[:10]):  # 每个路径最多10个点
-                        position = point.get('position', [0, 0, 0])
-                        orientation = point.get('orientation', [1, 0, 0, 0])
-                        target_params = {
-                            'point_name': f'P_{stage[:1].upper()}{path_idx:02d}_{point_idx:03d}',
-                            'x': position[0],
-                            'y': position[1],
-                            'z': position[2],
-                            'q1': orientation[0],
-                            'q2': orientation[1],
-                            'q3': orientation[2],
-                            'q4': orientation[3]
-                        }
-                        targets.append(self.RAPID_TEMPLATES['robtarget'].format(**target_params))
+
+                names, spans = [], []
+                for path_idx, source in enumerate(buffer.sources):
+                    if source >= 5:  # 限制数量：只取原列表前5条路径
+                        break
+                    span = buffer.path_slice(path_idx)
+                    span = slice(span.start, min(span.stop, span.start + 10))  # 每个路径最多10个点
+                    spans.append(np.arange(span.start, span.stop))
+                    # 点名 P_R00_000：原路径下标前缀 + 三位点序号，整列拼接
+                    point_numbers = np.char.zfill(np.arange(span.stop - span.start).astype(str), 3)
+                    names.append(np.char.add(f'P_{stage[:1].upper()}{source:02d}_', point_numbers))
+
+                # 前几条路径都没有点时只保留阶段标题
+                if spans:
+                    indices = np.concatenate(spans)
+                    targets.extend(self._format_robtargets(
+                        np.concatenate(names), buffer.positions[indices], buffer.orientations[indices]))
 
         return "\n".join(targets) if targets else "! 没有生成目标点"
 
+    @classmethod
+    def _unique_feature_points(cls, feature_points, limit):
+        """按 ε 网格去除重复/近重复的特征点，保留首次出现的点，凑满 limit 个即停止"""
+        scale = 1.0 / cls._FEATURE_POINT_EPSILON
+        seen = set()
+        unique_points = []
+        for point in feature_points:
+            position = point.get('position', [0, 0, 0])
+            orientation = point.get('orientation', [1, 0, 0, 0])
+            # 位置落在同一 ε 网格且姿态在输出精度内相同，视为同一目标点
+            key = (tuple(round(float(c) * scale) for c in position) +
+                   tuple(round(float(q), 6) for q in orientation))
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_points.append(point)
+            if len(unique_points) >= limit:
+                break
+        return unique_points
+
+    @classmethod
+    def _format_robtargets(cls, names, positions, orientations):
+        """按列向量化格式化robtarget定义，返回字符串列表"""
+        if len(names) == 0:
+            return []
+
+        columns = {
+            'point_name': np.asarray(names),
+            'x': positions[:, 0], 'y': positions[:, 1], 'z': positions[:, 2],
+            'q1': orientations[:, 0], 'q2': orientations[:, 1],
+            'q3': orientations[:, 2], 'q4': orientations[:, 3]
+        }
+
+        # 依模板字段顺序拼接：字面文本 + 按格式说明整列格式化的数值
+        lines = np.asarray('')
+        for literal, field_name, format_spec, _ in cls._ROBTARGET_FIELDS:
+            lines = np.char.add(lines, literal)
+            if field_name is not None:
+                column = columns[field_name]
+                formatted = np.char.mod('%' + format_spec, column) if format_spec else column
+                lines = np.char.add(lines, formatted)
+
+        return lines.tolist()
+
     def _generate_subprograms(self, data):
         """生成子程序"""
         subprograms = []
@@ -3558,15 +4462,17 @@ ENDPROC"""
         proc_name = f"Polishing_{stage.capitalize()}"
         description = f"{stage.capitalize()}抛光工艺流程"
 
+        # 各段依次收集，最后按换行一次拼接
+        parts = []
+
         # 程序头部
-        proc_content = self.RAPID_TEMPLATES['proc_header'].format(
+        parts.append(self._FORMATTERS.proc_header(
             proc_name=proc_name,
             description=description
-        )
+        ))
 
         # 安全检查
-        proc_content += """
-    ! 安全检查
+        parts.append("""    ! 安全检查
     IF diEmergencyStop = 0 THEN
         TPWrite "紧急停止激活!";
         EmergencyStop;
@@ -3583,11 +4489,10 @@ ENDPROC"""
         TPWrite "工件不在位!";
         Stop;
         RETURN;
-    ENDIF"""
+    ENDIF""")
 
         # 启动设备
-        proc_content += """
-    ! 启动抛光设备
+        parts.append("""    ! 启动抛光设备
     TPWrite "启动抛光设备...";
     SetDO doSpindleStart, 1;
     SetDO doCoolantOn, 1;
@@ -3600,76 +4505,59 @@ ENDPROC"""
         SetDO doCoolantOn, 0;
         Stop;
         RETURN;
-    ENDIF"""
+    ENDIF""")
 
         # 移动到安全位置
-        proc_content += """
-    ! 移动到安全位置
-    MoveJ pSafe, vFast, zLarge, tPolishingTool \\WObj:=wWorkpiece;"""
+        parts.append("""    ! 移动到安全位置
+    MoveJ pSafe, vFast, zLarge, tPolishingTool \\WObj:=wWorkpiece;""")
 
         # 添加抛光路径
         paths = data.get('paths', {}).get(stage, [])
         if paths:
-            proc_content += f"""
-    ! 执行{stage}抛光
-    TPWrite "开始{stage}抛光...";"""
-
-            for path_idx, path in enumerate(paths[:3]):  # 最多3个路径
-                points = path.get('points', [])
-                if points:
-                    proc_content += f"""
-    ! 路径 {path_idx + 1}
-    TPWrite "执行路径 {path_idx + 1}...";"""
-
-                    # 添加入刀点
-                    if len(points) > 0:
-                        lead_in_point = {
-                            'position': [
-                                points[0]['position'][0],
-                                points[0]['position'][1],
-                                points[0]['position'][2] + data.get('safety_height', 50.0)
-                            ],
-                            'orientation': points[0]['orientation']
-                        }
-
-                        # 移动到入刀点
-                        target_name = f'P_LeadIn_{stage[:1].upper()}{path_idx:02d}'
-                        move_params = {
-                            'target_name': target_name,
-                            'speed_data': 'vApproach',
-                            'zone_data': 'zMedium',
-                            'tool_name': data.get('tool_name', 'tPolishingTool'),
-                            'wobj_name': data.get('wobj_name', 'wWorkpiece')
-                        }
-                        proc_content += "\n    " + self.RAPID_TEMPLATES['movej_instruction'].format(**move_params)
-
-                    # 添加路径点
-                    for i in range(min(5, len(points))):  # 每个路径最多5个点
-                        target_name = f'P_{stage[:1].upper()}{path_idx:02d}_{i:03d}'
-                        speed_data = 'vRough' if stage == 'rough' else 'vFine'
-                        zone_data = 'zMedium' if stage == 'rough' else 'zFine'
-                        move_params = {
-                            'target_name': target_name,
-                            'speed_data': speed_data,
-                            'zone_data': zone_data,
-                            'tool_name': data.get('tool_name', 'tPolishingTool'),
-                            'wobj_name': data.get('wobj_name', 'wWorkpiece')
-                        }
-                        proc_content += "\n    " + self.RAPID_TEMPLATES['move_instruction'].format(**move_params)
+            buffer = PathBuffer.from_paths(paths)
+            parts.append(f"""    ! 执行{stage}抛光
+    TPWrite "开始{stage}抛光...";""")
+
+            # 循环内不变的指令参数
+            prefix = stage[:1].upper()
+            speed_data = 'vRough' if stage == 'rough' else 'vFine'
+            zone_data = 'zMedium' if stage == 'rough' else 'zFine'
+            tool_name = data.get('tool_name', 'tPolishingTool')
+            wobj_name = data.get('wobj_name', 'wWorkpiece')
+
+            for path_idx, source in enumerate(buffer.sources):
+                if source >= 3:  # 最多3个路径（按原列表下标）
+                    break
+                span = buffer.path_slice(path_idx)
+                point_count = span.stop - span.start
+                if point_count:
+                    parts.append(f"""    ! 路径 {source + 1}
+    TPWrite "执行路径 {source + 1}...";""")
+
+                    # 移动到入刀点
+                    target_name = f'P_LeadIn_{prefix}{source:02d}'
+                    parts.append("    " + self._MOVEJ_FORMAT % (
+                        target_name, 'vApproach', 'zMedium', tool_name, wobj_name))
+
+                    # 添加路径点（每个路径最多5个点）
+                    parts.extend(
+                        "    " + self._MOVEL_FORMAT % (
+                            f'P_{prefix}{source:02d}_{i:03d}', speed_data, zone_data, tool_name, wobj_name)
+                        for i in range(min(5, point_count))
+                    )
 
         # 停止设备
-        proc_content += """
-    ! 停止抛光设备
+        parts.append("""    ! 停止抛光设备
     SetDO doSpindleStart, 0;
     SetDO doCoolantOn, 0;
 
     ! 返回安全位置
-    MoveJ pSafe, vFast, zLarge, tPolishingTool \\WObj:=wWorkpiece;"""
+    MoveJ pSafe, vFast, zLarge, tPolishingTool \\WObj:=wWorkpiece;""")
 
-        # 程序尾部
-        proc_content += "\n\n" + self.RAPID_TEMPLATES['proc_footer'].format(proc_name=proc_name)
+        # 程序尾部（与上一段之间空一行）
+        parts.append("\n" + self._FORMATTERS.proc_footer(proc_name=proc_name))
 
-        return proc_content
+        return "\n".join(parts)
 
     def _generate_toolchange_procedure(self):
         """生成工具更换子程序"""
@@ -3733,8 +4621,24 @@ ENDPROC"""
 ENDPROC"""
 
     def _generate_main_program(self, data):
-        """生成主程序"""
-        main_content = """PROC main()
+        """生成主程序（只取决于各开关，按开关组合缓存生成结果）"""
+        return self._build_main_program(
+            data.get('include_rough', True),
+            data.get('include_cleaning', False),
+            data.get('enable_advanced_features', False),
+            data.get('enable_force_control', True),
+            data.get('enable_motion_optimization', True),
+            data.get('include_fine', True),
+            data.get('include_measurement', False),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_main_program(cls, include_rough, include_cleaning, enable_advanced_features,
+                            enable_force_control, enable_motion_optimization,
+                            include_fine, include_measurement):
+        """按开关组合拼接主程序，各段收集后一次拼接"""
+        parts = ["""PROC main()
     ! 主程序 - 抛光工艺流程
     TPWrite "========================================";
     TPWrite "ABB Polishing Studio - 工业级抛光程序";
@@ -3761,11 +4665,11 @@ ENDPROC"""
     WaitTime 1.0;
 
     ! 确认工件夹紧
-    TPWrite "工件夹紧完成，开始加工...";"""
+    TPWrite "工件夹紧完成，开始加工...";"""]
 
         # 添加抛光流程
-        if data.get('include_rough', True):
-            main_content += """
+        if include_rough:
+            parts.append("""
     ! 粗抛工艺
     TPWrite "=== 粗抛工艺开始 ===";
     Polishing_Rough();
@@ -3774,11 +4678,11 @@ ENDPROC"""
     ! 中间清洁（可选）
     IF {include_cleaning} THEN
         Cleaning();
-    ENDIF""".format(include_cleaning="TRUE" if data.get('include_cleaning', False) else "FALSE")
+    ENDIF""".format(include_cleaning="TRUE" if include_cleaning else "FALSE"))
 
         # 添加高级功能（如果启用）
-        if data.get('enable_advanced_features', False):
-            main_content += """
+        if enable_advanced_features:
+            parts.append("""
 
     ! 高级数学建模抛光
     TPWrite "=== 数学建模抛光开始 ===";
@@ -3803,20 +4707,20 @@ ENDPROC"""
     TPWrite "=== 自适应抛光开始 ===";
     AdaptivePolishing();
     TPWrite "自适应抛光完成";""".format(
-                enable_force_control="TRUE" if data.get('enable_force_control', True) else "FALSE",
-                enable_motion_optimization="TRUE" if data.get('enable_motion_optimization', True) else "FALSE"
-            )
+                enable_force_control="TRUE" if enable_force_control else "FALSE",
+                enable_motion_optimization="TRUE" if enable_motion_optimization else "FALSE"
+            ))
 
-        if data.get('include_fine', True):
-            main_content += """
+        if include_fine:
+            parts.append("""
 
     ! 精抛工艺
     TPWrite "=== 精抛工艺开始 ===";
     Polishing_Fine();
-    TPWrite "精抛工艺完成";"""
+    TPWrite "精抛工艺完成";""")
 
         # 程序结束
-        main_content += """
+        parts.append("""
 
     ! 最终测量
     IF {include_measurement} THEN
@@ -3833,9 +4737,9 @@ ENDPROC"""
     TPWrite "========================================";
     TPWrite "抛光程序执行完成!";
     TPWrite "========================================";
-ENDPROC""".format(include_measurement="TRUE" if data.get('include_measurement', False) else "FALSE")
+ENDPROC""".format(include_measurement="TRUE" if include_measurement else "FALSE"))
 
-        return main_content
+        return "".join(parts)
 
     def _generate_utility_functions(self, data):
         """生成工具函数"""
@@ -3962,33 +4866,13 @@ PROC CalculateMathParameters(num nCurvature, num nHardness)
 ENDPROC"""
 
     def _format_program(self, program):
-        """格式化程序（添加注释和空行）"""
-        lines = program.split('\n')
-        formatted_lines = []
-
-        for line in lines:
-            # 保持原有缩进
-            formatted_lines.append(line)
-
-            # 在某些关键指令后添加空行
-            if any(keyword in line for keyword in
-                   ['PROC ', 'ENDPROC', 'MoveJ ', 'MoveL ', 'TPWrite', 'IF ', 'WHILE', 'FOR ', 'ENDFOR']):
-                if not line.strip().startswith('!'):
-                    formatted_lines.append('')
-
-        return '\n'.join(formatted_lines)
+        """格式化程序（在关键指令行后添加空行，保持原有缩进）"""
+        # 整段文本一次正则替换，不拆分成行列表再拼接
+        return self._BLANK_AFTER_RE.sub('\\g<0>\n', program)
 
     def _generate_signature(self):
-        """生成程序签名"""
-        return f"""
-! ========================================================
-! 程序签名
-! 生成工具: ABB Polishing Studio {AppConfig.VERSION}
-! 数学建模: PolishingMathematicalModel
-! 高级功能: AdvancedRAPIDFeatures
-! 版权所有: {AppConfig.AUTHOR}
-! 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-! ========================================================"""
+        """生成程序签名（固定部分预先生成，只拼接本次时间戳）"""
+        return self._SIGNATURE_HEAD + self._run_timestamp + self._SIGNATURE_TAIL
 
     def validate_program(self, program):
         """验证RAPID程序语法"""
@@ -4018,7 +4902,8 @@ ENDPROC"""
     def export_program(self, program, file_path):
         """导出RAPID程序到文件"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # 整个程序一次写入，1 MiB 缓冲避免大程序按默认 8 KiB 分块落盘
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(program)
             return True
         except Exception as e:
@@ -4028,9 +4913,41 @@ ENDPROC"""
 
 
 # ==================== 主应用程序类 ====================
-class ABBPolishingStudioIndustrialAdvanced:
+class ABBPolishingStudioIndustrialAdvanced(WheelScrollMixin, SpinRowMixin):
     """ABB Polishing Studio - 工业级高级主应用程序"""
 
+    # 机器人型号参数表
+    ROBOT_INFO = {
+        "IRB 2600-12/1.85": "负载: 12kg | 范围: 1850mm | 重复精度: ±0.05mm",
+        "IRB 4600-40/2.55": "负载: 40kg | 范围: 2550mm | 重复精度: ±0.05mm",
+        "IRB 6700-300/2.70": "负载: 300kg | 范围: 2700mm | 重复精度: ±0.06mm",
+        "IRB 14000-0.5/0.9": "负载: 0.5kg | 范围: 900mm | 重复精度: ±0.02mm",
+        "IRB 1100-4/0.58": "负载: 4kg | 范围: 580mm | 重复精度: ±0.02mm",
+        "IRB 6700F-200/2.70": "负载: 200kg | 范围: 2700mm | 重复精度: ±0.06mm",
+        "IRB 8700-550/3.20": "负载: 550kg | 范围: 3200mm | 重复精度: ±0.08mm",
+        "自定义机器人": "请自定义机器人参数"
+    }
+
+    # 参数输入行样式（传给 SpinRowMixin._create_spin_row）
+    _SPIN_ROW_STYLE = {
+        'font': ("Segoe UI", 10),
+        'label_fg': ProfessionalColors.TEXT_PRIMARY,
+        'unit_padx': (2, 0),
+    }
+
+    # 工具参数表: (标签, 变量属性名, 默认值, 最小值, 最大值, 步长, 单位)
+    _TOOL_FIELDS = (
+        ("工具直径:", "tool_diameter_var", 8.0, 2.0, 20.0, 0.5, "mm"),
+        ("工具长度:", "tool_length_var", 200.0, 50.0, 500.0, 10.0, "mm"),
+    )
+
+    # 工艺参数表，格式同 _TOOL_FIELDS
+    _PROCESS_FIELDS = (
+        ("粗抛速度:", "rough_speed_var", 300.0, 50.0, 500.0, 10.0, "mm/s"),
+        ("精抛速度:", "fine_speed_var", 200.0, 50.0, 500.0, 10.0, "mm/s"),
+        ("安全高度:", "safety_height_var", 50.0, 10.0, 200.0, 5.0, "mm"),
+    )
+
     def __init__(self):
         # 初始化配置
         AppConfig.ensure_dirs()
@@ -4040,8 +4957,8 @@ class ABBPolishingStudioIndustrialAdvanced:
         self.config = self._load_config()
 
         # 初始化组件
-        self.colors = ProfessionalColors()
-        self.math_model = PolishingMathematicalModel()
+        self.colors = ProfessionalColors  # 纯命名空间，直接引用类
+        self.math_model = PolishingMathematicalModel  # 全部为静态方法，无需实例化
         self.path_planner = None
 
         # 创建主窗口
@@ -4054,7 +4971,7 @@ class ABBPolishingStudioIndustrialAdvanced:
 
         # 数据存储
         self.current_model = None
-        self.model_metadata = {}
+        self.model_metadata = ModelMetadata()
         self.features = []
         self.paths = {}
         self.generated_code = ""
@@ -4240,7 +5157,7 @@ class ABBPolishingStudioIndustrialAdvanced:
         left_scrollbar.pack(side="right", fill="y")
 
         # 绑定鼠标滚轮
-        left_canvas.bind_all("<MouseWheel>", lambda e: left_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        self._bind_wheel_scroll(left_canvas)
 
         # 创建内容区域
         content_padding = 12
@@ -4348,7 +5265,7 @@ class ABBPolishingStudioIndustrialAdvanced:
         )
         self.nx_info_text.pack(fill="x")
         self.nx_info_text.insert("1.0", "等待加载NX STL文件...")
-        self.nx_info_text.configure(state="disabled")
+        make_text_readonly(self.nx_info_text)
 
     def _create_math_model_card(self, parent):
         """创建数学建模卡片"""
@@ -4497,33 +5414,30 @@ class ABBPolishingStudioIndustrialAdvanced:
         info_frame = tk.Frame(card, bg=self.colors.SURFACE)
         info_frame.pack(fill="x")
 
-        self.robot_info_text = tk.Text(
+        # 只读信息用 Label + StringVar，刷新只需一次 set
+        self.robot_info_var = tk.StringVar(value=self._get_robot_info())
+        self.robot_info_label = tk.Label(
             info_frame,
-            height=4,
+            textvariable=self.robot_info_var,
             font=("Segoe UI", 9),
             bg=self.colors.SURFACE_LIGHT,
             fg=self.colors.TEXT_SECONDARY,
             relief="flat",
             borderwidth=1,
-            wrap="word"
+            justify="left",
+            anchor="nw",
+            wraplength=260
+        )
+        self.robot_info_label.pack(fill="x")
+
+        # 切换型号时同步参数信息
+        self.robot_model_var.trace_add(
+            "write", lambda *_: self.robot_info_var.set(self._get_robot_info())
         )
-        self.robot_info_text.pack(fill="x")
-        self.robot_info_text.insert("1.0", self._get_robot_info())
-        self.robot_info_text.configure(state="disabled")
 
     def _get_robot_info(self):
         """获取机器人信息"""
-        robot_info = {
-            "IRB 2600-12/1.85": "负载: 12kg | 范围: 1850mm | 重复精度: ±0.05mm",
-            "IRB 4600-40/2.55": "负载: 40kg | 范围: 2550mm | 重复精度: ±0.05mm",
-            "IRB 6700-300/2.70": "负载: 300kg | 范围: 2700mm | 重复精度: ±0.06mm",
-            "IRB 14000-0.5/0.9": "负载: 0.5kg | 范围: 900mm | 重复精度: ±0.02mm",
-            "IRB 1100-4/0.58": "负载: 4kg | 范围: 580mm | 重复精度: ±0.02mm",
-            "IRB 6700F-200/2.70": "负载: 200kg | 范围: 2700mm | 重复精度: ±0.06mm",
-            "IRB 8700-550/3.20": "负载: 550kg | 范围: 3200mm | 重复精度: ±0.08mm",
-            "自定义机器人": "请自定义机器人参数"
-        }
-        return robot_info.get(self.robot_model_var.get(), "选择机器人型号查看参数")
+        return self.ROBOT_INFO.get(self.robot_model_var.get(), "选择机器人型号查看参数")
 
     def _create_tool_config_card(self, parent):
         """创建工具配置卡片"""
@@ -4555,67 +5469,10 @@ class ABBPolishingStudioIndustrialAdvanced:
         )
         tool_type_combo.pack(side="right")
 
-        # 工具参数
+        # 工具参数（按 _TOOL_FIELDS 表逐行生成）
         param_frame = tk.Frame(card, bg=self.colors.SURFACE)
         param_frame.pack(fill="x", pady=(0, 8))
-
-        # 工具直径
-        tk.Label(
-            param_frame,
-            text="工具直径:",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_PRIMARY
-        ).grid(row=0, column=0, sticky="w", pady=(0, 4))
-
-        self.tool_diameter_var = tk.DoubleVar(value=8.0)
-        tool_diameter_spin = tk.Spinbox(
-            param_frame,
-            from_=2.0,
-            to=20.0,
-            increment=0.5,
-            textvariable=self.tool_diameter_var,
-            width=8,
-            font=("Segoe UI", 10)
-        )
-        tool_diameter_spin.grid(row=0, column=1, sticky="e", pady=(0, 4))
-
-        tk.Label(
-            param_frame,
-            text="mm",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_TERTIARY
-        ).grid(row=0, column=2, sticky="w", padx=(2, 0), pady=(0, 4))
-
-        # 工具长度
-        tk.Label(
-            param_frame,
-            text="工具长度:",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_PRIMARY
-        ).grid(row=1, column=0, sticky="w")
-
-        self.tool_length_var = tk.DoubleVar(value=200.0)
-        tool_length_spin = tk.Spinbox(
-            param_frame,
-            from_=50.0,
-            to=500.0,
-            increment=10.0,
-            textvariable=self.tool_length_var,
-            width=8,
-            font=("Segoe UI", 10)
-        )
-        tool_length_spin.grid(row=1, column=1, sticky="e")
-
-        tk.Label(
-            param_frame,
-            text="mm",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_TERTIARY
-        ).grid(row=1, column=2, sticky="w", padx=(2, 0))
+        self._create_spin_rows(param_frame, self._TOOL_FIELDS, row_pady=(0, 4), **self._SPIN_ROW_STYLE)
 
     def _create_process_config_card(self, parent):
         """创建工艺配置卡片"""
@@ -4624,101 +5481,13 @@ class ABBPolishingStudioIndustrialAdvanced:
                              padx=12, pady=12)
         card.pack(fill="x", pady=(0, 10))
 
-        # 粗抛参数
-        rough_frame = tk.Frame(card, bg=self.colors.SURFACE)
-        rough_frame.pack(fill="x", pady=(0, 8))
-
-        tk.Label(
-            rough_frame,
-            text="粗抛速度:",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_PRIMARY
-        ).pack(side="left")
-
-        self.rough_speed_var = tk.DoubleVar(value=300.0)
-        rough_speed_spin = tk.Spinbox(
-            rough_frame,
-            from_=50.0,
-            to=500.0,
-            increment=10.0,
-            textvariable=self.rough_speed_var,
-            width=8,
-            font=("Segoe UI", 10)
-        )
-        rough_speed_spin.pack(side="right")
-
-        tk.Label(
-            rough_frame,
-            text="mm/s",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_TERTIARY
-        ).pack(side="right", padx=(2, 0))
-
-        # 精抛参数
-        fine_frame = tk.Frame(card, bg=self.colors.SURFACE)
-        fine_frame.pack(fill="x", pady=(0, 8))
-
-        tk.Label(
-            fine_frame,
-            text="精抛速度:",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_PRIMARY
-        ).pack(side="left")
-
-        self.fine_speed_var = tk.DoubleVar(value=200.0)
-        fine_speed_spin = tk.Spinbox(
-            fine_frame,
-            from_=50.0,
-            to=500.0,
-            increment=10.0,
-            textvariable=self.fine_speed_var,
-            width=8,
-            font=("Segoe UI", 10)
-        )
-        fine_speed_spin.pack(side="right")
-
-        tk.Label(
-            fine_frame,
-            text="mm/s",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_TERTIARY
-        ).pack(side="right", padx=(2, 0))
-
-        # 安全参数
-        safety_frame = tk.Frame(card, bg=self.colors.SURFACE)
-        safety_frame.pack(fill="x", pady=(0, 8))
-
-        tk.Label(
-            safety_frame,
-            text="安全高度:",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_PRIMARY
-        ).pack(side="left")
-
-        self.safety_height_var = tk.DoubleVar(value=50.0)
-        safety_height_spin = tk.Spinbox(
-            safety_frame,
-            from_=10.0,
-            to=200.0,
-            increment=5.0,
-            textvariable=self.safety_height_var,
-            width=8,
-            font=("Segoe UI", 10)
-        )
-        safety_height_spin.pack(side="right")
-
-        tk.Label(
-            safety_frame,
-            text="mm",
-            font=("Segoe UI", 10),
-            bg=self.colors.SURFACE,
-            fg=self.colors.TEXT_TERTIARY
-        ).pack(side="right", padx=(2, 0))
+        # 粗抛/精抛速度与安全高度（按 _PROCESS_FIELDS 表逐行生成，共用一个 grid 容器）
+        param_frame = tk.Frame(card, bg=self.colors.SURFACE)
+        param_frame.pack(fill="x", pady=(0, 8))
+        # 第 1 列（单位）吸收剩余宽度，单位与数值框一起靠右，单位在数值框左侧
+        param_frame.columnconfigure(1, weight=1)
+        self._create_spin_rows(param_frame, self._PROCESS_FIELDS, row_pady=(0, 8),
+                               unit_before_spin=True, **self._SPIN_ROW_STYLE)
 
     def _create_path_planning_card(self, parent):
         """创建路径规划卡片"""
@@ -4809,19 +5578,20 @@ class ABBPolishingStudioIndustrialAdvanced:
         info_frame = tk.Frame(card, bg=self.colors.SURFACE)
         info_frame.pack(fill="x")
 
-        self.path_info_text = tk.Text(
+        self.path_info_var = tk.StringVar(value="等待生成路径...")
+        self.path_info_label = tk.Label(
             info_frame,
-            height=6,
+            textvariable=self.path_info_var,
             font=("Segoe UI", 9),
             bg=self.colors.SURFACE_LIGHT,
             fg=self.colors.TEXT_SECONDARY,
             relief="flat",
             borderwidth=1,
-            wrap="word"
+            justify="left",
+            anchor="nw",
+            wraplength=260
         )
-        self.path_info_text.pack(fill="x")
-        self.path_info_text.insert("1.0", "等待生成路径...")
-        self.path_info_text.configure(state="disabled")
+        self.path_info_label.pack(fill="x")
 
     def _create_advanced_features_card(self, parent):
         """创建高级功能卡片"""
@@ -5005,10 +5775,10 @@ class ABBPolishingStudioIndustrialAdvanced:
         self.tab_view = ttk.Notebook(self.right_panel)
         self.tab_view.pack(fill="both", expand=True, padx=1, pady=1)
 
-        # 创建3D预览选项卡
+        # 创建3D预览选项卡（matplotlib 导入较慢，窗口首次绘制后再导入并构建）
         self.tab_3d = tk.Frame(self.tab_view, bg=self.colors.CODE_BACKGROUND)
-        self._create_3d_viewer()
         self.tab_view.add(self.tab_3d, text="3D预览")
+        self.root.after_idle(self._create_3d_viewer)
 
         # 创建数学建模选项卡
         self.tab_math = tk.Frame(self.tab_view, bg=self.colors.BACKGROUND)
@@ -5032,7 +5802,7 @@ class ABBPolishingStudioIndustrialAdvanced:
 
     def _create_3d_viewer(self):
         """创建3D查看器"""
-        if not MATPLOTLIB_AVAILABLE:
+        if not is_matplotlib_available():
             no_lib_label = tk.Label(
                 self.tab_3d,
                 text="需要安装matplotlib库",
@@ -5045,14 +5815,14 @@ class ABBPolishingStudioIndustrialAdvanced:
 
         try:
             # 创建图形
-            self.figure = plt.Figure(figsize=(8, 6), dpi=100, facecolor=self.colors.CODE_BACKGROUND)
+            self.figure = _lazy('matplotlib.figure').Figure(figsize=(8, 6), dpi=100, facecolor=self.colors.CODE_BACKGROUND)
             self.ax = self.figure.add_subplot(111, projection='3d')
 
             # 配置3D轴
             self.ax.set_facecolor(self.colors.CODE_BACKGROUND)
 
             # 创建画布
-            self.canvas = FigureCanvasTkAgg(self.figure, self.tab_3d)
+            self.canvas = _lazy('matplotlib.backends.backend_tkagg').FigureCanvasTkAgg(self.figure, self.tab_3d)
             self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=1, pady=1)
 
             # 初始设置
@@ -5071,11 +5841,48 @@ class ABBPolishingStudioIndustrialAdvanced:
 
             # 设置网格
             self.ax.grid(True, color='gray', alpha=0.3)
+
+            # 路径线条设为 animated，不参与整图重绘；每次整图重绘（加载模型、
+            # 旋转视角）后缓存背景，之后更新路径只需恢复背景并 blit
+            self._path_artists = []
+            self._bg_3d = None
+            self.canvas.mpl_connect('draw_event', self._on_3d_draw)
             self.canvas.draw()
 
         except Exception as e:
             print(f"3D可视化初始化失败: {e}")
 
+    def _on_3d_draw(self, event):
+        """整图重绘后缓存背景并补画路径"""
+        self._bg_3d = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self._path_artists:
+            self.ax.draw_artist(artist)
+
+    def _update_3d_paths(self, segments):
+        """更新3D视图中的路径线条，segments 为 (点数组, 颜色) 序列"""
+        for artist in self._path_artists:
+            artist.remove()
+        self._path_artists = []
+
+        limits = (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim())
+        for points, color in segments:
+            line, = self.ax.plot(
+                points[:, 0], points[:, 1], points[:, 2],
+                color=color, linewidth=2, alpha=0.6, animated=True
+            )
+            self._path_artists.append(line)
+
+        # 坐标范围变化或尚无背景缓存时必须整图重绘
+        new_limits = (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim())
+        if self._bg_3d is None or limits != new_limits:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self._bg_3d)
+        for artist in self._path_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
     def _create_math_model_view(self):
         """创建数学建模视图"""
         # 数学建模信息框架
@@ -5128,7 +5935,7 @@ class ABBPolishingStudioIndustrialAdvanced:
    - 成本估算
 
 数学建模参数将在此显示...""")
-        self.math_info_text.configure(state="disabled")
+        make_text_readonly(self.math_info_text)
 
     def _create_code_preview(self):
         """创建代码预览"""
@@ -5210,7 +6017,7 @@ class ABBPolishingStudioIndustrialAdvanced:
                                           "• 零件信息读取\n"
                                           "• 几何特征分析\n"
                                           "• 网格质量评估")
-        self.nx_detail_text.configure(state="disabled")
+        make_text_readonly(self.nx_detail_text)
 
     def _create_path_preview(self):
         """创建路径预览"""
@@ -5238,7 +6045,7 @@ class ABBPolishingStudioIndustrialAdvanced:
                                             "• 进退刀路径\n"
                                             "• 路径优化处理\n"
                                             "• 数学建模优化")
-        self.path_detail_text.configure(state="disabled")
+        make_text_readonly(self.path_detail_text)
 
     def _create_status_bar(self):
         """创建状态栏"""
@@ -5266,9 +6073,10 @@ class ABBPolishingStudioIndustrialAdvanced:
         system_info_frame.pack(side="right", padx=20)
 
         # 时间显示
+        self._time_var = tk.StringVar()
         self.time_label = tk.Label(
             system_info_frame,
-            text=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            textvariable=self._time_var,
             font=("Segoe UI", 8),
             bg=self.colors.SURFACE_DARK,
             fg=self.colors.TEXT_LIGHT
@@ -5279,10 +6087,13 @@ class ABBPolishingStudioIndustrialAdvanced:
         self._update_time()
 
     def _update_time(self):
-        """更新时间显示"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self._update_time)
+        """更新时间显示（分钟精度，对齐到下一整分钟再唤醒）"""
+        now = datetime.now()
+        current_time = now.strftime("%Y-%m-%d %H:%M")
+        if current_time != self._time_var.get():
+            self._time_var.set(current_time)
+        delay_ms = (60 - now.second) * 1000 - now.microsecond // 1000
+        self.root.after(max(delay_ms, 1000), self._update_time)
 
     def _bind_events(self):
         """绑定事件"""
@@ -5363,7 +6174,7 @@ ENDMODULE"""
             return
 
         # 检查文件扩展名
-        if not file_path.lower().endswith('.stl'):
+        if AppConfig.detect_format(file_path) != '.stl':
             response = messagebox.askyesno("警告",
                                            f"文件 {os.path.basename(file_path)} 不是.stl文件。\n"
                                            "是否继续尝试加载？")
@@ -5371,7 +6182,7 @@ ENDMODULE"""
                 return
 
         # 检查依赖库
-        if not TRIMESH_AVAILABLE:
+        if not is_trimesh_available():
             messagebox.showerror("错误",
                                  "需要安装trimesh库\n"
                                  "请运行: pip install trimesh scikit-learn scipy matplotlib")
@@ -5379,7 +6190,7 @@ ENDMODULE"""
 
         # 更新状态
         self.status_label.config(text="正在加载STL模型...")
-        self.root.update()
+        self.root.update_idletasks()
 
         try:
             # 检查文件大小
@@ -5402,32 +6213,35 @@ ENDMODULE"""
                 raise Exception("STL文件加载失败")
 
             # 获取元数据
-            self.model_metadata = self.current_model.metadata
+            self.model_metadata = ModelMetadata.from_mapping(self.current_model.metadata)
 
             # 分析网格特征
-            mesh_features = self.nx_processor.analyze_mesh_features(self.current_model)
+            # 只计算界面显示用到的字段（跳过凸性检查）
+            mesh_features = self.nx_processor.analyze_mesh_features(
+                self.current_model,
+                needs=('is_watertight', 'is_closed', 'bounding_box', 'surface_area', 'volume'))
 
             # 显示模型信息
             info_text = f"✅ STL文件加载成功!\n\n"
             info_text += f"文件: {os.path.basename(file_path)}\n"
             info_text += f"文件大小: {file_size / 1024:.1f} KB\n"
-            info_text += f"格式: {self.model_metadata.get('original_format', 'STL')}\n"
+            info_text += f"格式: {self.model_metadata.original_format}\n"
 
-            if self.model_metadata.get('is_nx'):
+            if self.model_metadata.is_nx:
                 info_text += f"类型: NX STL (已应用特殊处理)\n"
             else:
                 info_text += f"类型: 标准STL\n"
 
-            info_text += f"单位: {self.model_metadata.get('units', '毫米')}\n"
+            info_text += f"单位: {self.model_metadata.units}\n"
 
-            if self.model_metadata.get('part_name'):
-                info_text += f"零件名称: {self.model_metadata['part_name']}\n"
-            if self.model_metadata.get('creation_date'):
-                info_text += f"创建日期: {self.model_metadata['creation_date']}\n"
-            if self.model_metadata.get('author'):
-                info_text += f"作者: {self.model_metadata['author']}\n"
-            if self.model_metadata.get('cad_system'):
-                info_text += f"CAD系统: {self.model_metadata['cad_system']}\n"
+            if self.model_metadata.part_name:
+                info_text += f"零件名称: {self.model_metadata.part_name}\n"
+            if self.model_metadata.creation_date:
+                info_text += f"创建日期: {self.model_metadata.creation_date}\n"
+            if self.model_metadata.author:
+                info_text += f"作者: {self.model_metadata.author}\n"
+            if self.model_metadata.cad_system:
+                info_text += f"CAD系统: {self.model_metadata.cad_system}\n"
 
             info_text += f"\n网格信息:\n"
             info_text += f"顶点数: {mesh_features.get('vertex_count', 0):,}\n"
@@ -5447,20 +6261,18 @@ ENDMODULE"""
             if mesh_features.get('volume'):
                 info_text += f"体积: {mesh_features['volume']:,.1f} mm³\n"
 
-            self.nx_info_text.configure(state="normal")
             self.nx_info_text.delete("1.0", tk.END)
             self.nx_info_text.insert("1.0", info_text)
-            self.nx_info_text.configure(state="disabled")
 
             # 更新详细NX信息
             detail_text = f"STL文件详细分析:\n\n"
             detail_text += f"文件路径: {file_path}\n"
             detail_text += f"文件大小: {file_size / 1024:.1f} KB\n"
-            detail_text += f"检测结果: {'NX STL' if self.model_metadata.get('is_nx') else '标准STL'}\n"
+            detail_text += f"检测结果: {'NX STL' if self.model_metadata.is_nx else '标准STL'}\n"
             detail_text += f"强制NX处理: {'是' if force_nx_processing else '否'}\n\n"
 
             detail_text += "元数据:\n"
-            for key, value in self.model_metadata.items():
+            for key, value in asdict(self.model_metadata).items():
                 if value and key not in ['nx_specific']:
                     if isinstance(value, dict):
                         detail_text += f"  {key}:\n"
@@ -5469,9 +6281,9 @@ ENDMODULE"""
                     else:
                         detail_text += f"  {key}: {value}\n"
 
-            if self.model_metadata.get('nx_specific'):
+            if self.model_metadata.nx_specific:
                 detail_text += "\nNX特定信息:\n"
-                for key, value in self.model_metadata['nx_specific'].items():
+                for key, value in self.model_metadata.nx_specific.items():
                     detail_text += f"  {key}: {value}\n"
 
             detail_text += "\n网格特征:\n"
@@ -5482,10 +6294,8 @@ ENDMODULE"""
                     else:
                         detail_text += f"  {key}: {value}\n"
 
-            self.nx_detail_text.configure(state="normal")
             self.nx_detail_text.delete("1.0", tk.END)
             self.nx_detail_text.insert("1.0", detail_text)
-            self.nx_detail_text.configure(state="disabled")
 
             # 更新数学建模信息
             if self.enable_math_model_var.get():
@@ -5529,15 +6339,14 @@ ENDMODULE"""
                     removal_rate = self.math_model.calculate_material_removal_rate(contact_pressure, 200.0, tool_radius)
                     math_text += f"材料去除率: {removal_rate:.6f} mm³/s\n"
 
-                self.math_info_text.configure(state="normal")
                 self.math_info_text.delete("1.0", tk.END)
                 self.math_info_text.insert("1.0", math_text)
-                self.math_info_text.configure(state="disabled")
 
             # 在3D视图中显示模型
             if hasattr(self, 'ax') and self.ax:
                 try:
                     self.ax.clear()
+                    self._path_artists = []
 
                     # 绘制模型
                     vertices = self.current_model.vertices
@@ -5586,6 +6395,7 @@ ENDMODULE"""
                     print(f"3D显示错误: {e}")
                     # 显示错误信息
                     self.ax.clear()
+                    self._path_artists = []
                     self.ax.text(0.5, 0.5, 0.5, "3D显示错误", color='red',
                                  horizontalalignment='center', verticalalignment='center')
                     if hasattr(self, 'canvas'):
@@ -5601,7 +6411,7 @@ ENDMODULE"""
             # 更新模型状态
             self.model_status.config(text=f"已加载: {os.path.basename(file_path)}")
 
-            if self.model_metadata.get('is_nx'):
+            if self.model_metadata.is_nx:
                 self.status_label.config(text=f"NX STL模型加载成功")
                 messagebox.showinfo("成功",
                                     f"STL文件已加载\n"
@@ -5683,20 +6493,19 @@ ENDMODULE"""
             coverage = self.path_planner.calculate_path_coverage(rough_paths + fine_paths)
 
             # 更新路径信息
-            info_text = f"✅ 数学优化路径生成成功!\n\n"
-            info_text += f"路径类型: {path_type}\n"
-            info_text += f"数学优化: {'启用' if math_optimization else '禁用'}\n"
-            info_text += f"粗抛路径: {len(self.paths.get('rough', []))} 条\n"
-            info_text += f"精抛路径: {len(self.paths.get('fine', []))} 条\n"
-            info_text += f"总路径点数: {self._count_total_points(self.paths)}\n"
-            info_text += f"步距比例: {self.stepover_var.get() * 100:.0f}%\n"
-            info_text += f"路径覆盖率: {coverage * 100:.1f}%\n"
-            info_text += f"安全高度: {self.safety_height_var.get():.0f} mm"
-
-            self.path_info_text.configure(state="normal")
-            self.path_info_text.delete("1.0", tk.END)
-            self.path_info_text.insert("1.0", info_text)
-            self.path_info_text.configure(state="disabled")
+            info_text = (
+                f"✅ 数学优化路径生成成功!\n\n"
+                f"路径类型: {path_type}\n"
+                f"数学优化: {'启用' if math_optimization else '禁用'}\n"
+                f"粗抛路径: {len(self.paths.get('rough', []))} 条\n"
+                f"精抛路径: {len(self.paths.get('fine', []))} 条\n"
+                f"总路径点数: {self._count_total_points(self.paths)}\n"
+                f"步距比例: {self.stepover_var.get() * 100:.0f}%\n"
+                f"路径覆盖率: {coverage * 100:.1f}%\n"
+                f"安全高度: {self.safety_height_var.get():.0f} mm"
+            )
+
+            self.path_info_var.set(info_text)
 
             # 更新详细路径信息
             detail_text = f"数学优化路径详细分析:\n\n"
@@ -5709,18 +6518,14 @@ ENDMODULE"""
             for stage in ['rough', 'fine']:
                 if stage in self.paths and self.paths[stage]:
                     detail_text += f"{stage.capitalize()}抛光:\n"
-                    for i, path in enumerate(self.paths[stage][:3]):
-                        points = path.get('points', [])
-                        detail_text += f"  路径{i + 1}: {len(points)}点\n"
-                        if points:
-                            # 计算路径长度
-                            path_length = 0
-                            for j in range(1, len(points)):
-                                p1 = points[j - 1]['position']
-                                p2 = points[j]['position']
-                                path_length += np.linalg.norm(np.array(p2) - np.array(p1))
-                            detail_text += f"    长度: {path_length:.1f}mm\n"
-                            total_length += path_length
+                    buffer = self.paths[stage]
+                    for i in range(min(3, len(buffer))):
+                        span = buffer.path_slice(i)
+                        detail_text += f"  路径{i + 1}: {span.stop - span.start}点\n"
+                        # 计算路径长度
+                        path_length = buffer.path_length(i)
+                        detail_text += f"    长度: {path_length:.1f}mm\n"
+                        total_length += path_length
 
             detail_text += f"\n总路径长度: {total_length:.1f} mm\n"
 
@@ -5733,36 +6538,27 @@ ENDMODULE"""
             detail_text += f"预估精抛时间: {fine_time:.1f}秒\n"
             detail_text += f"预估总加工时间: {total_time:.1f}秒"
 
-            self.path_detail_text.configure(state="normal")
             self.path_detail_text.delete("1.0", tk.END)
             self.path_detail_text.insert("1.0", detail_text)
-            self.path_detail_text.configure(state="disabled")
 
             # 在3D视图中显示路径
-            if hasattr(self, 'ax') and self.ax:
+            if hasattr(self, 'ax') and self.ax and hasattr(self, 'canvas'):
                 colors = {
                     'rough': 'red',
                     'fine': 'blue'
                 }
 
+                segments = []
                 for stage in ['rough', 'fine']:
                     if stage in self.paths and self.paths[stage]:
                         color = colors[stage]
-                        for path in self.paths[stage][:2]:  # 只显示前2个路径
-                            points = path.get('points', [])
-                            if len(points) > 1:
-                                points_array = np.array([p['position'] for p in points])
-                                self.ax.plot(
-                                    points_array[:, 0],
-                                    points_array[:, 1],
-                                    points_array[:, 2],
-                                    color=color,
-                                    linewidth=2,
-                                    alpha=0.6
-                                )
-
-                if hasattr(self, 'canvas'):
-                    self.canvas.draw()
+                        buffer = self.paths[stage]
+                        for i in range(min(2, len(buffer))):  # 只显示前2个路径
+                            points_array = buffer.positions[buffer.path_slice(i)]
+                            if len(points_array) > 1:
+                                segments.append((points_array, color))
+
+                self._update_3d_paths(segments)
 
             self.status_label.config(text="数学优化路径生成完成")
 
@@ -5771,46 +6567,28 @@ ENDMODULE"""
             self.status_label.config(text="路径生成失败")
 
     def _convert_paths_to_program_format(self, paths, stage):
-        """将路径转换为程序格式"""
-        program_paths = []
+        """将路径转换为程序格式（SoA路径缓冲）"""
+        program_paths = PathBuffer(capacity=sum(len(path.get('points', [])) for path in paths))
 
-        for i, path in enumerate(paths):
-            points = path.get('points', [])
+        # 工具姿态：简化为统一法向量，实际应根据表面法向量计算
+        orientation = self.math_model.calculate_tool_orientation(np.array([0, 0, 1]))
+        velocity = self.rough_speed_var.get() if stage == 'rough' else self.fine_speed_var.get()
+        zone = 'zMedium' if stage == 'rough' else 'zFine'
 
-            # 为每个点添加姿态信息
-            path_points = []
-            for j, point in enumerate(points):
-                if isinstance(point, list) and len(point) >= 3:
-                    # 计算工具姿态
-                    normal = [0, 0, 1]  # 简化，实际应根据表面法向量计算
-                    orientation = self.math_model.calculate_tool_orientation(normal)
-
-                    path_points.append({
-                        'position': [float(point[0]), float(point[1]), float(point[2])],
-                        'orientation': orientation,
-                        'velocity': self.rough_speed_var.get() if stage == 'rough' else self.fine_speed_var.get(),
-                        'zone': 'zMedium' if stage == 'rough' else 'zFine'
-                    })
-
-            if path_points:
-                program_paths.append({
-                    'id': i,
-                    'name': f'{stage.capitalize()}路径_{i + 1}',
-                    'points': path_points,
-                    'total_length': path.get('total_length', 0.0),
-                    'estimated_time': path.get('estimated_time', 0.0)
-                })
+        for i, path in enumerate(paths):
+            points = [point for point in path.get('points', [])
+                      if isinstance(point, list) and len(point) >= 3]
+            if points:
+                program_paths.append_batch(
+                    np.asarray(points, dtype=float)[:, :3], orientation, velocity, zone,
+                    name=f'{stage.capitalize()}路径_{i + 1}'
+                )
 
         return program_paths
 
     def _count_total_points(self, paths):
         """计算总路径点数"""
-        total = 0
-        for stage in ['rough', 'fine']:
-            if stage in paths:
-                for path in paths[stage]:
-                    total += len(path.get('points', []))
-        return total
+        return sum(paths[stage].point_count for stage in ['rough', 'fine'] if stage in paths)
 
     def generate_advanced_rapid_code(self):
         """生成高级RAPID代码"""
@@ -5982,8 +6760,8 @@ def main():
     print("启动ABB Polishing Studio工业级高级专业版...")
 
     try:
-        # 检查依赖
-        if not TRIMESH_AVAILABLE:
+        # 检查依赖（仅查找模块，不在启动时导入）
+        if importlib.util.find_spec('trimesh') is None:
             print("警告: 缺少必要的Python库")
             print("部分功能将受限使用")
             print("建议安装: pip install trimesh scikit-learn scipy matplotlib")
@@ -31,36 +31,29 @@ class PolishingMathematicalModel:
         if not TRIMESH_AVAILABLE or mesh is None:
             return np.array([])
 
-        vertices = mesh.vertices
-        curvatures = []
+        vertices = np.asarray(mesh.vertices, dtype=float)
 
         # 构建KD树用于快速查找邻居
         tree = cKDTree(vertices)
 
-        for point in vertices:
-            # 查找最近邻点
-            distances, indices = tree.query(point, k=k_neighbors + 1)
-            neighbors = vertices[indices[1:]]  # 排除自身
+        # 一次批量查询所有顶点的最近邻
+        _, neighbor_indices = tree.query(vertices, k=k_neighbors + 1, workers=-1)
 
-            # 计算PCA (主成分分析)
-            if len(neighbors) >= 3:
-                centered = neighbors - neighbors.mean(axis=0)
-                cov_matrix = centered.T @ centered
-                eigenvalues, _ = np.linalg.eigh(cov_matrix)
+        curvatures = np.zeros(len(vertices))
+        if k_neighbors < 3:
+            return curvatures
 
-                # 特征值排序（升序）
-                eigenvalues = eigenvalues[np.argsort(eigenvalues)]
+        # 批量PCA (主成分分析)：(N, k, 3) 邻域 -> (N, 3, 3) 协方差，一次 eigvalsh 求解
+        neighbors = vertices[neighbor_indices[:, 1:]]  # 排除自身
+        centered = neighbors - neighbors.mean(axis=1, keepdims=True)
+        cov_matrices = np.einsum('nki,nkj->nij', centered, centered)
+        eigenvalues = np.linalg.eigvalsh(cov_matrices)  # 升序
 
-                # 简化曲率估算: 最小特征值与最大特征值的比率
-                if eigenvalues[2] > 0:
-                    curvature = eigenvalues[0] / eigenvalues[2]
-                    curvatures.append(curvature)
-                else:
-                    curvatures.append(0)
-            else:
-                curvatures.append(0)
+        # 简化曲率估算: 最小特征值与最大特征值的比率
+        largest = eigenvalues[:, 2]
+        np.divide(eigenvalues[:, 0], largest, out=curvatures, where=largest > 0)
 
-        return np.array(curvatures)
+        return curvatures
 
     @staticmethod
     def calculate_contact_pressure(tool_radius, force, curvature):
@@ -81,26 +74,29 @@ class PolishingMathematicalModel:
     @staticmethod
     def calculate_tool_orientation(normal):
         """将法向量转换为工具姿态 (四元数 [qw, qx, qy, qz])"""
-        # 归一化
-        normal = normal / np.linalg.norm(normal)
+        return PolishingMathematicalModel.calculate_tool_orientations(normal)[0].tolist()
 
-        # 默认Z轴朝上
-        up_vector = np.array([0, 0, 1])
-
-        if np.allclose(normal, up_vector) or np.allclose(normal, -up_vector):
-            axis = np.array([1, 0, 0])
-        else:
-            axis = np.cross(up_vector, normal)
-            axis = axis / np.linalg.norm(axis)
-
-        angle = np.arccos(np.clip(np.dot(up_vector, normal), -1.0, 1.0))
-
-        qw = np.cos(angle / 2)
-        qx = axis[0] * np.sin(angle / 2)
-        qy = axis[1] * np.sin(angle / 2)
-        qz = axis[2] * np.sin(angle / 2)
-
-        return [qw, qx, qy, qz]
+    @staticmethod
+    def calculate_tool_orientations(normals):
+        """批量将法向量转换为工具姿态，返回 (N, 4) 四元数数组"""
+        normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+        # 计算旋转轴；法向量与Z轴平行时取X轴
+        up_vector = np.array([0.0, 0.0, 1.0])
+        parallel = (np.isclose(normals, up_vector).all(axis=1) |
+                    np.isclose(normals, -up_vector).all(axis=1))
+        axes = np.cross(up_vector, normals)
+        axis_norms = np.linalg.norm(axes, axis=1, keepdims=True)
+        axis_norms[parallel] = 1.0
+        axes = axes / axis_norms
+        axes[parallel] = [1.0, 0.0, 0.0]
+
+        # 旋转角度的一半
+        half_angles = np.arccos(np.clip(normals[:, 2], -1.0, 1.0)) / 2
+
+        # 转换为四元数
+        return np.column_stack([np.cos(half_angles), axes * np.sin(half_angles)[:, None]])
 
     @staticmethod
     def optimize_path_sequence(points):
@@ -115,29 +111,19 @@ class PolishingMathematicalModel:
         points_np = np.array(points)
 
         current_idx = 0
-        visited = [False] * len(points)
+        visited = np.zeros(len(points), dtype=bool)
         visited[current_idx] = True
         optimized_indices = [0]
 
         for _ in range(len(points) - 1):
-            min_dist = float('inf')
-            next_idx = -1
-
-            # 这里为了性能简化了搜索，实际生产中可能需要 KDTree 加速
-            current_pos = points_np[current_idx]
+            # 欧几里得距离：整行向量化计算，已访问点置为无穷大
+            distances = np.linalg.norm(points_np - points_np[current_idx], axis=1)
+            distances[visited] = np.inf
+            next_idx = int(np.argmin(distances))
 
-            for i in range(len(points)):
-                if not visited[i]:
-                    # 欧几里得距离
-                    dist = np.linalg.norm(current_pos - points_np[i])
-                    if dist < min_dist:
-                        min_dist = dist
-                        next_idx = i
-
-            if next_idx != -1:
-                visited[next_idx] = True
-                optimized_indices.append(next_idx)
-                current_idx = next_idx
+            visited[next_idx] = True
+            optimized_indices.append(next_idx)
+            current_idx = next_idx
 
         return [points[i] for i in optimized_indices]
 
@@ -395,18 +381,19 @@ class PolishingCore:
 
         for idx, path_segment in enumerate(raw_paths):
             points = path_segment['points']
-            enriched_points = []
 
-            for pt in points:
-                # 简单法向量：垂直向上 (Z+)，实际应计算 mesh 最近面片的法向量
-                normal = [0, 0, 1]
-                orientation = PolishingMathematicalModel.calculate_tool_orientation(normal)
+            # 简单法向量：垂直向上 (Z+)，实际应计算 mesh 最近面片的法向量
+            normals = np.tile([0.0, 0.0, 1.0], (len(points), 1))
+            orientations = PolishingMathematicalModel.calculate_tool_orientations(normals).tolist()
 
-                enriched_points.append({
+            enriched_points = [
+                {
                     'pos': pt,  # [x, y, z]
                     'orient': orientation,  # [q1, q2, q3, q4]
                     'speed': speed
-                })
+                }
+                for pt, orientation in zip(points, orientations)
+            ]
 
             if enriched_points:
                 enriched_paths.append({
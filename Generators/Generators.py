@@ -50,6 +50,9 @@ VAR signaldi diToolInPlace;"""
 
     ROBTARGET = "CONST robtarget {name} := [[{x:.3f},{y:.3f},{z:.3f}],[{q1:.6f},{q2:.6f},{q3:.6f},{q4:.6f}],[0,0,0,0],[9E9,9E9,9E9,9E9,9E9,9E9]];"
 
+    # 与 ROBTARGET 等价的 % 格式串，逐点循环中按元组格式化（名称, x, y, z, q1..q4）
+    ROBTARGET_PERCENT = "CONST robtarget %s := [[%.3f,%.3f,%.3f],[%.6f,%.6f,%.6f,%.6f],[0,0,0,0],[9E9,9E9,9E9,9E9,9E9,9E9]];"
+
 
 class AdvancedFeatures:
     """
@@ -183,10 +186,10 @@ class RAPIDGenerator:
                     pos = pt['pos']
                     orient = pt['orient']
 
-                    target_line = RAPIDTemplates.ROBTARGET.format(
-                        name=p_name,
-                        x=pos[0], y=pos[1], z=pos[2],
-                        q1=orient[0], q2=orient[1], q3=orient[2], q4=orient[3]
+                    target_line = RAPIDTemplates.ROBTARGET_PERCENT % (
+                        p_name,
+                        pos[0], pos[1], pos[2],
+                        orient[0], orient[1], orient[2], orient[3]
                     )
                     self.code_buffer.append(target_line)
 
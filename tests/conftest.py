@@ -0,0 +1,18 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "Autopolish1.0.py"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """文件名含点号，按路径加载主程序模块（整个测试会话只加载一次）"""
+    spec = importlib.util.spec_from_file_location("autopolish_app", _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # 注册到 sys.modules，numba 读取磁盘编译缓存时要按模块名重新导入
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
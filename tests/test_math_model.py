@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+pytest.importorskip("scipy.spatial")
+
+
+@pytest.fixture
+def model(app):
+    return app.PolishingMathematicalModel
+
+
+def test_cached_curvature_is_writable_and_follows_mesh_edits(model):
+    mesh = trimesh.creation.icosphere(subdivisions=2, radius=10)
+
+    first = model.calculate_surface_curvature(mesh)
+    first[:] = -1  # 调用方原地修改不应污染缓存
+    second = model.calculate_surface_curvature(mesh)
+    assert np.all(second >= 0)
+
+    mesh.vertices[0] += [0.0, 0.0, 3.0]
+    edited = model.calculate_surface_curvature(mesh)
+    assert not np.array_equal(edited, second)
+
+
+def test_cached_face_attributes_are_writable_and_follow_mesh_edits(model):
+    mesh = trimesh.creation.box(extents=(2, 2, 2))
+
+    normals, areas, centroids = model.calculate_face_attributes(mesh)
+    areas *= 0
+    assert np.allclose(model.calculate_face_attributes(mesh)[1], mesh.area_faces)
+
+    mesh.vertices *= 2
+    assert np.allclose(model.calculate_face_attributes(mesh)[1], mesh.area_faces)
+
+
+def test_non_trimesh_meshes_are_not_cached(model):
+    # 非 Trimesh 对象的 hash 只是 id，无法感知修改，不应缓存
+    box = trimesh.creation.box(extents=(2, 2, 2))
+    mesh = SimpleNamespace(vertices=box.vertices.copy(), faces=box.faces.copy())
+
+    areas = model.calculate_face_attributes(mesh)[1]
+    mesh.vertices *= 2
+    assert np.allclose(model.calculate_face_attributes(mesh)[1], areas * 4)
+    assert not hasattr(mesh, '_face_attributes_cache')
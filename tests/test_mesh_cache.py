@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+
+
+@pytest.fixture
+def cache_dir(app, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(app.AppConfig, "CACHE_DIR", cache)
+    return cache
+
+
+def test_cache_hit_and_miss_give_same_mesh(app, tmp_path, cache_dir):
+    stl = tmp_path / "sphere.stl"
+    trimesh.creation.icosphere(subdivisions=2, radius=20).export(stl)
+
+    miss = app.NXSTLProcessor.load_stl_with_metadata(str(stl))
+    hit = app.NXSTLProcessor.load_stl_with_metadata(str(stl))
+
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    assert np.array_equal(miss.vertices, hit.vertices)
+    assert np.array_equal(miss.faces, hit.faces)
+
+
+def test_cache_eviction_keeps_most_recent(app, tmp_path, cache_dir):
+    for i in range(3):
+        stl = tmp_path / f"box{i}.stl"
+        trimesh.creation.box(extents=(i + 1, 2, 3)).export(stl)
+        app.NXSTLProcessor.load_stl_with_metadata(str(stl))
+    newest = max(cache_dir.glob("*.npz"), key=lambda p: p.stat().st_mtime_ns)
+
+    app.NXSTLProcessor._evict_mesh_cache(max_bytes=1)
+
+    assert list(cache_dir.glob("*.npz")) == [newest]
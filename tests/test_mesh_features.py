@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+
+
+def _meshes():
+    rng = np.random.default_rng(2)
+    sphere = trimesh.creation.icosphere(subdivisions=3, radius=40)
+    sphere.apply_translation([120.0, -35.0, 60.0])
+    box = trimesh.creation.box(extents=(100, 80, 10))
+    box.apply_transform(trimesh.transformations.random_rotation_matrix(rng.random(3)))
+    hull = trimesh.convex.convex_hull(rng.normal(size=(200, 3)) * [30, 20, 10] + [5, 10, -20])
+    annulus = trimesh.creation.annulus(r_min=10, r_max=25, height=8)
+    return {'sphere': sphere, 'box': box, 'hull': hull, 'annulus': annulus}
+
+
+@pytest.mark.parametrize("name", sorted(_meshes()))
+def test_mass_properties_match_trimesh(app, name):
+    mesh = _meshes()[name]
+
+    area, volume, center, inertia = app._mesh_mass_properties(mesh.vertices, mesh.faces)
+
+    assert area == pytest.approx(mesh.area, rel=1e-9)
+    assert volume == pytest.approx(mesh.volume, rel=1e-9)
+    np.testing.assert_allclose(center, mesh.center_mass, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(inertia, mesh.moment_inertia, rtol=1e-9, atol=1e-6 * np.abs(mesh.moment_inertia).max())
+
+
+@pytest.mark.parametrize("name", sorted(_meshes()))
+def test_mesh_integral_kernel_matches_numpy(app, name):
+    mesh = _meshes()[name]
+    vertices = np.ascontiguousarray(mesh.vertices, dtype=np.float64)
+    faces = np.ascontiguousarray(mesh.faces, dtype=np.int64)
+
+    np.testing.assert_allclose(app._mesh_integrals_kernel(vertices, faces),
+                               app._mesh_integrals_numpy(vertices, faces), rtol=1e-9, atol=1e-9)
+
+
+def test_bounding_box_kernel_matches_numpy_with_nan(app):
+    # 含NaN的轴两种实现都应返回NaN，其余轴与 NumPy 归约一致
+    vertices = np.random.default_rng(3).uniform(-500, 500, size=(5000, 3))
+    vertices[1234, 1] = np.nan
+
+    np.testing.assert_array_equal(app._bounding_box_kernel(vertices), app._bounding_box_numpy(vertices))
+    assert np.isnan(app._bounding_box_numpy(vertices)[:, 1]).all()
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+pytest.importorskip("scipy.spatial")
+
+
+def _reference_parallel_path(vertices, angle, spacing):
+    """逐点暴力搜索的平行线路径（原始实现），作为批量查询版本的基准"""
+    vertices = np.asarray(vertices, dtype=float)
+    min_coords = vertices.min(axis=0)
+    max_coords = vertices.max(axis=0)
+    if angle == 0:
+        row_axis, col_axis, direction = 1, 0, 'x'
+    else:
+        row_axis, col_axis, direction = 0, 1, 'y'
+
+    paths = []
+    for r in np.arange(min_coords[row_axis], max_coords[row_axis], spacing):
+        line_points = []
+        for c in np.arange(min_coords[col_axis], max_coords[col_axis], spacing):
+            point = [0.0, 0.0]
+            point[row_axis], point[col_axis] = r, c
+            distances = np.sqrt((vertices[:, 0] - point[0]) ** 2 + (vertices[:, 1] - point[1]) ** 2)
+            closest_idx = np.argmin(distances)
+            if distances[closest_idx] < spacing:
+                line_points.append(vertices[closest_idx].tolist())
+        if line_points:
+            paths.append({'points': line_points, 'direction': direction})
+    return paths
+
+
+@pytest.mark.parametrize("angle", [0, 90])
+def test_parallel_path_on_box_matches_reference(app, angle):
+    mesh = trimesh.creation.box(extents=(100, 80, 10))
+    planner = app.AdvancedPathPlanner(mesh)
+    spacing = planner.tool_radius * 0.7
+
+    paths = planner.generate_parallel_path(angle)
+
+    assert paths == _reference_parallel_path(mesh.vertices, angle, spacing)
+    # 扫描线不能出现重复点或只剩单点的边界线
+    for path in paths:
+        assert len(path['points']) > 1
+        assert len({tuple(p) for p in path['points']}) == len(path['points'])
+
+
+@pytest.mark.parametrize("angle", [0, 90])
+def test_parallel_path_on_sphere_keeps_tie_break(app, angle):
+    # 球面上下半球的顶点 XY 重合，距离并列时应与逐点 argmin 一样取下标最小的顶点
+    mesh = trimesh.creation.icosphere(subdivisions=3, radius=50)
+    planner = app.AdvancedPathPlanner(mesh)
+    spacing = planner.tool_radius * 0.7
+
+    assert planner.generate_parallel_path(angle) == _reference_parallel_path(mesh.vertices, angle, spacing)
+
+
+def test_parallel_path_with_stacked_vertices_matches_reference(app):
+    # 同一 XY 上叠放的顶点多于候选数时退回全量比较
+    rng = np.random.default_rng(0)
+    xy = rng.random((30, 2)) * 40
+    vertices = np.vstack([np.c_[xy, np.full(len(xy), z)] for z in rng.permutation(12)])
+    vertices = vertices[rng.permutation(len(vertices))]
+    mesh = trimesh.Trimesh(vertices=vertices, faces=np.zeros((0, 3), dtype=int), process=False)
+    planner = app.AdvancedPathPlanner(mesh)
+
+    for angle in (0, 90):
+        assert planner.generate_parallel_path(angle, 4.0) == _reference_parallel_path(vertices, angle, 4.0)
+
+
+def _reference_optimize_path_length(points):
+    """逐点扫描的最近邻路径排序（原始实现）：距离并列时取下标最小的点"""
+    if len(points) <= 2:
+        return points
+    current_idx = 0
+    visited = [False] * len(points)
+    visited[current_idx] = True
+    optimized_path = [points[current_idx]]
+    for _ in range(len(points) - 1):
+        min_dist = float('inf')
+        next_idx = -1
+        for i, point in enumerate(points):
+            if not visited[i]:
+                dist = np.linalg.norm(points[current_idx] - point)
+                if dist < min_dist:
+                    min_dist = dist
+                    next_idx = i
+        visited[next_idx] = True
+        optimized_path.append(points[next_idx])
+        current_idx = next_idx
+    return np.array(optimized_path)
+
+
+@pytest.mark.parametrize("layout", ["random", "grid", "shuffled_grid", "duplicates"])
+def test_optimize_path_length_matches_reference(app, layout):
+    rng = np.random.default_rng(5)
+    grid = np.array([[x, y, 0.0] for x in range(12) for y in range(12)]) * 2.5
+    points = {
+        'random': rng.random((300, 3)) * 100,
+        'grid': grid,  # 大量等距近邻，检验并列时的取点顺序
+        'shuffled_grid': grid[rng.permutation(len(grid))],
+        'duplicates': np.repeat(rng.random((40, 3)), 3, axis=0)[rng.permutation(120)],
+    }[layout]
+
+    optimized = app.PolishingMathematicalModel.optimize_path_length(points)
+
+    np.testing.assert_array_equal(optimized, _reference_optimize_path_length(points))
@@ -0,0 +1,147 @@
+import re
+
+import numpy as np
+import pytest
+
+
+def _path(start, count=3):
+    return {'points': [{'position': [start + i, 2.0 * i, 100.0], 'orientation': [1.0, 0.0, 0.0, 0.0]}
+                       for i in range(count)]}
+
+
+def _target_names(text):
+    return re.findall(r'CONST robtarget (\w+) :=', text)
+
+
+@pytest.fixture
+def generator(app):
+    return app.IndustrialRAPIDGenerator()
+
+
+def test_target_points_with_only_empty_paths(generator):
+    text = generator._generate_target_points({'paths': {'rough': [{'points': []}]}})
+
+    assert text == "\n! Rough抛光目标点"
+
+
+def test_target_points_keep_original_path_index(generator):
+    # 空路径不进入缓冲，但点名仍按原列表下标编号
+    paths = {'rough': [{'points': []}, _path(0), {'points': []}, _path(10)]}
+
+    names = _target_names(generator._generate_target_points({'paths': paths}))
+
+    assert names == ['P_R01_000', 'P_R01_001', 'P_R01_002', 'P_R03_000', 'P_R03_001', 'P_R03_002']
+
+
+def test_target_points_limit_counts_original_paths(generator):
+    # 只取原列表前5条路径（空路径也占名额）
+    paths = {'fine': [{'points': []}] * 4 + [_path(0), _path(10)]}
+
+    names = _target_names(generator._generate_target_points({'paths': paths}))
+
+    assert names == ['P_F04_000', 'P_F04_001', 'P_F04_002']
+
+
+def test_procedure_keeps_original_path_index(generator):
+    data = {'paths': {'rough': [{'points': []}, _path(0)]}}
+
+    procedure = generator._generate_polishing_procedure('rough', data)
+
+    assert '! 路径 2' in procedure
+    assert 'P_LeadIn_R01' in procedure
+    assert 'P_R01_000' in procedure
+    assert 'P_R00_' not in procedure
+
+
+def test_target_coordinates_are_formatted_from_float64(generator):
+    # 数千毫米量级的随机坐标：输出须与 float64 直接格式化一致（float32 会改变舍入边界处的末位）
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(-3000, 3000, size=(5, 10, 3))
+    orientations = rng.normal(size=(5, 10, 4))
+    orientations /= np.linalg.norm(orientations, axis=2, keepdims=True)
+    paths = {'rough': [{'points': [{'position': p.tolist(), 'orientation': q.tolist()} for p, q in zip(ps, qs)]}
+                       for ps, qs in zip(positions, orientations)]}
+
+    text = generator._generate_target_points({'paths': paths})
+
+    expected = [("[%.3f, %.3f, %.3f]" % tuple(p), "[%.6f, %.6f, %.6f, %.6f]" % tuple(q))
+                for p, q in zip(positions.reshape(-1, 3), orientations.reshape(-1, 4))]
+    actual = re.findall(r'(\[[-\d.]+, [-\d.]+, [-\d.]+\]),\n\s+(\[[-\d.]+, [-\d.]+, [-\d.]+, [-\d.]+\])', text)
+    assert actual == expected
+
+
+_BLANK_AFTER_KEYWORDS = ['PROC ', 'ENDPROC', 'MoveJ ', 'MoveL ', 'TPWrite', 'IF ', 'WHILE', 'FOR ', 'ENDFOR']
+
+
+def _reference_format_program(program):
+    """逐行处理的 _format_program（原始实现），作为整段正则替换版本的基准"""
+    formatted_lines = []
+    for line in program.split('\n'):
+        formatted_lines.append(line)
+        if any(keyword in line for keyword in _BLANK_AFTER_KEYWORDS):
+            if not line.strip().startswith('!'):
+                formatted_lines.append('')
+    return '\n'.join(formatted_lines)
+
+
+def _reference_robtarget(generator, name, position, orientation):
+    """逐点 str.format 的 robtarget 定义（原始实现）"""
+    return generator.RAPID_TEMPLATES['robtarget'].format(
+        point_name=name, x=position[0], y=position[1], z=position[2],
+        q1=orientation[0], q2=orientation[1], q3=orientation[2], q4=orientation[3])
+
+
+def test_format_program_matches_line_based_reference(generator):
+    program = generator.generate_complete_program({'paths': {'rough': [_path(0, 12)], 'fine': [_path(5, 8)]},
+                                                   'enable_advanced_features': True,
+                                                   'include_measurement': True})
+    edge_cases = "\n".join([
+        "", "PROC a()", "  ! MoveL 注释里的关键字", "\t!TPWrite", "    MoveL p1, v, z, t;",
+        "IF x THEN", "ENDIF", "FOR i FROM 1 TO 3 DO", "ENDFOR", "WHILE TRUE DO", "x MoveJ \r",
+        "ENDPROC", "!PROC", "MoveJ", "",
+    ])
+
+    for text in (program, edge_cases):
+        assert generator._format_program(text) == _reference_format_program(text)
+
+
+def test_format_robtargets_matches_str_format(generator):
+    rng = np.random.default_rng(4)
+    positions = rng.uniform(-2500, 2500, size=(40, 3))
+    positions[:5] = [[0.0005, -0.0005, 1e-9], [-0.0, 0.0, 2.5], [1234.5675, -1234.5675, 0.125],
+                     [999.9995, -999.9995, 0.0], [1e6, -1e6, 3.0]]
+    orientations = rng.normal(size=(40, 4))
+    names = [f'P_T{i:02d}_{i:03d}' for i in range(40)]
+
+    lines = generator._format_robtargets(np.array(names), positions, orientations)
+
+    assert lines == [_reference_robtarget(generator, n, p, q) for n, p, q in zip(names, positions, orientations)]
+    assert generator._format_robtargets(np.array([], dtype=str), np.empty((0, 3)), np.empty((0, 4))) == []
+
+
+def test_target_point_names_match_original_scheme(generator):
+    # 点名 = 阶段首字母 + 两位路径下标 + 三位点序号，每条路径最多10个点、每阶段最多5条路径
+    paths = {'rough': [_path(i, 12) for i in range(7)], 'fine': [_path(0, 3)]}
+
+    names = _target_names(generator._generate_target_points({'paths': paths}))
+
+    expected = ([f'P_R{p:02d}_{i:03d}' for p in range(5) for i in range(10)] +
+                [f'P_F00_{i:03d}' for i in range(3)])
+    assert names == expected
+
+
+def test_main_program_cache_follows_switches(generator):
+    switches = ['include_rough', 'include_cleaning', 'enable_advanced_features', 'enable_force_control',
+                'enable_motion_optimization', 'include_fine', 'include_measurement']
+    for mask in range(1 << len(switches)):
+        data = {name: bool(mask >> bit & 1) for bit, name in enumerate(switches)}
+        program = generator._generate_main_program(data)
+        # 缓存结果与不经缓存直接生成的一致，且重复调用返回同一对象
+        assert program == type(generator)._build_main_program.__wrapped__(type(generator), *data.values())
+        assert generator._generate_main_program(dict(data)) is program
+
+    # 缺省开关与显式传入默认值结果相同
+    defaults = {'include_rough': True, 'include_cleaning': False, 'enable_advanced_features': False,
+                'enable_force_control': True, 'enable_motion_optimization': True, 'include_fine': True,
+                'include_measurement': False}
+    assert generator._generate_main_program({}) == generator._generate_main_program(defaults)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+trimesh = pytest.importorskip("trimesh")
+
+
+def test_to_indexed_rebuilds_the_triangle_soup(app):
+    mesh = trimesh.creation.icosphere(subdivisions=2, radius=30)
+    soup = mesh.vertices[mesh.faces].reshape(-1, 3)
+
+    vertices, faces = app.NXSTLProcessor.to_indexed(soup)
+
+    # 面片还原后与原三角形汤逐点一致，顶点不重复
+    np.testing.assert_array_equal(vertices[faces].reshape(-1, 3), soup)
+    assert len(vertices) == len(np.unique(soup, axis=0)) == len(mesh.vertices)
+
+
+def test_to_indexed_keeps_first_occurrence_order_and_merges_signed_zero(app):
+    soup = np.array([[1.0, 2.0, 3.0], [0.0, 0.0, 0.0], [4.0, 5.0, 6.0],
+                     [4.0, 5.0, 6.0], [-0.0, 0.0, -0.0], [7.0, 8.0, 9.0]])
+
+    vertices, faces = app.NXSTLProcessor.to_indexed(soup)
+
+    np.testing.assert_array_equal(vertices, [[1, 2, 3], [0, 0, 0], [4, 5, 6], [7, 8, 9]])
+    np.testing.assert_array_equal(faces, [[0, 1, 2], [2, 1, 3]])
+    assert not np.signbit(vertices).any()
+
+
+def test_binary_stl_loads_same_geometry_as_trimesh(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(app.AppConfig, "CACHE_DIR", tmp_path / "cache")
+    source = trimesh.creation.annulus(r_min=10, r_max=25, height=8)
+    stl = tmp_path / "part.stl"
+    source.export(stl)
+
+    loaded = app.NXSTLProcessor.load_stl_with_metadata(str(stl))
+    reference = trimesh.load(stl)
+
+    assert len(loaded.vertices) == len(reference.vertices)
+    assert len(loaded.faces) == len(reference.faces)
+    assert loaded.area == pytest.approx(reference.area)
+    assert loaded.volume == pytest.approx(reference.volume)